@@ -2,7 +2,9 @@
 
 import json
 import time
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -18,6 +20,8 @@ from ytrix.api import (
     _is_retryable_error,
     _parse_upload_date,
     add_video_to_playlist,
+    batch_add_videos,
+    batch_remove_playlist_items,
     batch_video_metadata,
     classify_error,
     create_playlist,
@@ -25,6 +29,7 @@ from ytrix.api import (
     get_playlist_items,
     get_playlist_videos,
     get_playlist_with_videos,
+    get_playlists_by_id,
     get_throttle_delay,
     get_youtube_client,
     list_my_playlists,
@@ -34,6 +39,9 @@ from ytrix.api import (
     update_playlist,
     update_playlist_item_position,
 )
+from ytrix.models import Playlist
+
+from .conftest import make_http_error
 
 
 @pytest.fixture
@@ -114,6 +122,113 @@ class TestAddVideoToPlaylist:
         assert result == "item123"
 
 
+class _FakeBatch:
+    """BatchHttpRequest stand-in that answers sub-requests in reverse order."""
+
+    def __init__(self, callback, errors: dict[str, HttpError]) -> None:
+        self._callback = callback
+        self._errors = errors
+        self.requests: list[tuple[str, str]] = []
+
+    def add(self, request: MagicMock, request_id: str) -> None:
+        self.requests.append((request_id, request.key))
+
+    def execute(self) -> None:
+        for request_id, key in reversed(self.requests):
+            error = self._errors.get(key)
+            self._callback(request_id, None if error else {"id": "item"}, error)
+
+
+@pytest.fixture
+def batches(mock_client: MagicMock) -> Iterator[list[_FakeBatch]]:
+    """Record the batches created by the client; errors are set per test.
+
+    Inserts are keyed by video ID and deletes by playlistItem ID.
+    """
+    created: list[_FakeBatch] = []
+    mock_client.errors = {}
+
+    def new_batch(callback):
+        created.append(_FakeBatch(callback, mock_client.errors))
+        return created[-1]
+
+    mock_client.new_batch_http_request.side_effect = new_batch
+    mock_client.playlistItems().insert.side_effect = lambda part, body: MagicMock(
+        key=body["snippet"]["resourceId"]["videoId"]
+    )
+    mock_client.playlistItems().delete.side_effect = lambda id: MagicMock(key=id)
+    with patch("ytrix.api._throttler.wait"), patch("ytrix.api.record_quota"):
+        yield created
+
+
+class TestBatchAddVideos:
+    """Tests for batch_add_videos function."""
+
+    def test_sends_fifty_inserts_per_batch(
+        self, mock_client: MagicMock, batches: list[_FakeBatch]
+    ) -> None:
+        """120 inserts need three HTTP requests; results come back in input order."""
+        video_ids = [f"v{i}" for i in range(120)]
+
+        added, failed = batch_add_videos(mock_client, "PL1", video_ids)
+
+        assert [len(b.requests) for b in batches] == [50, 50, 20]
+        assert added == video_ids
+        assert failed == {}
+
+    def test_failures_are_returned_and_retryable_ones_retried(
+        self, mock_client: MagicMock, batches: list[_FakeBatch]
+    ) -> None:
+        """Item errors are reported; 5xx sub-requests fall back to a single insert."""
+        mock_client.errors.update(
+            {"v1": make_http_error(404, "videoNotFound"), "v2": make_http_error(503, "backend")}
+        )
+
+        with patch("ytrix.api.add_video_to_playlist") as mock_add:
+            added, failed = batch_add_videos(mock_client, "PL1", ["v0", "v1", "v2", "v3"])
+
+        mock_add.assert_called_once_with(mock_client, "PL1", "v2")
+        assert added == ["v0", "v2", "v3"]
+        assert list(failed) == ["v1"]
+        assert failed["v1"].resp.status == 404
+
+    def test_quota_exceeded_stops_after_batch(
+        self, mock_client: MagicMock, batches: list[_FakeBatch]
+    ) -> None:
+        """quotaExceeded is raised once the batch finishes; later batches are not sent."""
+        mock_client.errors["v3"] = make_http_error(403, "quotaExceeded")
+
+        with pytest.raises(HttpError) as exc_info:
+            batch_add_videos(mock_client, "PL1", [f"v{i}" for i in range(60)])
+
+        assert _is_quota_exceeded(exc_info.value)
+        assert len(batches) == 1
+
+
+class TestBatchRemovePlaylistItems:
+    """Tests for batch_remove_playlist_items function."""
+
+    def test_deletes_in_batches_and_retries_retryable_failures(
+        self, mock_client: MagicMock, batches: list[_FakeBatch]
+    ) -> None:
+        """Deletes go 50 per batch; 5xx failures fall back to a single delete."""
+        item_ids = [f"item{i}" for i in range(60)]
+        mock_client.errors.update(
+            {
+                "item1": make_http_error(404, "playlistItemNotFound"),
+                "item2": make_http_error(503, "backend"),
+            }
+        )
+
+        with patch("ytrix.api.remove_video_from_playlist") as mock_remove:
+            removed, failed = batch_remove_playlist_items(mock_client, item_ids)
+
+        assert [len(b.requests) for b in batches] == [50, 10]
+        mock_remove.assert_called_once_with(mock_client, "item2")
+        assert removed == [i for i in item_ids if i != "item1"]
+        assert list(failed) == ["item1"]
+
+
 class TestRemoveVideoFromPlaylist:
     """Tests for remove_video_from_playlist function."""
 
@@ -364,6 +479,63 @@ class TestGetPlaylistWithVideos:
         with pytest.raises(ValueError, match="Playlist not found"):
             get_playlist_with_videos(mock_client, "PLbad")
 
+    def test_prefetched_metadata_skips_playlists_list(self, mock_client: MagicMock) -> None:
+        """With metadata given, only the playlist items are requested."""
+        mock_client.playlistItems.return_value.list.return_value.execute.return_value = {
+            "items": [{"id": "item1", "snippet": {"resourceId": {"videoId": "vid1"}}}]
+        }
+        metadata = Playlist(id="PL123", title="My Playlist")
+
+        result = get_playlist_with_videos(mock_client, "PL123", metadata=metadata)
+
+        assert result.title == "My Playlist"
+        assert [v.id for v in result.videos] == ["vid1"]
+        mock_client.playlists.assert_not_called()
+
+
+class TestGetPlaylistsById:
+    """Tests for get_playlists_by_id function."""
+
+    def test_chunks_ids_and_skips_missing(self, mock_client: MagicMock) -> None:
+        """Requests 50 IDs per call; playlists the API doesn't return are absent."""
+        ids = [f"PL{i}" for i in range(60)]
+
+        def item(pid: str) -> dict[str, Any]:
+            return {"id": pid, "snippet": {"title": pid}, "status": {"privacyStatus": "public"}}
+
+        mock_client.playlists.return_value.list.return_value.execute.side_effect = [
+            {"items": [item(pid) for pid in ids[:50]]},
+            {"items": [item(pid) for pid in ids[50:59]]},
+        ]
+
+        with patch("ytrix.api.record_quota") as record_quota:
+            result = get_playlists_by_id(mock_client, ids)
+
+        assert list(result) == ids[:59]
+        assert result["PL3"].title == "PL3"
+        list_mock = mock_client.playlists.return_value.list
+        assert [c.kwargs["id"] for c in list_mock.call_args_list] == [
+            ",".join(ids[:50]),
+            ",".join(ids[50:]),
+        ]
+        assert record_quota.call_count == 2
+
+    def test_retries_transient_errors(self, mock_client: MagicMock) -> None:
+        """A 5xx from playlists.list is retried like the other API helpers."""
+        item = {"id": "PL1", "snippet": {"title": "T"}, "status": {"privacyStatus": "public"}}
+        mock_client.playlists.return_value.list.return_value.execute.side_effect = [
+            make_http_error(503, "backendError"),
+            {"items": [item]},
+        ]
+
+        with (
+            patch("ytrix.api.record_quota"),
+            patch.object(get_playlists_by_id.retry, "sleep"),  # type: ignore[attr-defined]
+        ):
+            result = get_playlists_by_id(mock_client, ["PL1"])
+
+        assert list(result) == ["PL1"]
+
 
 class TestUpdatePlaylistItemPosition:
     """Tests for update_playlist_item_position function."""
@@ -779,12 +951,31 @@ class TestGetYoutubeClient:
 
         with (
             patch("ytrix.api.get_credentials", return_value=mock_creds),
-            patch("ytrix.api.build", return_value=mock_client) as mock_build,
+            patch("ytrix.api.build_youtube", return_value=mock_client) as mock_build,
         ):
             result = get_youtube_client(config)
-            mock_build.assert_called_once_with("youtube", "v3", credentials=mock_creds)
+            mock_build.assert_called_once_with(credentials=mock_creds)
             assert result is mock_client
 
+    def test_discovery_document_parsed_once(self) -> None:
+        """Clients share one parsed discovery document and still expose the API."""
+        from googleapiclient import discovery_cache
+
+        from ytrix.api import _youtube_discovery, build_youtube
+
+        _youtube_discovery.cache_clear()
+        with patch(
+            "googleapiclient.discovery_cache.get_static_doc", wraps=discovery_cache.get_static_doc
+        ) as mock_doc:
+            first = build_youtube(developerKey="k")
+            second = build_youtube(developerKey="k")
+        mock_doc.assert_called_once_with("youtube", "v3")
+        for client in (first, second):
+            request = client.playlistItems().insert(
+                part="snippet", body={"snippet": {"playlistId": "PL1"}}
+            )
+            assert request.method == "POST"
+
 
 class TestReorderPositionLogic:
     """Tests for reorder_playlist_videos position shifting logic."""
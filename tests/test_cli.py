@@ -1,13 +1,16 @@
 """Smoke tests for ytrix CLI commands."""
 
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from ytrix import __version__
+from ytrix import __version__, yaml_ops
 from ytrix.__main__ import YtrixCLI
+from ytrix.api import PlaylistItem
+from ytrix.dedup import MatchResult, MatchType
 from ytrix.models import Playlist, Video
 
 
@@ -115,6 +118,54 @@ class TestCLICommands:
 
         assert callable(main), "main() should be callable"
 
+    @pytest.mark.parametrize("arg", ["version", "help", "--help", "-h"])
+    def test_main_fast_path_skips_fire(self, arg: str, capsys: Any) -> None:
+        """Trivial commands are answered without fire or YtrixCLI construction."""
+        from ytrix.__main__ import main
+
+        with (
+            patch("sys.argv", ["ytrix", arg]),
+            patch("fire.Fire") as mock_fire,
+            patch("ytrix.__main__.YtrixCLI") as mock_cli,
+        ):
+            main()
+        mock_fire.assert_not_called()
+        mock_cli.assert_not_called()
+        out = capsys.readouterr().out
+        assert (__version__ in out) if arg == "version" else ("plist2mlist" in out)
+
+    def test_main_delegates_other_commands_to_fire(self) -> None:
+        """Anything beyond the fast-path commands goes through fire."""
+        from ytrix.__main__ import main
+
+        with patch("sys.argv", ["ytrix", "--json-output", "version"]), patch("fire.Fire") as mock:
+            main()
+        mock.assert_called_once_with(YtrixCLI)
+
+    def test_cli_import_defers_heavy_dependencies(self) -> None:
+        """Importing the CLI module doesn't load googleapiclient or yt-dlp."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, ytrix.__main__; "
+            "print(sorted(m for m in ('googleapiclient.discovery', 'yt_dlp') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.stdout.strip() == "[]"
+
+    def test_cli_import_defers_command_specific_modules(self) -> None:
+        """PyYAML, sqlite3 and rich tables/progress load only when a command needs them."""
+        import subprocess
+        import sys
+
+        modules = ("yaml", "sqlite3", "rich.progress", "rich.table")
+        code = (
+            f"import sys, ytrix.__main__; print(sorted(m for m in {modules!r} if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.stdout.strip() == "[]"
+
 
 @pytest.fixture
 def mock_config():
@@ -146,6 +197,14 @@ def cli_json():
         return YtrixCLI(verbose=False, json_output=True)
 
 
+@pytest.fixture(autouse=True)
+def export_index_dir(tmp_path: Path) -> Iterator[Path]:
+    """Keep the YAML export index out of the real config dir."""
+    export_dir = tmp_path / "exports"
+    with patch("ytrix.yaml_ops.get_config_dir", return_value=export_dir):
+        yield export_dir
+
+
 class TestThrottleFlag:
     """Tests for --throttle CLI flag."""
 
@@ -156,7 +215,7 @@ class TestThrottleFlag:
         original = api.get_throttle_delay()
         try:
             with patch("ytrix.__main__.configure_logging"):
-                YtrixCLI(verbose=False)
+                YtrixCLI(verbose=False)._apply_throttle()
             # Should have set to default 200
             assert api.get_throttle_delay() == 200
         finally:
@@ -169,7 +228,7 @@ class TestThrottleFlag:
         original = api.get_throttle_delay()
         try:
             with patch("ytrix.__main__.configure_logging"):
-                YtrixCLI(verbose=False, throttle=500)
+                YtrixCLI(verbose=False, throttle=500)._apply_throttle()
             assert api.get_throttle_delay() == 500
         finally:
             api.set_throttle_delay(original)
@@ -181,12 +240,34 @@ class TestThrottleFlag:
         original = api.get_throttle_delay()
         try:
             with patch("ytrix.__main__.configure_logging"):
-                YtrixCLI(verbose=False, throttle=0)
+                YtrixCLI(verbose=False, throttle=0)._apply_throttle()
             assert api.get_throttle_delay() == 0
         finally:
             api.set_throttle_delay(original)
 
 
+class TestProgress:
+    """Tests for YtrixCLI._progress()."""
+
+    @pytest.mark.parametrize(
+        ("json_output", "quiet", "total", "disabled"),
+        [
+            (False, False, None, False),
+            (False, False, 20, False),
+            (False, False, 19, True),
+            (True, False, 100, True),
+            (False, True, 100, True),
+        ],
+    )
+    def test_hidden_for_json_quiet_and_short_runs(
+        self, json_output: bool, quiet: bool, total: int | None, disabled: bool
+    ) -> None:
+        """Only long enough, human-facing runs draw a live progress bar."""
+        with patch("ytrix.__main__.configure_logging"):
+            cli = YtrixCLI(json_output=json_output, quiet=quiet)
+        assert cli._progress(total).disable is disabled
+
+
 class TestVersion:
     """Tests for version command."""
 
@@ -206,6 +287,146 @@ class TestVersion:
         assert parsed["version"] == __version__
 
 
+class TestJsonOutput:
+    """Tests for _output JSON encoding."""
+
+    def test_output_round_trips(self, cli_json: YtrixCLI, capsys: Any) -> None:
+        """JSON output parses back to the original data, including non-ASCII text."""
+        import json as json_mod
+
+        data = {"title": "Zażółć", "count": 2, "items": [{"id": "v1"}]}
+        assert cli_json._output(data) == data
+        assert json_mod.loads(capsys.readouterr().out) == data
+
+    def test_output_falls_back_to_stdlib_json(self, cli_json: YtrixCLI, capsys: Any) -> None:
+        """Without orjson, output uses stdlib json with the same content."""
+        import json as json_mod
+
+        with patch("ytrix.__main__.orjson", None):
+            cli_json._output({"version": "1.0"})
+        assert json_mod.loads(capsys.readouterr().out) == {"version": "1.0"}
+
+    def test_output_bytes_match_without_orjson(self, cli_json: YtrixCLI, capsysbinary: Any) -> None:
+        """The stdlib fallback writes byte-for-byte the same document as orjson."""
+        pytest.importorskip("orjson")
+        data = {"title": "Zażółć", "n": [1, 2], "nested": {"a": None, "ok": True}}
+        cli_json._output(data)
+        with_orjson = capsysbinary.readouterr().out
+        with patch("ytrix.__main__.orjson", None):
+            cli_json._output(data)
+        assert capsysbinary.readouterr().out == with_orjson
+
+    @pytest.mark.parametrize("fast", [True, False])
+    @pytest.mark.parametrize("tty", [True, False])
+    def test_output_compact_when_piped(
+        self, cli_json: YtrixCLI, capsysbinary: Any, fast: bool, tty: bool
+    ) -> None:
+        """Piped output is one compact line; a terminal gets indented JSON."""
+        orjson = pytest.importorskip("orjson") if fast else None
+        data = {"count": 1, "playlists": [{"id": "PL1"}]}
+        with (
+            patch("sys.stdout.isatty", return_value=tty),
+            patch("ytrix.__main__.orjson", orjson),
+        ):
+            cli_json._output(data)
+        out = capsysbinary.readouterr().out
+        expected = b'{\n  "count": 1,' if tty else b'{"count":1,"playlists":[{"id":"PL1"}]}\n'
+        assert out.startswith(expected)
+
+    def test_output_to_text_only_stdout(self, cli_json: YtrixCLI) -> None:
+        """A stdout without a byte buffer (e.g. StringIO) still receives the JSON."""
+        import json as json_mod
+        from io import StringIO
+
+        out = StringIO()
+        with patch("sys.stdout", out):
+            cli_json._output({"version": "1.0"})
+        assert json_mod.loads(out.getvalue()) == {"version": "1.0"}
+
+
+class TestTosReminder:
+    """Tests for the once-per-version ToS reminder."""
+
+    def test_shown_once_per_version(self, cli: YtrixCLI, tmp_path: Path) -> None:
+        """Reminder is shown once, then a version-named marker suppresses it."""
+        from ytrix.__main__ import _TOS_MARKER
+
+        (tmp_path / ".last_version").write_text("0.0.1")
+        with (
+            patch("ytrix.__main__.get_config_dir", return_value=tmp_path),
+            patch("sys.stdout.isatty", return_value=True),
+            patch.object(cli, "_show_tos_reminder") as mock_show,
+        ):
+            cli._check_tos_reminder()
+            assert cli._tos_writer is not None
+            cli._tos_writer.join(timeout=5)
+            cli._check_tos_reminder()
+        mock_show.assert_called_once()
+        assert [p.name for p in tmp_path.iterdir()] == [_TOS_MARKER]
+
+    def test_skipped_when_stdout_not_tty(self, cli: YtrixCLI, tmp_path: Path) -> None:
+        """Piped output never shows the reminder or writes the marker."""
+        with (
+            patch("ytrix.__main__.get_config_dir", return_value=tmp_path),
+            patch("sys.stdout.isatty", return_value=False),
+            patch.object(cli, "_show_tos_reminder") as mock_show,
+        ):
+            cli._check_tos_reminder()
+        mock_show.assert_not_called()
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.parametrize("isatty", [True, False])
+    def test_tty_gate_controls_rendering(self, cli: YtrixCLI, tmp_path: Path, isatty: bool) -> None:
+        """The stdout TTY check in _check_tos_reminder is the only gate on the text."""
+        from io import StringIO
+
+        from rich.console import Console
+
+        out = StringIO()
+        with (
+            patch("ytrix.__main__.get_config_dir", return_value=tmp_path),
+            patch("sys.stdout.isatty", return_value=isatty),
+            patch("ytrix.__main__.console", Console(file=out, force_terminal=False)),
+        ):
+            cli._check_tos_reminder()
+            if cli._tos_writer is not None:
+                cli._tos_writer.join(timeout=5)
+        assert ("Multi-Project ToS Reminder" in out.getvalue()) is isatty
+
+
+class TestLoadConfigMemo:
+    """Tests for per-invocation config caching."""
+
+    def test_load_config_called_once(self, cli: YtrixCLI, mock_config) -> None:
+        """Repeated _load_config calls reuse the first parsed config."""
+        with patch("ytrix.__main__.load_config", return_value=mock_config) as mock_load:
+            assert cli._load_config() is mock_config
+            assert cli._load_config() is mock_config
+        mock_load.assert_called_once()
+
+    def test_load_config_error_not_cached(self, cli: YtrixCLI, mock_config) -> None:
+        """A missing config is retried on the next call."""
+        with (
+            patch("ytrix.__main__.load_config", side_effect=FileNotFoundError),
+            pytest.raises(FileNotFoundError),
+        ):
+            cli._load_config()
+        with patch("ytrix.__main__.load_config", return_value=mock_config):
+            assert cli._load_config() is mock_config
+
+    def test_legacy_client_built_once(self, cli: YtrixCLI, mock_config) -> None:
+        """A single-project config builds its API client once per CLI invocation."""
+        mock_config.is_multi_project = False
+        with (
+            patch("ytrix.__main__.get_project_manager"),
+            patch("ytrix.__main__.api.get_youtube_client") as mock_get_client,
+        ):
+            first = cli._get_youtube_client(mock_config)
+            second = cli._get_youtube_client(mock_config)
+        assert first is second
+        mock_get_client.assert_called_once_with(mock_config)
+
+
 class TestConfig:
     """Tests for config command."""
 
@@ -227,6 +448,30 @@ class TestConfig:
         assert "Config file not found" in captured.out
         assert "Setup guide:" in captured.out
 
+    def test_config_streams_setup_guide(self, cli: YtrixCLI, capsysbinary, tmp_path: Path) -> None:
+        """Bundled SETUP.txt is written verbatim after the setup guide header."""
+        from importlib import resources
+
+        setup_bytes = resources.files("ytrix").joinpath("SETUP.txt").read_bytes()
+        with patch("ytrix.__main__.get_config_dir", return_value=tmp_path):
+            cli.config()
+        out = capsysbinary.readouterr().out
+        assert out.index(b"Setup guide:") < out.index(setup_bytes)
+
+    def test_config_setup_guide_to_text_only_stdout(self, cli: YtrixCLI, tmp_path: Path) -> None:
+        """A stdout without a byte buffer (e.g. StringIO) still receives SETUP.txt."""
+        from importlib import resources
+        from io import StringIO
+
+        setup_text = resources.files("ytrix").joinpath("SETUP.txt").read_text()
+        out = StringIO()
+        with (
+            patch("ytrix.__main__.get_config_dir", return_value=tmp_path),
+            patch("sys.stdout", out),
+        ):
+            cli.config()
+        assert setup_text in out.getvalue()
+
     def test_config_shows_content_when_exists(self, cli: YtrixCLI, capsys, tmp_path: Path) -> None:
         """Config command shows content when config exists."""
         config_file = tmp_path / "config.toml"
@@ -512,6 +757,89 @@ class TestPlist2mlist:
         assert result is None
 
 
+class TestAddVideos:
+    """Tests for the shared in-order video insert loop."""
+
+    def test_adds_in_order_and_collects_skips(self, cli_json: YtrixCLI) -> None:
+        """Videos are inserted in playlist order; rejected ones are reported, not raised."""
+        videos = [Video(id=f"v{i}", title=f"Video {i}", channel="C", position=i) for i in range(3)]
+
+        def insert(client: Any, playlist_id: str, video_id: str) -> str:
+            if video_id == "v1":
+                raise RuntimeError("video unavailable")
+            return f"item-{video_id}"
+
+        with patch("ytrix.__main__.api.add_video_to_playlist", side_effect=insert) as mock_add:
+            added, skipped = cli_json._add_videos(MagicMock(), "PLtarget", videos)
+
+        assert [c.args[2] for c in mock_add.call_args_list] == ["v0", "v1", "v2"]
+        assert added == 2
+        assert skipped == [{"id": "v1", "error": "video unavailable"}]
+
+    def test_skips_reported_after_inserts(self, cli: YtrixCLI) -> None:
+        """Skip messages are printed in one block once every insert has been issued."""
+        videos = [Video(id=f"v{i}", title=f"Video {i}", channel="C", position=i) for i in range(3)]
+        events: list[str] = []
+
+        def insert(client: Any, playlist_id: str, video_id: str) -> None:
+            events.append(f"insert {video_id}")
+            if video_id != "v1":
+                raise RuntimeError("gone")
+
+        with (
+            patch("ytrix.__main__.api.add_video_to_playlist", side_effect=insert),
+            patch("ytrix.__main__._print_block", side_effect=events.extend),
+        ):
+            cli._add_videos(MagicMock(), "PLtarget", videos)
+
+        assert events == [
+            "insert v0",
+            "insert v1",
+            "insert v2",
+            "[yellow]Skipped v0: gone[/yellow]",
+            "[yellow]Skipped v2: gone[/yellow]",
+        ]
+
+    def test_shared_progress_gets_one_task_per_playlist(self, cli_json: YtrixCLI) -> None:
+        """A caller-owned Progress is reused: no new display, one task per call."""
+        videos = [Video(id=f"v{i}", title=f"Video {i}", channel="C", position=i) for i in range(2)]
+        progress = MagicMock()
+
+        with (
+            patch("ytrix.__main__.api.add_video_to_playlist"),
+            patch("rich.progress.Progress") as mock_progress_cls,
+        ):
+            cli_json._add_videos(MagicMock(), "PL1", videos, progress=progress)
+            cli_json._add_videos(MagicMock(), "PL2", videos, progress=progress)
+
+        mock_progress_cls.assert_not_called()
+        assert progress.add_task.call_count == 2
+        assert progress.advance.call_count == 4
+
+    def test_http_errors_keep_status_and_reason(self, cli_json: YtrixCLI) -> None:
+        """API rejections are recorded with their HTTP status and parsed reason."""
+        from .conftest import make_http_error
+
+        videos = [Video(id="v0", title="Video 0", channel="C", position=0)]
+        error = make_http_error(404, "videoNotFound")
+
+        with patch("ytrix.__main__.api.add_video_to_playlist", side_effect=error):
+            added, skipped = cli_json._add_videos(MagicMock(), "PLtarget", videos)
+
+        assert added == 0
+        assert skipped == [{"id": "v0", "status": 404, "error": error.reason}]
+
+    def test_only_ids_filters_in_source_order(self, cli_json: YtrixCLI) -> None:
+        """With only_ids, just those videos are inserted, still in source order."""
+        videos = [Video(id=f"v{i}", title=f"Video {i}", channel="C", position=i) for i in range(4)]
+
+        with patch("ytrix.__main__.api.add_video_to_playlist") as mock_add:
+            added, skipped = cli_json._add_videos(MagicMock(), "PLtarget", videos, {"v3", "v1"})
+
+        assert [c.args[2] for c in mock_add.call_args_list] == ["v1", "v3"]
+        assert (added, skipped) == (2, [])
+
+
 class TestPlist2mlistFlags:
     """Tests for plist2mlist --title and --privacy flags."""
 
@@ -619,6 +947,156 @@ class TestPlist2mlistFlags:
         assert parsed["privacy"] == "unlisted"
 
 
+class TestPlists2mlists:
+    """Tests for plists2mlists batch planning."""
+
+    def test_dry_run_estimates_whole_batch_once(
+        self, cli_json: YtrixCLI, mock_config: MagicMock, capsys: Any, tmp_path: Path
+    ) -> None:
+        """One aggregate estimate covers all pending playlists; JSON skips the quota summary."""
+        import json as json_mod
+
+        input_file = tmp_path / "playlists.txt"
+        input_file.write_text("PLnew\nPLpart\nPLsame\n")
+        sources = {
+            pid: Playlist(
+                id=pid,
+                title=pid,
+                videos=[
+                    Video(id=f"{pid}{i}", title="V", channel="C", position=i) for i in range(n)
+                ],
+            )
+            for pid, n in [("PLnew", 3), ("PLpart", 2), ("PLsame", 4)]
+        }
+        target = Playlist(id="PLmine", title="Mine")
+        dedup_results = {
+            "PLpart": MatchResult(MatchType.PARTIAL, target_playlist=target),
+            "PLsame": MatchResult(MatchType.EXACT, target_playlist=target),
+        }
+
+        with (
+            patch("ytrix.__main__.load_config", return_value=mock_config),
+            patch("ytrix.journal.get_config_dir", return_value=tmp_path),
+            patch(
+                "ytrix.__main__.extractor.extract_playlist",
+                side_effect=lambda source, use_cache: sources[source],
+            ),
+            patch("ytrix.dedup.load_target_playlists_with_videos", return_value=[target]),
+            patch("ytrix.dedup.analyze_batch_deduplication", return_value=dedup_results),
+            patch("ytrix.__main__.get_project_manager") as mock_manager,
+        ):
+            cli_json.plists2mlists(str(input_file), dry_run=True)
+
+        parsed = json_mod.loads(capsys.readouterr().out)
+        assert parsed["quota_estimate"]["playlist_creates"] == 50  # PLnew only
+        assert parsed["quota_estimate"]["video_adds"] == (3 + 2) * 50
+        assert parsed["quota_estimate"]["playlist_updates"] == 50  # PLpart
+        mock_manager.assert_not_called()
+
+    def test_partial_update_adds_only_missing_videos(
+        self, cli_json: YtrixCLI, mock_config: MagicMock, tmp_path: Path
+    ) -> None:
+        """A partial match inserts just the videos the target lacks, in source order.
+
+        The target's videos come from the dedup scan, not a second extraction.
+        """
+        input_file = tmp_path / "playlists.txt"
+        input_file.write_text("PLpart\n")
+        videos = [Video(id=f"v{i}", title="V", channel="C", position=i) for i in range(4)]
+        source = Playlist(id="PLpart", title="Part", videos=videos)
+        target = Playlist(id="PLmine", title="Mine", videos=[videos[0], videos[2]])
+        dedup_results = {"PLpart": MatchResult(MatchType.PARTIAL, target_playlist=target)}
+        client = MagicMock()
+        mock_config.is_multi_project = False
+
+        with (
+            patch("ytrix.__main__.load_config", return_value=mock_config),
+            patch("ytrix.journal.get_config_dir", return_value=tmp_path),
+            patch.object(cli_json, "_get_youtube_client", return_value=client),
+            patch("ytrix.__main__.extractor.extract_playlist", return_value=source),
+            patch("ytrix.dedup.load_target_playlists_with_videos", return_value=[target]),
+            patch("ytrix.dedup.analyze_batch_deduplication", return_value=dedup_results),
+            patch("ytrix.__main__.extractor.get_playlist_video_ids") as mock_ids,
+            patch("ytrix.__main__.api.add_video_to_playlist_raw") as mock_add,
+            patch.object(cli_json, "_progress") as mock_progress,
+        ):
+            cli_json.plists2mlists(str(input_file))
+
+        mock_ids.assert_not_called()
+        assert [c.args for c in mock_add.call_args_list] == [
+            (client, "PLmine", "v1"),
+            (client, "PLmine", "v3"),
+        ]
+        progress = mock_progress.return_value.__enter__.return_value
+        progress.add_task.assert_called_once_with("Adding missing videos...", total=2)
+        assert progress.advance.call_count == 2
+
+    def test_partial_updates_to_one_target_see_earlier_adds(
+        self, cli_json: YtrixCLI, mock_config: MagicMock, tmp_path: Path
+    ) -> None:
+        """Videos added for one source aren't added again for the next source."""
+        input_file = tmp_path / "playlists.txt"
+        input_file.write_text("PLa\nPLb\n")
+        videos = [Video(id=f"v{i}", title="V", channel="C", position=i) for i in range(3)]
+        sources = {
+            "PLa": Playlist(id="PLa", title="A", videos=videos[:2]),
+            "PLb": Playlist(id="PLb", title="B", videos=videos),
+        }
+        target = Playlist(id="PLmine", title="Mine", videos=videos[:1])
+        dedup_results = {
+            pid: MatchResult(MatchType.PARTIAL, target_playlist=target) for pid in sources
+        }
+        client = MagicMock()
+        mock_config.is_multi_project = False
+
+        with (
+            patch("ytrix.__main__.load_config", return_value=mock_config),
+            patch("ytrix.journal.get_config_dir", return_value=tmp_path),
+            patch.object(cli_json, "_get_youtube_client", return_value=client),
+            patch(
+                "ytrix.__main__.extractor.extract_playlist",
+                side_effect=lambda source, use_cache: sources[source],
+            ),
+            patch("ytrix.dedup.load_target_playlists_with_videos", return_value=[target]),
+            patch("ytrix.dedup.analyze_batch_deduplication", return_value=dedup_results),
+            patch("ytrix.__main__.api.add_video_to_playlist_raw") as mock_add,
+            patch.object(cli_json, "_progress"),
+        ):
+            cli_json.plists2mlists(str(input_file))
+
+        assert [c.args[2] for c in mock_add.call_args_list] == ["v1", "v2"]
+
+    def test_resume_reloads_pending_sources_over_the_pool(
+        self, cli_json: YtrixCLI, mock_config: MagicMock, capsys: Any, tmp_path: Path
+    ) -> None:
+        """Resuming re-extracts only pending tasks' sources; failed reloads are dropped."""
+        import json as json_mod
+
+        from ytrix.journal import TaskStatus, create_journal, update_task
+
+        with patch("ytrix.journal.get_config_dir", return_value=tmp_path):
+            journal = create_journal([("PLdone", "Done"), ("PLa", "A"), ("PLgone", "Gone")])
+            update_task(journal, "PLdone", status=TaskStatus.COMPLETED)
+
+        def extract(source: str, use_cache: bool) -> Playlist:
+            if source == "PLgone":
+                raise RuntimeError("deleted")
+            video = Video(id="v1", title="V", channel="C", position=0)
+            return Playlist(id=source, title=source, videos=[video])
+
+        with (
+            patch("ytrix.__main__.load_config", return_value=mock_config),
+            patch("ytrix.journal.get_config_dir", return_value=tmp_path),
+            patch("ytrix.__main__.info.MAX_PARALLEL_WORKERS", 4),
+            patch("ytrix.__main__.extractor.extract_playlist", side_effect=extract) as mock_ext,
+        ):
+            cli_json.plists2mlists("unused.txt", dry_run=True, resume=True)
+
+        assert sorted(c.args[0] for c in mock_ext.call_args_list) == ["PLa", "PLgone"]
+        parsed = json_mod.loads(capsys.readouterr().out)
+        assert parsed["quota_estimate"]["video_adds"] == 50  # PLa only
+
+
 class TestPlists2mlistFlags:
     """Tests for plists2mlist --privacy flag."""
 
@@ -764,6 +1242,108 @@ class TestPlists2mlist:
         assert result is not None
         assert result["duplicates_skipped"] == 1
 
+    def test_keeps_first_occurrence_in_source_order(
+        self, cli_json: YtrixCLI, mock_config: MagicMock, tmp_path: Path
+    ) -> None:
+        """A repeated video keeps the position of its first appearance."""
+        input_file = tmp_path / "playlists.txt"
+        input_file.write_text("PLlist1\nPLlist2\n")
+
+        def playlist(pid: str, ids: list[str]) -> Playlist:
+            videos = [Video(id=v, title=v, channel="Ch", position=i) for i, v in enumerate(ids)]
+            return Playlist(id=pid, title=pid, videos=videos)
+
+        with (
+            patch("ytrix.__main__.load_config", return_value=mock_config),
+            patch.object(cli_json, "_get_youtube_client", return_value=MagicMock()),
+            patch(
+                "ytrix.__main__.extractor.extract_playlist",
+                side_effect=[playlist("PLlist1", ["v2", "v1"]), playlist("PLlist2", ["v1", "v3"])],
+            ),
+            patch("ytrix.__main__.api.create_playlist", return_value="PLmerged"),
+            patch("ytrix.__main__.api.add_video_to_playlist") as mock_add,
+        ):
+            result = cli_json.plists2mlist(str(input_file))
+
+        assert [c.args[2] for c in mock_add.call_args_list] == ["v2", "v1", "v3"]
+        assert result is not None
+        assert result["duplicates_skipped"] == 1
+
+    def test_parallel_extraction_keeps_file_order(self, cli_json: YtrixCLI, tmp_path: Path) -> None:
+        """With several workers, sources are reported in file order; failures are skipped."""
+        import time
+
+        input_file = tmp_path / "playlists.txt"
+        input_file.write_text("PL0\nPL1\nPLbad\nPL3\n")
+
+        def extract(source: str, use_cache: bool) -> Playlist:
+            if source == "PLbad":
+                raise RuntimeError("private")
+            time.sleep(0.01 * (4 - int(source[2:])))  # later sources finish first
+            video = Video(id=f"v{source}", title="V", channel="Ch", position=0)
+            return Playlist(id=source, title=source, videos=[video])
+
+        with (
+            patch("ytrix.__main__.info.MAX_PARALLEL_WORKERS", 4),
+            patch("ytrix.__main__.extractor.extract_playlist", side_effect=extract) as mock_ext,
+        ):
+            result = cli_json.plists2mlist(str(input_file), dry_run=True)
+
+        assert mock_ext.call_count == 4
+        assert result is not None
+        assert [p["title"] for p in result["source_playlists"]] == ["PL0", "PL1", "PL3"]
+        assert result["unique_videos"] == 3
+
+    def test_extraction_runs_only_a_little_ahead(self) -> None:
+        """_extract_many keeps at most workers + 1 extractions ahead of its consumer."""
+        from ytrix.__main__ import _extract_many
+
+        started: list[str] = []
+
+        def extract(source: str, use_cache: bool) -> Playlist:
+            started.append(source)
+            return Playlist(id=source, title=source)
+
+        sources = [f"PL{i}" for i in range(10)]
+        with (
+            patch("ytrix.__main__.info.MAX_PARALLEL_WORKERS", 2),
+            patch("ytrix.__main__.extractor.extract_playlist", side_effect=extract),
+        ):
+            results = _extract_many(sources)
+            first = next(results)
+            assert len(started) <= 3
+            rest = list(results)
+
+        assert [first[0]] + [source for source, _ in rest] == sources
+
+    def test_url_file_skips_blanks_and_comments(self, tmp_path: Path) -> None:
+        """URL files are read in one pass: blanks, indented comments and CRLF are handled."""
+        from ytrix.__main__ import _read_url_lines
+
+        path = tmp_path / "playlists.txt"
+        path.write_bytes(b"# header\r\nPL1\r\n\r\n  # indented comment\n  PL2  \nPL3")
+        assert _read_url_lines(str(path)) == ["PL1", "PL2", "PL3"]
+
+        path.write_text("# only comments\n\n")
+        with pytest.raises(ValueError, match="No playlist URLs"):
+            _read_url_lines(str(path))
+
+    @pytest.mark.parametrize("no_cache", [False, True])
+    def test_no_cache_flag_bypasses_playlist_cache(self, tmp_path: Path, no_cache: bool) -> None:
+        """--no-cache makes every source extraction skip the local cache."""
+        input_file = tmp_path / "playlists.txt"
+        input_file.write_text("PL1\n")
+        playlist = Playlist(
+            id="PL1", title="L", videos=[Video(id="v1", title="V", channel="C", position=0)]
+        )
+        with patch("ytrix.__main__.configure_logging"):
+            cli = YtrixCLI(json_output=True, no_cache=no_cache)
+
+        with patch("ytrix.__main__.extractor.extract_playlist", return_value=playlist) as mock_ext:
+            cli.plists2mlist(str(input_file), dry_run=True)
+
+        mock_ext.assert_called_once_with("PL1", use_cache=not no_cache)
+
 
 class TestPlist2mlists:
     """Tests for plist2mlists command."""
@@ -889,6 +1469,38 @@ class TestPlist2mlists:
         assert parsed["playlists_planned"] == 2
         assert len(parsed["playlists"]) == 2
 
+    @pytest.mark.parametrize(
+        ("by", "groups"),
+        [
+            ("channel", {"Channel A": 2, "Unknown Channel": 1}),
+            ("year", {"2020": 1, "2021": 1, "Unknown Year": 1}),
+        ],
+    )
+    def test_group_keys_with_fallbacks(
+        self, cli_json: YtrixCLI, by: str, groups: dict[str, int]
+    ) -> None:
+        """Videos without a channel or upload date land in the Unknown groups."""
+        source = Playlist(
+            id="PLsource",
+            title="Mixed",
+            videos=[
+                Video(id="v1", title="V", channel="Channel A", position=0, upload_date="20200101"),
+                Video(id="v2", title="V", channel="", position=1, upload_date="20210101"),
+                Video(id="v3", title="V", channel="Channel A", position=2),
+            ],
+        )
+
+        with patch("ytrix.__main__.extractor.extract_playlist", return_value=source):
+            result = cli_json.plist2mlists("PLsource", by=by, dry_run=True)
+
+        assert result is not None
+        assert {p["group"]: p["video_count"] for p in result["playlists"]} == groups
+
+    def test_rejects_unknown_split_criterion(self, cli_json: YtrixCLI) -> None:
+        """Only channel and year are accepted for --by."""
+        with pytest.raises(ValueError, match="--by must be"):
+            cli_json.plist2mlists("PLsource", by="title")
+
 
 class TestMlists2yaml:
     """Tests for mlists2yaml command."""
@@ -916,6 +1528,100 @@ class TestMlists2yaml:
         assert "PL1" in content
         assert "PL2" in content
 
+    def test_details_streams_one_playlist_at_a_time(self, cli: YtrixCLI, tmp_path: Path) -> None:
+        """With --details each playlist is written, then its videos are released."""
+        playlists = [Playlist(id="PL1", title="Playlist 1"), Playlist(id="PLpriv", title="Priv")]
+        output_path = tmp_path / "playlists.yaml"
+
+        def extract(playlist_id: str, use_cache: bool) -> Playlist:
+            if playlist_id == "PLpriv":
+                raise RuntimeError("private")
+            video = Video(id="v1", title="V1", channel="C", position=0)
+            return Playlist(id=playlist_id, title="Playlist 1", videos=[video])
+
+        api_video = Video(id="v2", title="V2", channel="C", position=0)
+        with (
+            patch.object(cli, "_load_config"),
+            patch.object(cli, "_get_youtube_client"),
+            patch("ytrix.__main__.api.list_my_playlists", return_value=playlists),
+            patch("ytrix.__main__.extractor.extract_playlist", side_effect=extract),
+            patch("ytrix.__main__.api.get_playlist_videos", return_value=[api_video]),
+        ):
+            cli.mlists2yaml(str(output_path), details=True)
+
+        loaded = yaml_ops.load_yaml(output_path)
+        assert [[v.id for v in p.videos] for p in loaded] == [["v1"], ["v2"]]
+        assert all(not p.videos for p in playlists)
+
+    def test_details_fetched_in_parallel_with_api_fallback_on_main_thread(
+        self, cli_json: YtrixCLI
+    ) -> None:
+        """yt-dlp runs on worker threads; API fallbacks stay on the calling thread."""
+        import threading
+
+        playlists = [Playlist(id=f"PL{i}", title=f"P{i}") for i in range(4)]
+        api_threads: list[threading.Thread] = []
+
+        def extract(playlist_id: str, use_cache: bool) -> Playlist:
+            if playlist_id == "PL2":
+                raise RuntimeError("private")
+            video = Video(id=f"v{playlist_id}", title="V", channel="C", position=0)
+            return Playlist(id=playlist_id, title="", videos=[video])
+
+        def api_videos(client: object, playlist_id: str) -> list[Video]:
+            api_threads.append(threading.current_thread())
+            return [Video(id="vapi", title="V", channel="C", position=0)]
+
+        with (
+            patch.object(cli_json, "_load_config"),
+            patch.object(cli_json, "_get_youtube_client"),
+            patch("ytrix.__main__.info.MAX_PARALLEL_WORKERS", 4),
+            patch("ytrix.__main__.api.list_my_playlists", return_value=playlists),
+            patch("ytrix.__main__.extractor.extract_playlist", side_effect=extract),
+            patch("ytrix.__main__.api.get_playlist_videos", side_effect=api_videos),
+        ):
+            result = cli_json.mlists2yaml(details=True)
+
+        assert result is not None
+        assert [[v["id"] for v in p["videos"]] for p in result["playlists"]] == [
+            ["vPL0"],
+            ["vPL1"],
+            ["vapi"],
+            ["vPL3"],
+        ]
+        assert api_threads == [threading.current_thread()]
+
+    def test_details_skip_ytdlp_for_private_playlists(self, cli_json: YtrixCLI) -> None:
+        """Playlists listed as private go straight to the API, in listing order."""
+        playlists = [
+            Playlist(id="PLpub", title="Pub"),
+            Playlist(id="PLpriv", title="Priv", privacy="private"),
+            Playlist(id="PLunl", title="Unl", privacy="unlisted"),
+        ]
+
+        def extract(playlist_id: str, use_cache: bool) -> Playlist:
+            video = Video(id=f"v{playlist_id}", title="V", channel="C", position=0)
+            return Playlist(id=playlist_id, title="", videos=[video])
+
+        api_video = Video(id="vapi", title="V", channel="C", position=0)
+        with (
+            patch.object(cli_json, "_load_config"),
+            patch.object(cli_json, "_get_youtube_client"),
+            patch("ytrix.__main__.api.list_my_playlists", return_value=playlists),
+            patch("ytrix.__main__.extractor.extract_playlist", side_effect=extract) as mock_ext,
+            patch("ytrix.__main__.api.get_playlist_videos", return_value=[api_video]) as mock_api,
+        ):
+            result = cli_json.mlists2yaml(details=True)
+
+        assert [c.args[0] for c in mock_ext.call_args_list] == ["PLpub", "PLunl"]
+        assert mock_api.call_args.args[1] == "PLpriv"
+        assert result is not None
+        assert [[v["id"] for v in p["videos"]] for p in result["playlists"]] == [
+            ["vPLpub"],
+            ["vapi"],
+            ["vPLunl"],
+        ]
+
     def test_json_output_returns_dict(
         self, cli_json: YtrixCLI, mock_config: MagicMock, mock_client: MagicMock, capsys
     ) -> None:
@@ -984,6 +1690,79 @@ playlists:
 
         mock_update.assert_not_called()
 
+    def test_added_videos_inserted_in_yaml_order(
+        self, cli_json: YtrixCLI, mock_client: MagicMock, tmp_path: Path
+    ) -> None:
+        """Several additions are inserted one by one, so they end up in YAML order."""
+        yaml_file = tmp_path / "playlists.yaml"
+        yaml_file.write_text(
+            """
+playlists:
+  - id: PL123
+    title: T
+    privacy: public
+    videos:
+      - id: v1
+      - id: v3
+      - id: v2
+"""
+        )
+        current = Playlist(
+            id="PL123", title="T", videos=[Video(id="v1", title="V1", channel="C", position=0)]
+        )
+        live = [v.id for v in current.videos]
+
+        with (
+            patch.object(cli_json, "_load_config"),
+            patch.object(cli_json, "_get_youtube_client", return_value=mock_client),
+            patch("ytrix.__main__.api.get_playlist_with_videos", return_value=current),
+            patch(
+                "ytrix.__main__.api.add_video_to_playlist",
+                side_effect=lambda _client, _pid, vid: live.append(vid),
+            ),
+            patch("ytrix.__main__.api.batch_add_videos") as mock_batch,
+        ):
+            result = cli_json.yaml2mlists(str(yaml_file))
+
+        assert live == ["v1", "v3", "v2"]
+        mock_batch.assert_not_called()
+        assert result is not None
+        assert result["playlists"][0]["applied"] is True
+
+    def test_removed_videos_sent_in_one_batch_call(
+        self, cli_json: YtrixCLI, mock_client: MagicMock, tmp_path: Path
+    ) -> None:
+        """Removed videos are deleted by playlistItem ID in a batch; failures are reported."""
+        yaml_file = tmp_path / "playlists.yaml"
+        yaml_ops.save_yaml(yaml_file, [Playlist(id="PL123", title="T")])
+        current = Playlist(
+            id="PL123",
+            title="T",
+            videos=[Video(id=f"v{i}", title="V", channel="C", position=i) for i in range(3)],
+        )
+        items = [
+            PlaylistItem(item_id=f"item{i}", video_id=f"v{i}", title="V", channel="C", position=i)
+            for i in range(3)
+        ]
+
+        with (
+            patch.object(cli_json, "_load_config"),
+            patch.object(cli_json, "_get_youtube_client", return_value=mock_client),
+            patch("ytrix.__main__.api.get_playlist_with_videos", return_value=current),
+            patch("ytrix.__main__.api.get_playlist_items", return_value=items),
+            patch(
+                "ytrix.__main__.api.batch_remove_playlist_items",
+                return_value=(["item0", "item2"], {"item1": RuntimeError("gone")}),
+            ) as mock_batch,
+            patch("ytrix.__main__.api.remove_video_from_playlist") as mock_remove,
+        ):
+            result = cli_json.yaml2mlists(str(yaml_file))
+
+        mock_batch.assert_called_once_with(mock_client, ["item0", "item1", "item2"])
+        mock_remove.assert_not_called()
+        assert result is not None
+        assert result["playlists"][0]["errors"] == {"v1": "gone"}
+
     def test_json_output(
         self,
         cli_json: YtrixCLI,
@@ -1022,6 +1801,152 @@ playlists:
         assert parsed["playlists"][0]["playlist_id"] == "PL123"
         assert "title" in parsed["playlists"][0]["changes"]
 
+    def test_skips_playlists_unedited_since_export(
+        self, cli: YtrixCLI, mock_client: MagicMock, tmp_path: Path
+    ) -> None:
+        """A playlist exported with --details and left untouched costs no API call."""
+        video = Video(id="v1", title="V1", channel="C", position=1)
+        listed = Playlist(id="PL1", title="Playlist 1")
+        extracted = Playlist(id="PL1", title="", videos=[video])
+        output_path = tmp_path / "playlists.yaml"
+
+        with (
+            patch.object(cli, "_load_config"),
+            patch.object(cli, "_get_youtube_client", return_value=mock_client),
+            patch("ytrix.__main__.api.list_my_playlists", return_value=[listed]),
+            patch("ytrix.__main__.extractor.extract_playlist", return_value=extracted),
+        ):
+            cli.mlists2yaml(str(output_path), details=True)
+
+        with (
+            patch.object(cli, "_load_config"),
+            patch.object(cli, "_get_youtube_client", return_value=mock_client),
+            patch("ytrix.__main__.api.get_playlist_with_videos") as mock_get,
+        ):
+            cli.yaml2mlists(str(output_path))
+        mock_get.assert_not_called()
+
+        # Any edit to the section, or --no-cache, goes back to the API
+        output_path.write_text(output_path.read_text().replace("Playlist 1", "Renamed"))
+        current = Playlist(id="PL1", title="Renamed", videos=[video])
+        with (
+            patch.object(cli, "_load_config"),
+            patch.object(cli, "_get_youtube_client", return_value=mock_client),
+            patch("ytrix.__main__.api.get_playlist_with_videos", return_value=current) as mock_get,
+        ):
+            cli.yaml2mlists(str(output_path))
+        mock_get.assert_called_once()
+
+    @pytest.mark.parametrize("edit", ["rename", "add_video"])
+    def test_reverting_an_applied_edit_is_not_skipped(
+        self, cli: YtrixCLI, mock_client: MagicMock, tmp_path: Path, edit: str
+    ) -> None:
+        """Export, apply an edit, restore the exported YAML: the restore is applied too."""
+        video = Video(id="v1", title="V1", channel="C", position=1)
+        original = Playlist(id="PL1", title="Playlist 1", videos=[video])
+        output_path = tmp_path / "playlists.yaml"
+        with (
+            patch.object(cli, "_load_config"),
+            patch.object(cli, "_get_youtube_client", return_value=mock_client),
+            patch("ytrix.__main__.api.list_my_playlists", return_value=[original]),
+            patch("ytrix.__main__.extractor.extract_playlist", return_value=original),
+        ):
+            cli.mlists2yaml(str(output_path), details=True)
+        exported = output_path.read_text()
+
+        [edited] = yaml_ops.load_yaml(output_path)
+        if edit == "rename":
+            edited.title = "Renamed"
+        else:
+            edited.videos.append(Video(id="v2", title="V2", channel="C", position=2))
+        yaml_ops.save_yaml(output_path, [edited])
+
+        def apply(live: Playlist) -> MagicMock:
+            with (
+                patch.object(cli, "_load_config"),
+                patch.object(cli, "_get_youtube_client", return_value=mock_client),
+                patch("ytrix.__main__.api.get_playlists_by_id", return_value={}),
+                patch("ytrix.__main__.api.get_playlist_with_videos", return_value=live) as mock_get,
+                patch("ytrix.__main__.api.update_playlist"),
+                patch("ytrix.__main__.api.add_video_to_playlist"),
+                patch("ytrix.__main__.api.get_playlist_items", return_value=[]),
+                patch("ytrix.__main__.api.batch_remove_playlist_items", return_value=([], {})),
+            ):
+                cli.yaml2mlists(str(output_path))
+            return mock_get
+
+        apply(original)
+        output_path.write_text(exported)
+        mock_get = apply(edited)
+
+        mock_get.assert_called_once()
+
+    def test_metadata_fetched_once_for_all_playlists(
+        self, cli_json: YtrixCLI, mock_client: MagicMock, tmp_path: Path
+    ) -> None:
+        """One batched metadata lookup feeds every per-playlist video fetch."""
+        playlists = [Playlist(id="PL1", title="A"), Playlist(id="PL2", title="B")]
+        yaml_file = tmp_path / "playlists.yaml"
+        yaml_ops.save_yaml(yaml_file, playlists)
+        metadata = {"PL1": Playlist(id="PL1", title="A")}
+
+        with (
+            patch.object(cli_json, "_load_config"),
+            patch.object(cli_json, "_get_youtube_client", return_value=mock_client),
+            patch("ytrix.__main__.api.get_playlists_by_id", return_value=metadata) as mock_meta,
+            patch(
+                "ytrix.__main__.api.get_playlist_with_videos",
+                side_effect=[playlists[0], ValueError],
+            ) as mock_get,
+        ):
+            result = cli_json.yaml2mlists(str(yaml_file))
+
+        mock_meta.assert_called_once_with(mock_client, ["PL1", "PL2"])
+        assert [c.kwargs["metadata"] for c in mock_get.call_args_list] == [metadata["PL1"], None]
+        assert result is not None
+        assert result["playlists"][0]["changes"] == {}
+        assert "error" in result["playlists"][1]
+
+    def test_failed_metadata_prefetch_falls_back_per_playlist(
+        self, cli_json: YtrixCLI, mock_client: MagicMock, tmp_path: Path
+    ) -> None:
+        """If the batched lookup fails, each playlist fetches its own metadata."""
+        playlists = [Playlist(id="PL1", title="A"), Playlist(id="PL2", title="B")]
+        yaml_file = tmp_path / "playlists.yaml"
+        yaml_ops.save_yaml(yaml_file, playlists)
+
+        with (
+            patch.object(cli_json, "_load_config"),
+            patch.object(cli_json, "_get_youtube_client", return_value=mock_client),
+            patch("ytrix.__main__.api.get_playlists_by_id", side_effect=RuntimeError("503")),
+            patch("ytrix.__main__.api.get_playlist_with_videos", side_effect=playlists) as mock_get,
+        ):
+            result = cli_json.yaml2mlists(str(yaml_file))
+
+        assert [c.kwargs["metadata"] for c in mock_get.call_args_list] == [None, None]
+        assert result is not None
+        assert [p["changes"] for p in result["playlists"]] == [{}, {}]
+
+    def test_no_cache_checks_every_playlist(self, tmp_path: Path) -> None:
+        """--no-cache ignores the export index."""
+        playlist = Playlist(id="PL1", title="T")
+        yaml_ops.record_exports({"PL1": yaml_ops.playlist_fingerprint(playlist)})
+        yaml_file = tmp_path / "playlists.yaml"
+        yaml_ops.save_yaml(yaml_file, [playlist])
+
+        with (
+            patch("ytrix.__main__.configure_logging"),
+            patch("ytrix.__main__.api.set_throttle_delay"),
+        ):
+            cli = YtrixCLI(no_cache=True)
+        with (
+            patch.object(cli, "_load_config"),
+            patch.object(cli, "_get_youtube_client"),
+            patch("ytrix.__main__.api.get_playlist_with_videos", return_value=playlist) as mock_get,
+        ):
+            cli.yaml2mlists(str(yaml_file))
+        mock_get.assert_called_once()
+
 
 class TestMlist2yaml:
     """Tests for mlist2yaml command."""
@@ -1059,6 +1984,26 @@ class TestMlist2yaml:
         assert output_path.exists()
         assert "PLsingle" in output_path.read_text()
 
+    def test_private_playlist_skips_ytdlp(self, cli_json: YtrixCLI) -> None:
+        """A playlist the API reports as private is read via the API only."""
+        client = MagicMock()
+        client.playlists.return_value.list.return_value.execute.return_value = {
+            "items": [{"snippet": {"title": "Mine"}, "status": {"privacyStatus": "private"}}]
+        }
+        videos = [Video(id="v1", title="V1", channel="Ch", position=0)]
+
+        with (
+            patch.object(cli_json, "_load_config"),
+            patch.object(cli_json, "_get_youtube_client", return_value=client),
+            patch("ytrix.__main__.extractor.extract_playlist") as mock_extract,
+            patch("ytrix.__main__.api.get_playlist_videos", return_value=videos),
+        ):
+            result = cli_json.mlist2yaml("PLpriv")
+
+        mock_extract.assert_not_called()
+        assert result is not None
+        assert [v["id"] for v in result["playlist"]["videos"]] == ["v1"]
+
     def test_json_output(
         self, cli_json: YtrixCLI, mock_config: MagicMock, mock_client: MagicMock, capsys
     ) -> None:
@@ -1194,6 +2139,70 @@ playlists:
         assert parsed["playlists_processed"] == 1
 
 
+class TestPlist2info:
+    """Tests for plist2info command."""
+
+    @pytest.mark.parametrize(("subtitle_delay", "expected"), [(None, []), (2000, [2000])])
+    def test_subtitle_delay_overrides_only_when_given(
+        self, cli_json: YtrixCLI, tmp_path: Path, subtitle_delay: int | None, expected: list[int]
+    ) -> None:
+        """Without --subtitle-delay the module's proxy-aware default is kept."""
+        playlist = MagicMock(id="PL1", title="T", videos=[])
+        with (
+            patch("ytrix.__main__.info.set_subtitle_throttle_delay") as mock_set,
+            patch("ytrix.__main__.info.extract_and_save_playlist_info", return_value=playlist),
+        ):
+            cli_json.plist2info("PL1", output=str(tmp_path), subtitle_delay=subtitle_delay)
+
+        assert [c.args[0] for c in mock_set.call_args_list] == expected
+
+
+class TestPlists2info:
+    """Tests for plists2info command."""
+
+    def test_duplicate_playlists_processed_once(self, cli_json: YtrixCLI, tmp_path: Path) -> None:
+        """The same playlist given as ID and URL is extracted only once."""
+        urls = tmp_path / "urls.txt"
+        urls.write_text(
+            "PLaaaaaaaaaa\n"
+            "https://www.youtube.com/playlist?list=PLaaaaaaaaaa\n"
+            "PLbbbbbbbbbb\n"
+            "PLaaaaaaaaaa\n"
+        )
+        with patch(
+            "ytrix.__main__.info.extract_and_save_playlist_info",
+            side_effect=lambda url, *a, **kw: Playlist(id=url, title=url),
+        ) as mock_extract:
+            result = cli_json.plists2info(str(urls), output=str(tmp_path), parallel=False)
+
+        assert [c.args[0] for c in mock_extract.call_args_list] == ["PLaaaaaaaaaa", "PLbbbbbbbbbb"]
+        assert result["playlists_processed"] == 2
+
+    def test_parallel_progress_prints_only_failures(
+        self, cli: YtrixCLI, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Large parallel runs show a progress bar instead of one line per playlist."""
+        ids = [f"PLx{i:09d}" for i in range(25)]
+        urls = tmp_path / "urls.txt"
+        urls.write_text("\n".join(ids))
+
+        def extract(url: str, *args: Any, **kwargs: Any) -> Playlist:
+            if url == ids[3]:
+                raise RuntimeError("gone")
+            return Playlist(id=url, title=f"Title {url}")
+
+        with (
+            patch("ytrix.__main__.info.MAX_PARALLEL_WORKERS", 4),
+            patch("ytrix.__main__.info.extract_and_save_playlist_info", side_effect=extract),
+        ):
+            folders = cli.plists2info(str(urls), output=str(tmp_path), parallel=True)
+
+        out = capsys.readouterr().out
+        assert len(folders) == 24
+        assert f"{ids[3]}: gone" in out
+        assert "✓" not in out
+
+
 class TestErrorCases:
     """Tests for error handling in CLI commands."""
 
@@ -1399,6 +2408,21 @@ class TestListUserWithCount:
         assert "10 videos" in captured.out
         assert "25 videos" in captured.out
 
+    def test_list_user_prints_listing_once(self, cli: YtrixCLI) -> None:
+        """The playlist listing is emitted as one console.print block."""
+        playlists = [Playlist(id=f"PL{i}", title=f"Playlist {i}") for i in range(5)]
+
+        with (
+            patch("ytrix.__main__.extractor.extract_channel_playlists", return_value=playlists),
+            patch("ytrix.__main__.console") as mock_console,
+        ):
+            cli.ls(user="@testchannel")
+
+        block = mock_console.print.call_args_list[-1].args[0]
+        assert mock_console.print.call_count == 2  # "Fetching..." + listing
+        assert block.startswith("Found 5 playlists:")
+        assert all(f"list=PL{i}" in block for i in range(5))
+
     def test_list_user_with_count_json(self, cli_json: YtrixCLI, capsys) -> None:
         """List --user --count with JSON includes video_count."""
         import json as json_mod
@@ -1418,6 +2442,51 @@ class TestListUserWithCount:
         assert parsed["playlists"][0]["video_count"] == 42
 
 
+class TestFetchVideoCounts:
+    """Tests for the parallel yt-dlp video count helper."""
+
+    def test_keeps_input_order_with_parallel_workers(self) -> None:
+        """Counts map back to their playlist IDs regardless of completion order."""
+        import time
+
+        from ytrix.__main__ import _fetch_video_counts
+
+        def slow_count(playlist_id: str) -> int:
+            n = int(playlist_id[2:])
+            time.sleep(0.01 * (5 - n))  # later IDs finish first
+            return n * 10
+
+        ids = [f"PL{i}" for i in range(5)]
+        with patch("ytrix.__main__.info.MAX_PARALLEL_WORKERS", 4):
+            counts = _fetch_video_counts(ids, slow_count)
+        assert list(counts.items()) == [(f"PL{i}", i * 10) for i in range(5)]
+
+    def test_own_playlists_fall_back_to_api(self, cli_json: YtrixCLI, mock_config) -> None:
+        """Playlists yt-dlp can't read are counted via the API."""
+        playlists = [Playlist(id="PLpub", title="Public"), Playlist(id="PLpriv", title="Private")]
+
+        def ytdlp_count(playlist_id: str) -> int:
+            if playlist_id == "PLpriv":
+                raise RuntimeError("private")
+            return 3
+
+        with (
+            patch("ytrix.__main__.load_config", return_value=mock_config),
+            patch.object(cli_json, "_get_youtube_client", return_value=MagicMock()),
+            patch("ytrix.__main__.api.list_my_playlists", return_value=playlists),
+            patch("ytrix.__main__.extractor.get_video_count", side_effect=ytdlp_count),
+            patch(
+                "ytrix.__main__.api.get_playlist_videos", return_value=[MagicMock()] * 7
+            ) as mock_api,
+        ):
+            result = cli_json.ls(count=True)
+
+        assert result is not None
+        assert [p["video_count"] for p in result["playlists"]] == [3, 7]
+        mock_api.assert_called_once()
+        assert mock_api.call_args.args[1] == "PLpriv"
+
+
 class TestJournalStatus:
     """Tests for journal_status command."""
 
@@ -1479,6 +2548,38 @@ class TestJournalStatus:
         assert len(parsed["tasks"]) == 1
         assert parsed["summary"]["completed"] == 1
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_journal_status_json_tasks_match_to_dict(
+        self, cli_json: YtrixCLI, capsys, use_orjson: bool
+    ) -> None:
+        """Tasks are dumped directly, with the same fields and values as Task.to_dict()."""
+        import json as json_mod
+
+        from ytrix.journal import Journal, Task, TaskStatus
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+        tasks = [
+            Task(source_playlist_id="PL1", source_title="Zażółć", status=TaskStatus.COMPLETED),
+            Task(
+                source_playlist_id="PL2",
+                source_title="Test2",
+                status=TaskStatus.FAILED,
+                error="quotaExceeded",
+                retry_count=2,
+            ),
+        ]
+        journal = Journal(batch_id="b", created_at="2024-01-01T00:00:00", tasks=tasks)
+        with patch("ytrix.__main__.load_journal", return_value=journal):
+            if use_orjson:
+                cli_json.journal_status()
+            else:
+                with patch("ytrix.__main__.orjson", None):
+                    cli_json.journal_status()
+        parsed = json_mod.loads(capsys.readouterr().out)
+        assert parsed["tasks"] == [t.to_dict() for t in tasks]
+        assert list(parsed["tasks"][0]) == list(tasks[0].to_dict())
+
     def test_journal_status_clear(self, cli: YtrixCLI, capsys) -> None:
         """--clear flag clears the journal."""
         with patch("ytrix.__main__.clear_journal") as mock_clear:
@@ -1613,26 +2714,54 @@ class TestProjectCommands:
         assert hasattr(YtrixCLI, "projects_add")
         assert callable(YtrixCLI.projects_add)
 
+    def test_quota_status_prices_operations_by_name(self, cli: YtrixCLI, mock_config) -> None:
+        """quota_status passes (count, units) per operation, sorted by name."""
+        summary = {
+            "used": 151,
+            "limit": 10000,
+            "operations": {"playlists.insert": 3, "custom.op": 1, "playlists.list": 1},
+        }
+        manager = MagicMock()
+        manager.current_project.name = "main"
+        manager.current_project.quota_group = "default"
+        with (
+            patch("ytrix.__main__.quota.get_quota_summary", return_value=summary),
+            patch("ytrix.__main__.quota.get_tracker") as mock_tracker,
+            patch("ytrix.__main__.load_config", return_value=mock_config),
+            patch("ytrix.__main__.get_project_manager", return_value=manager),
+            patch("ytrix.__main__.dashboard.create_operations_table") as mock_table,
+        ):
+            mock_tracker.return_value.check_and_warn.return_value = None
+            cli.quota_status()
+        ops = mock_table.call_args.args[0]
+        assert list(ops) == ["custom.op", "playlists.insert", "playlists.list"]
+        assert ops == {
+            "custom.op": (1, 50),
+            "playlists.insert": (3, 150),
+            "playlists.list": (1, 1),
+        }
+
     def test_projects_add_when_prompted_then_updates_config(self, tmp_path: Any) -> None:
         """projects_add uses prompts and appends config entry."""
         config_dir = tmp_path / ".ytrix"
         config_dir.mkdir()
         config_file = config_dir / "config.toml"
         config_file.write_text('channel_id = "UC123"\n')
-        prompt_values = ["client-id", "client-secret"]
+        prompt_values = ["client-id", "client-secret", "default", "prod"]
 
         with (
             patch("ytrix.__main__.configure_logging"),
             patch("ytrix.__main__.api.set_throttle_delay"),
             patch("ytrix.__main__.get_config_dir", return_value=config_dir),
             patch("ytrix.__main__.Prompt.ask", side_effect=prompt_values) as prompt,
-            patch("builtins.input", side_effect=["default", "prod", "0"]),
+            patch("ytrix.__main__.IntPrompt.ask", return_value=2),
         ):
             cli = YtrixCLI()
             cli.projects_add("newproj")
 
         updated = config_file.read_text()
         assert 'name = "newproj"' in updated, "Expected new project entry in config"
+        assert "priority = 2" in updated, "Expected priority from the integer prompt"
         assert prompt.call_args_list[0].args[0] == "Client ID", "Expected prompt for client ID"
         assert prompt.call_args_list[1].args[0] == "Client Secret", (
             "Expected prompt for client secret"
@@ -1641,6 +2770,54 @@ class TestProjectCommands:
             "Expected client secret prompt to mask input"
         )
 
+    def test_projects_add_rejects_existing_name(self, tmp_path: Any, capsys: Any) -> None:
+        """An existing project name fails before any prompt."""
+        import json as json_mod
+
+        config_dir = tmp_path / ".ytrix"
+        config_dir.mkdir()
+        (config_dir / "config.toml").write_text('[[projects]]\nname = "main"\n')
+
+        with (
+            patch("ytrix.__main__.configure_logging"),
+            patch("ytrix.__main__.api.set_throttle_delay"),
+            patch("ytrix.__main__.get_config_dir", return_value=config_dir),
+            patch("ytrix.__main__.Prompt.ask") as prompt,
+        ):
+            YtrixCLI(json_output=True).projects_add("main")
+
+        prompt.assert_not_called()
+        assert json_mod.loads(capsys.readouterr().out) == {
+            "success": False,
+            "error": "Project 'main' already exists in config",
+        }
+
+    def test_projects_add_full_quota_group_asks_to_continue(self, tmp_path: Any) -> None:
+        """A sixth project in one quota group needs confirmation; declining writes nothing."""
+        config_dir = tmp_path / ".ytrix"
+        config_dir.mkdir()
+        config_file = config_dir / "config.toml"
+        groups = ["client-a"] * 5 + ["default"]
+        config_file.write_text(
+            "".join(
+                f'[[projects]]\nname = "p{i}"\nquota_group = "{g}"\n' for i, g in enumerate(groups)
+            )
+        )
+        original = config_file.read_text()
+
+        with (
+            patch("ytrix.__main__.configure_logging"),
+            patch("ytrix.__main__.api.set_throttle_delay"),
+            patch("ytrix.__main__.get_config_dir", return_value=config_dir),
+            patch("ytrix.__main__.Prompt.ask", side_effect=["id", "secret", "client-a", "prod"]),
+            patch("ytrix.__main__.IntPrompt.ask", return_value=0),
+            patch("ytrix.__main__.Confirm.ask", return_value=False) as confirm,
+        ):
+            YtrixCLI().projects_add("newproj")
+
+        confirm.assert_called_once()
+        assert config_file.read_text() == original
+
 
 class TestHelpCommand:
     """Tests for help command."""
@@ -1699,6 +2876,159 @@ class TestGcpCommands:
             result = cli.gcp_inventory("test-project")
         assert result is None
 
+    def test_gcp_clone_reports_service_and_sa_failures(self) -> None:
+        """Services are enabled in chunks; failures are pinned down and reported in JSON."""
+        from ytrix import gcptrix
+
+        services = [f"s{i}.googleapis.com" for i in range(gcptrix.SERVICES_PER_ENABLE + 2)]
+        bad_service = services[1]
+        sas = [
+            {"email": "custom@src.iam.gserviceaccount.com", "displayName": "Custom"},
+            {"email": "other@src.iam.gserviceaccount.com", "displayName": "Other"},
+            {"email": "123-compute@developer.gserviceaccount.com"},
+        ]
+
+        def enable(project: str, chunk: list[str], dry_run: bool) -> None:
+            if bad_service in chunk:
+                raise gcptrix.GcloudError("boom")
+
+        def create_sa(project: str, account_id: str, name: str, dry_run: bool) -> None:
+            if account_id == "other":
+                raise gcptrix.GcloudError("exists")
+
+        with (
+            patch("ytrix.__main__.configure_logging"),
+            patch("ytrix.__main__.api.set_throttle_delay"),
+            patch("ytrix.gcptrix.check_gcloud_installed", return_value=True),
+            patch("ytrix.gcptrix.check_authentication", return_value={"account": "a@b.c"}),
+            patch("ytrix.gcptrix.check_project_permissions", return_value=True),
+            patch("ytrix.gcptrix.project_exists", return_value=False),
+            patch("ytrix.gcptrix.get_project_info", return_value={}),
+            patch("ytrix.gcptrix.create_project"),
+            patch("ytrix.gcptrix.get_project_labels", return_value={}),
+            patch("ytrix.gcptrix.get_billing_info", return_value={}),
+            patch("ytrix.gcptrix.get_enabled_services", return_value=services),
+            patch("ytrix.gcptrix.enable_services", side_effect=enable) as mock_enable,
+            patch("ytrix.gcptrix.get_service_accounts", return_value=sas),
+            patch("ytrix.gcptrix.create_service_account", side_effect=create_sa) as mock_sa,
+        ):
+            cli = YtrixCLI(json_output=True)
+            result = cli.gcp_clone("src", "2")
+        assert result is not None
+        assert result["success"] is True
+        assert result["failed"] == {
+            "services": [bad_service],
+            "service_accounts": ["other@src.iam.gserviceaccount.com"],
+        }
+        chunks = [c.args[1] for c in mock_enable.call_args_list]
+        # The failed first batch is retried one service at a time before the second
+        first = services[: gcptrix.SERVICES_PER_ENABLE]
+        assert chunks == [first, *([svc] for svc in first), services[-2:]]
+        assert mock_sa.call_count == 2
+
+    def test_gcp_clone_skip_flags_drop_stages(self) -> None:
+        """--skip-labels/--skip-service-accounts never touch labels or SAs."""
+        with (
+            patch("ytrix.__main__.configure_logging"),
+            patch("ytrix.__main__.api.set_throttle_delay"),
+            patch("ytrix.gcptrix.check_gcloud_installed", return_value=True),
+            patch("ytrix.gcptrix.check_authentication", return_value={"account": "a@b.c"}),
+            patch("ytrix.gcptrix.check_project_permissions", return_value=True),
+            patch("ytrix.gcptrix.project_exists", return_value=False),
+            patch("ytrix.gcptrix.get_project_info", return_value={}),
+            patch("ytrix.gcptrix.create_project"),
+            patch("ytrix.gcptrix.get_project_labels") as mock_labels,
+            patch("ytrix.gcptrix.get_billing_info", return_value={}) as mock_billing,
+            patch("ytrix.gcptrix.get_enabled_services", return_value=[]) as mock_services,
+            patch("ytrix.gcptrix.get_service_accounts") as mock_sas,
+        ):
+            cli = YtrixCLI(json_output=True)
+            result = cli.gcp_clone("src", "2", skip_labels=True, skip_service_accounts=True)
+        assert result is not None
+        assert result["success"] is True
+        mock_labels.assert_not_called()
+        mock_sas.assert_not_called()
+        mock_billing.assert_called_once_with("src", False)
+        mock_services.assert_called_once_with("src", False)
+
+    def test_gcp_clone_preflight_reports_auth_failure_first(self) -> None:
+        """All preflight checks run, but an auth failure wins over later failures."""
+        from ytrix import gcptrix
+
+        with (
+            patch("ytrix.__main__.configure_logging"),
+            patch("ytrix.__main__.api.set_throttle_delay"),
+            patch("ytrix.gcptrix.check_gcloud_installed", return_value=True),
+            patch(
+                "ytrix.gcptrix.check_authentication",
+                side_effect=gcptrix.AuthenticationError("not logged in"),
+            ),
+            patch("ytrix.gcptrix.check_project_permissions", return_value=False) as mock_perm,
+            patch("ytrix.gcptrix.project_exists", return_value=True) as mock_exists,
+            patch("ytrix.gcptrix.get_project_info", return_value={}) as mock_info,
+            patch("ytrix.gcptrix.create_project") as mock_create,
+        ):
+            cli = YtrixCLI(json_output=True)
+            result = cli.gcp_clone("src", "2")
+        assert result == {"success": False, "error": "not logged in"}
+        mock_perm.assert_called_once_with("src", False)
+        mock_exists.assert_called_once_with("src-2", False)
+        mock_info.assert_called_once_with("src", False)
+        mock_create.assert_not_called()
+
+    def test_gcp_inventory_json_collects_all_lookups(self) -> None:
+        """gcp_inventory gathers every lookup and tolerates individual gcloud failures."""
+        from ytrix import gcptrix
+
+        with (
+            patch("ytrix.__main__.configure_logging"),
+            patch("ytrix.__main__.api.set_throttle_delay"),
+            patch("ytrix.gcptrix.check_gcloud_installed", return_value=True),
+            patch("ytrix.gcptrix.check_authentication", return_value={"account": "a@b.c"}),
+            patch("ytrix.gcptrix.check_project_permissions", return_value=True),
+            patch("ytrix.gcptrix.get_project_info", return_value={"projectNumber": "42"}),
+            patch("ytrix.gcptrix.get_project_labels", return_value={"env": "prod"}),
+            patch(
+                "ytrix.gcptrix.get_billing_info",
+                side_effect=gcptrix.GcloudError("no billing access"),
+            ),
+            patch("ytrix.gcptrix.get_service_accounts", return_value=[{"email": "sa@x"}]),
+            patch("ytrix.gcptrix.get_enabled_services", return_value=["youtube.googleapis.com"]),
+        ):
+            cli = YtrixCLI(json_output=True)
+            result = cli.gcp_inventory("test-project")
+        assert result is not None
+        assert result["project_number"] == "42"
+        assert result["labels"] == {"env": "prod"}
+        assert result["billing_enabled"] is False
+        assert result["service_accounts"] == ["sa@x"]
+        assert result["enabled_services"] == ["youtube.googleapis.com"]
+
+    def test_gcp_inventory_text_lists_sorted_services(self, capsys: Any) -> None:
+        """Text inventory shows labels, SAs and (already sorted) services with a total."""
+        with (
+            patch("ytrix.__main__.configure_logging"),
+            patch("ytrix.__main__.api.set_throttle_delay"),
+            patch("ytrix.gcptrix.check_gcloud_installed", return_value=True),
+            patch("ytrix.gcptrix.check_authentication", return_value={"account": "a@b.c"}),
+            patch("ytrix.gcptrix.check_project_permissions", return_value=True),
+            patch("ytrix.gcptrix.get_project_info", return_value={"projectNumber": "42"}),
+            patch("ytrix.gcptrix.get_project_labels", return_value={"env": "prod"}),
+            patch("ytrix.gcptrix.get_billing_info", return_value={}),
+            patch("ytrix.gcptrix.get_service_accounts", return_value=[{"email": "sa@x"}]),
+            patch(
+                "ytrix.gcptrix.get_enabled_services",
+                return_value=["drive.googleapis.com", "youtube.googleapis.com"],
+            ),
+        ):
+            YtrixCLI().gcp_inventory("test-project")
+        out = capsys.readouterr().out
+        assert "env: prod" in out
+        assert "sa@x" in out
+        assert "Not enabled" in out
+        assert out.index("drive.googleapis.com") < out.index("youtube.googleapis.com")
+        assert "Total: 2" in out
+
     def test_gcp_clone_json_output_on_missing_gcloud(self) -> None:
         """gcp_clone returns JSON error when gcloud missing and --json-output."""
         with (
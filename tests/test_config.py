@@ -10,10 +10,12 @@ from ytrix.config import (
     Config,
     OAuthConfig,
     ProjectConfig,
+    append_project,
     get_config_dir,
     get_token_path,
     get_tokens_dir,
     load_config,
+    read_toml,
 )
 
 
@@ -94,6 +96,90 @@ class TestGetTokenPath:
             assert result == tmp_path / ".ytrix" / "token.json"
 
 
+class TestReadToml:
+    """Tests for read_toml cache."""
+
+    def test_reuses_parse_while_unchanged(self, tmp_path: Path) -> None:
+        """An unchanged file is parsed once."""
+        path = tmp_path / "config.toml"
+        path.write_text('channel_id = "UC1"\n')
+
+        with patch("ytrix.config.tomllib.load", wraps=tomllib.load) as mock_load:
+            first = read_toml(path)
+            second = read_toml(path)
+        assert first == {"channel_id": "UC1"}
+        assert second is first
+        mock_load.assert_called_once()
+
+    def test_reparses_after_change(self, tmp_path: Path) -> None:
+        """Rewriting the file invalidates the cached parse."""
+        import os
+
+        path = tmp_path / "config.toml"
+        path.write_text('channel_id = "UC1"\n')
+        assert read_toml(path) == {"channel_id": "UC1"}
+
+        path.write_text('channel_id = "UC22"\n')
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert read_toml(path) == {"channel_id": "UC22"}
+
+
+class TestAppendProject:
+    """Tests for append_project."""
+
+    def test_appends_entry_and_keeps_existing_text(self, tmp_path: Path) -> None:
+        """Existing content (incl. comments) is kept and the new project parses back."""
+        path = tmp_path / "config.toml"
+        path.write_text('# my channel\nchannel_id = "UC1"\n')
+        path.chmod(0o600)
+
+        append_project(path, {"name": "backup", "client_secret": 'a"b\\c\n', "priority": 2})
+
+        text = path.read_text()
+        assert text.startswith('# my channel\nchannel_id = "UC1"\n\n[[projects]]\n')
+        data = tomllib.loads(text)
+        assert data["projects"] == [{"name": "backup", "client_secret": 'a"b\\c\n', "priority": 2}]
+        assert path.stat().st_mode & 0o777 == 0o600
+        assert [p.name for p in tmp_path.iterdir()] == ["config.toml"]
+
+    def test_symlinked_config_keeps_symlink(self, tmp_path: Path) -> None:
+        """A symlinked config.toml stays a symlink and its target gets the entry."""
+        target = tmp_path / "dotfiles" / "config.toml"
+        target.parent.mkdir()
+        target.write_text('channel_id = "UC1"\n')
+        link = tmp_path / "config.toml"
+        link.symlink_to(target)
+
+        append_project(link, {"name": "backup"})
+
+        assert link.is_symlink()
+        assert tomllib.loads(target.read_text())["projects"] == [{"name": "backup"}]
+        assert [p.name for p in target.parent.iterdir()] == ["config.toml"]
+
+    def test_temp_file_removed_on_write_failure(self, tmp_path: Path) -> None:
+        """If the replace fails, no temp file is left next to the config."""
+        path = tmp_path / "config.toml"
+        path.write_text('channel_id = "UC1"\n')
+
+        with (
+            patch("ytrix.config.os.replace", side_effect=OSError("disk full")),
+            pytest.raises(OSError, match="disk full"),
+        ):
+            append_project(path, {"name": "x"})
+        assert [p.name for p in tmp_path.iterdir()] == ["config.toml"]
+        assert path.read_text() == 'channel_id = "UC1"\n'
+
+    def test_invalid_existing_config_is_left_untouched(self, tmp_path: Path) -> None:
+        """If the result would not parse, the original file is not replaced."""
+        path = tmp_path / "config.toml"
+        path.write_text("not valid [ toml")
+
+        with pytest.raises(tomllib.TOMLDecodeError):
+            append_project(path, {"name": "x"})
+        assert path.read_text() == "not valid [ toml"
+
+
 class TestLoadConfig:
     """Tests for load_config function."""
 
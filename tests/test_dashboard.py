@@ -8,6 +8,7 @@ from io import StringIO
 from unittest.mock import patch
 from zoneinfo import ZoneInfo
 
+import pytest
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -206,6 +207,60 @@ class TestCreateOperationsTable:
         assert "FREE" in output
 
 
+class TestCreateProjectsTable:
+    """Tests for create_projects_table()."""
+
+    @staticmethod
+    def _project(name: str, used: int = 0, **extra) -> dict:
+        return {
+            "name": name,
+            "current": False,
+            "quota_group": "default",
+            "environment": "prod",
+            "quota_used": used,
+            "quota_remaining": 10000 - used,
+            "quota_limit": 10000,
+            "is_exhausted": False,
+            **extra,
+        }
+
+    def test_one_row_per_project(self):
+        """Adds a row for each project under Group/Name/Quota/Status columns."""
+        result = dashboard.create_projects_table([self._project("a"), self._project("b")])
+        assert [col.header for col in result.columns] == ["Group", "Name", "Quota", "Status"]
+        assert result.row_count == 2
+
+    @pytest.mark.parametrize(
+        ("used", "color"),
+        [
+            (0, "green"),
+            (6999, "green"),
+            (7000, "yellow"),
+            (8999, "yellow"),
+            (9000, "red"),
+            (12000, "red"),
+        ],
+    )
+    def test_quota_color_thresholds(self, used, color):
+        """Quota turns yellow at 70% and red at 90%."""
+        result = dashboard.create_projects_table([self._project("p", used=used)])
+        assert next(iter(result.columns[2].cells)).startswith(f"[{color}]")
+
+    def test_renders_status_and_environment(self):
+        """Shows active/exhausted status and non-prod environment tags."""
+        projects = [
+            self._project("main", used=9500, current=True),
+            self._project("spare", used=10000, environment="dev", is_exhausted=True),
+        ]
+        console = Console(file=StringIO(), width=120)
+        console.print(dashboard.create_projects_table(projects))
+        output = console.file.getvalue()
+        assert "ACTIVE" in output
+        assert "exhausted" in output
+        assert "[dev]" in output
+        assert "9,500 / 10,000 (500 remaining)" in output
+
+
 class TestShowQuotaWarning:
     """Tests for show_quota_warning()."""
 
@@ -1,7 +1,10 @@
 """Tests for ytrix.dedup module."""
 
+from collections.abc import Iterator
 from unittest.mock import patch
 
+import pytest
+
 from ytrix import dedup
 from ytrix.dedup import (
     MatchResult,
@@ -13,6 +16,13 @@ from ytrix.dedup import (
 from ytrix.models import Playlist, Video
 
 
+@pytest.fixture(autouse=True)
+def _no_target_memo() -> Iterator[None]:
+    """Start every test without target playlists loaded by an earlier one."""
+    with patch.dict(dedup._target_playlists, clear=True):
+        yield
+
+
 class TestCalculateOverlap:
     """Tests for calculate_overlap function."""
 
@@ -217,7 +227,7 @@ class TestLoadTargetPlaylistsWithVideos:
             return_value=mock_playlists,
         ) as mock_extract:
             result = dedup.load_target_playlists_with_videos("UC123")
-            mock_extract.assert_called_once_with("UC123")
+            mock_extract.assert_called_once_with("UC123", use_cache=True)
             assert len(result) == 2
             assert result[0].id == "PL1"
 
@@ -229,3 +239,37 @@ class TestLoadTargetPlaylistsWithVideos:
         ):
             result = dedup.load_target_playlists_with_videos("UC123")
             assert result == []
+
+    def test_reuses_playlists_within_process(self) -> None:
+        """A second call for the same channel does not rescan it."""
+        playlists = [Playlist(id="PL1", title="Test 1")]
+        with patch(
+            "ytrix.dedup.extractor.extract_channel_playlists_with_videos",
+            return_value=playlists,
+        ) as mock_extract:
+            first = dedup.load_target_playlists_with_videos("UC123")
+            second = dedup.load_target_playlists_with_videos("UC123")
+        assert first is second is playlists
+        mock_extract.assert_called_once()
+
+    def test_refresh_bypasses_both_caches(self) -> None:
+        """refresh=True rescans without the memo or the extractor's disk cache."""
+        with patch(
+            "ytrix.dedup.extractor.extract_channel_playlists_with_videos", return_value=[]
+        ) as mock_extract:
+            dedup.load_target_playlists_with_videos("UC123")
+            dedup.load_target_playlists_with_videos("UC123", refresh=True)
+        assert mock_extract.call_args_list[-1].kwargs == {"use_cache": False}
+        assert mock_extract.call_count == 2
+
+    def test_failure_and_forget_are_not_remembered(self) -> None:
+        """Failed loads aren't kept, and forget_target_playlists drops a kept one."""
+        with patch(
+            "ytrix.dedup.extractor.extract_channel_playlists_with_videos",
+            side_effect=[Exception("Network error"), [], []],
+        ) as mock_extract:
+            assert dedup.load_target_playlists_with_videos("UC123") == []
+            dedup.load_target_playlists_with_videos("UC123")
+            dedup.forget_target_playlists("UC123")
+            dedup.load_target_playlists_with_videos("UC123")
+        assert mock_extract.call_count == 3
@@ -0,0 +1,197 @@
+"""Tests for ytrix.gcptrix."""
+
+import json
+import os
+import subprocess
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ytrix import gcptrix
+
+
+@pytest.fixture(autouse=True)
+def config_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Point the auth cache and gcloud's config at temp dirs, with no in-process memo."""
+    gcloud_dir = tmp_path / "gcloud"
+    (gcloud_dir / "configurations").mkdir(parents=True)
+    (gcloud_dir / "configurations" / "config_default").write_text("[core]\n")
+    monkeypatch.setenv("CLOUDSDK_CONFIG", str(gcloud_dir))
+    monkeypatch.delenv("CLOUDSDK_ACTIVE_CONFIG_NAME", raising=False)
+    monkeypatch.delenv("CLOUDSDK_CORE_ACCOUNT", raising=False)
+    with (
+        patch("ytrix.config.get_config_dir", return_value=tmp_path),
+        patch.object(gcptrix, "_auth_memo", None),
+    ):
+        yield tmp_path
+
+
+def _fake_gcloud(account: str = "me@example.com"):
+    """run_gcloud_command stand-in that answers the two auth probes."""
+
+    def run(command: list[str], dry_run: bool = False, allow_failure: bool = False) -> str:
+        return account if command[1:3] == ["config", "get-value"] else "token"
+
+    return run
+
+
+class TestCheckGcloudInstalled:
+    """Tests for check_gcloud_installed()."""
+
+    def test_memoized_per_process(self) -> None:
+        """shutil.which runs once per process."""
+        gcptrix.check_gcloud_installed.cache_clear()
+        try:
+            with patch("ytrix.gcptrix.shutil.which", return_value="/bin/gcloud") as mock_which:
+                assert gcptrix.check_gcloud_installed() is True
+                assert gcptrix.check_gcloud_installed() is True
+            mock_which.assert_called_once_with("gcloud")
+        finally:
+            gcptrix.check_gcloud_installed.cache_clear()
+
+
+class TestCheckAuthentication:
+    """Tests for check_authentication() caching."""
+
+    def test_success_is_written_and_reused(self, config_dir: Path) -> None:
+        """A successful check is stored on disk and reused without gcloud."""
+        with patch("ytrix.gcptrix.run_gcloud_command", side_effect=_fake_gcloud()) as mock_run:
+            first = gcptrix.check_authentication()
+            second = gcptrix.check_authentication()
+        assert first == second == {"account": "me@example.com", "authenticated": True}
+        assert mock_run.call_count == 2  # both probes, once
+        assert json.loads((config_dir / "gcloud_auth.json").read_text())["account"] == (
+            "me@example.com"
+        )
+
+    def test_fresh_disk_cache_skips_gcloud(self, config_dir: Path) -> None:
+        """A recent on-disk result from an earlier run is used as-is."""
+        (config_dir / "gcloud_auth.json").write_text(
+            json.dumps(
+                {
+                    "account": "cached@example.com",
+                    "state": gcptrix._gcloud_state(),
+                    "ts": time.time() - 10,
+                }
+            )
+        )
+        with patch("ytrix.gcptrix.run_gcloud_command") as mock_run:
+            result = gcptrix.check_authentication()
+        assert result["account"] == "cached@example.com"
+        mock_run.assert_not_called()
+
+    def test_expired_disk_cache_runs_gcloud(self, config_dir: Path) -> None:
+        """An entry older than AUTH_CACHE_TTL is ignored."""
+        (config_dir / "gcloud_auth.json").write_text(
+            json.dumps(
+                {
+                    "account": "old@example.com",
+                    "state": gcptrix._gcloud_state(),
+                    "ts": time.time() - gcptrix.AUTH_CACHE_TTL - 1,
+                }
+            )
+        )
+        with patch("ytrix.gcptrix.run_gcloud_command", side_effect=_fake_gcloud()) as mock_run:
+            result = gcptrix.check_authentication()
+        assert result["account"] == "me@example.com"
+        assert mock_run.call_count == 2
+
+    @pytest.mark.parametrize("content", ["not json", "{}", '{"account": "", "ts": 0}', "[]"])
+    def test_corrupt_disk_cache_runs_gcloud(self, config_dir: Path, content: str) -> None:
+        """Unreadable or incomplete cache files fall back to probing gcloud."""
+        (config_dir / "gcloud_auth.json").write_text(content)
+        with patch("ytrix.gcptrix.run_gcloud_command", side_effect=_fake_gcloud()) as mock_run:
+            result = gcptrix.check_authentication()
+        assert result["account"] == "me@example.com"
+        assert mock_run.call_count == 2
+
+    def test_use_cache_false_always_probes(self, config_dir: Path) -> None:
+        """use_cache=False ignores both the memo and the disk cache."""
+        with patch("ytrix.gcptrix.run_gcloud_command", side_effect=_fake_gcloud()) as mock_run:
+            gcptrix.check_authentication()
+            gcptrix.check_authentication(use_cache=False)
+        assert mock_run.call_count == 4
+
+    def test_failure_is_not_cached(self, config_dir: Path) -> None:
+        """A failed check raises and writes no cache entry."""
+        with (
+            patch("ytrix.gcptrix.run_gcloud_command", side_effect=_fake_gcloud("(unset)")),
+            pytest.raises(gcptrix.AuthenticationError),
+        ):
+            gcptrix.check_authentication()
+        assert not (config_dir / "gcloud_auth.json").exists()
+
+    def test_account_switch_invalidates_cache(self, config_dir: Path) -> None:
+        """`gcloud config set account` rewrites the configuration, so gcloud is asked again."""
+        with patch("ytrix.gcptrix.run_gcloud_command", side_effect=_fake_gcloud()):
+            gcptrix.check_authentication()
+        config_file = config_dir / "gcloud" / "configurations" / "config_default"
+        config_file.write_text("[core]\naccount = other@example.com\n")
+        os.utime(config_file, ns=(0, config_file.stat().st_mtime_ns + 1_000_000))
+
+        with patch(
+            "ytrix.gcptrix.run_gcloud_command", side_effect=_fake_gcloud("other@example.com")
+        ) as mock_run:
+            result = gcptrix.check_authentication()
+        assert result["account"] == "other@example.com"
+        assert mock_run.call_count == 2
+
+    @pytest.mark.parametrize(
+        ("env", "value"),
+        [("CLOUDSDK_ACTIVE_CONFIG_NAME", "work"), ("CLOUDSDK_CONFIG", "/elsewhere")],
+    )
+    def test_config_switch_invalidates_cache(
+        self, monkeypatch: pytest.MonkeyPatch, env: str, value: str
+    ) -> None:
+        """A different gcloud configuration or config dir does not reuse the check."""
+        with patch("ytrix.gcptrix.run_gcloud_command", side_effect=_fake_gcloud()):
+            gcptrix.check_authentication()
+        monkeypatch.setenv(env, value)
+        with patch("ytrix.gcptrix.run_gcloud_command", side_effect=_fake_gcloud()) as mock_run:
+            gcptrix.check_authentication()
+        assert mock_run.call_count == 2
+
+    def test_failed_check_clears_cache(self, config_dir: Path) -> None:
+        """An AuthenticationError drops an earlier successful check."""
+        with patch("ytrix.gcptrix.run_gcloud_command", side_effect=_fake_gcloud()):
+            gcptrix.check_authentication()
+        with (
+            patch("ytrix.gcptrix.run_gcloud_command", side_effect=_fake_gcloud("(unset)")),
+            pytest.raises(gcptrix.AuthenticationError),
+        ):
+            gcptrix.check_authentication(use_cache=False)
+        assert gcptrix._auth_memo is None
+        assert not (config_dir / "gcloud_auth.json").exists()
+
+    def test_gcloud_auth_error_clears_cache(self, config_dir: Path) -> None:
+        """A gcloud command failing with an auth error drops the cached check."""
+        with patch("ytrix.gcptrix.run_gcloud_command", side_effect=_fake_gcloud()):
+            gcptrix.check_authentication()
+        error = subprocess.CalledProcessError(
+            1, ["gcloud"], stderr="ERROR: Reauthentication failed. Please run: gcloud auth login"
+        )
+        with (
+            patch("ytrix.gcptrix.subprocess.run", side_effect=error),
+            pytest.raises(gcptrix.GcloudError),
+        ):
+            gcptrix.run_gcloud_command(["gcloud", "projects", "list"])
+        assert gcptrix._auth_memo is None
+        assert not (config_dir / "gcloud_auth.json").exists()
+
+
+class TestGetEnabledServices:
+    """Tests for get_enabled_services()."""
+
+    def test_returns_enabled_services_sorted(self) -> None:
+        """Only ENABLED services are returned, sorted once here for every caller."""
+        listing = [
+            {"config": {"name": "youtube.googleapis.com"}, "state": "ENABLED"},
+            {"config": {"name": "bigquery.googleapis.com"}, "state": "DISABLED"},
+            {"config": {"name": "drive.googleapis.com"}, "state": "ENABLED"},
+        ]
+        with patch("ytrix.gcptrix.run_gcloud_command", return_value=json.dumps(listing)):
+            services = gcptrix.get_enabled_services("proj")
+        assert services == ["drive.googleapis.com", "youtube.googleapis.com"]
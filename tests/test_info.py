@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+import yaml
 
 from ytrix import info
 
@@ -57,6 +60,21 @@ class TestSanitizeFilename:
     def test_preserves_valid_chars(self) -> None:
         assert info._sanitize_filename("Valid-Title_123") == "Valid-Title_123"
 
+    def test_replaces_every_unsafe_char(self) -> None:
+        assert info._sanitize_filename('a<b>c:d"e/f\\g|h?i*j') == "a_b_c_d_e_f_g_h_i_j"
+
+
+class TestTranscriptTags:
+    """Tag stripping in the subtitle-to-transcript converters."""
+
+    def test_srt_strips_tags(self) -> None:
+        srt = '1\n00:00:00,000 --> 00:00:01,000\n<font color="#CCC">Hi</font> a < b\n'
+        assert info.srt_to_transcript(srt) == "Hi a < b"
+
+    def test_vtt_strips_cue_tags(self) -> None:
+        vtt = "WEBVTT\n\n00:00.000 --> 00:01.000\n<c.colorE5E5E5>Hello</c> there\n"
+        assert info.vtt_to_transcript(vtt) == "Hello there"
+
 
 class TestVideoFilename:
     """Tests for _video_filename function."""
@@ -250,6 +268,21 @@ class TestCreateVideoMarkdown:
         # Description should be truncated to ~500 chars plus "..."
         assert "AAAAAAA" in result
 
+    def test_frontmatter_loads_back(self) -> None:
+        """Unicode, quotes and multi-line descriptions survive the YAML dumper."""
+        video = info.VideoInfo(
+            id="abc123",
+            title='Título: "quoted" 中文',
+            description="line one\nline two: #tag",
+            channel="Chan'nel",
+            duration=60,
+        )
+        result = info.create_video_markdown(video, "en", "Content.")
+        frontmatter = yaml.safe_load(result.split("---\n")[1])
+        assert frontmatter["title"] == video.title
+        assert frontmatter["description"] == video.description
+        assert frontmatter["channel"] == video.channel
+
     def test_includes_transcript(self) -> None:
         video = info.VideoInfo(
             id="abc123",
@@ -520,6 +553,45 @@ class TestDownloadSubtitle:
         finally:
             info._subtitle_throttler = original_throttler
 
+    def test_direct_url_reuses_one_ytdlp_per_thread(self) -> None:
+        """SRT/VTT tracks with a URL are fetched over one long-lived YoutubeDL."""
+        mock_ydl = MagicMock()
+        mock_ydl.urlopen.return_value.__enter__.return_value.read.return_value = b"WEBVTT"
+        with (
+            patch.object(info, "_subtitle_throttler", info.Throttler(delay_ms=0)),
+            patch.object(info, "_subtitle_ydl_local", threading.local()),
+            patch("ytrix.info.YoutubeDL", return_value=mock_ydl) as mock_ydl_class,
+        ):
+            for lang in ("en", "de"):
+                sub = info.SubtitleInfo(
+                    lang=lang, source="manual", ext="vtt", url=f"https://s/{lang}"
+                )
+                assert info.download_subtitle(sub, video_id="test123") == "WEBVTT"
+
+        mock_ydl_class.assert_called_once()
+        assert [c.args[0] for c in mock_ydl.urlopen.call_args_list] == [
+            "https://s/en",
+            "https://s/de",
+        ]
+        mock_ydl.download.assert_not_called()
+
+    def test_direct_url_failure_falls_back_to_download(self) -> None:
+        """A direct fetch that fails for a non-rate-limit reason re-extracts via yt-dlp."""
+        pooled = MagicMock()
+        pooled.urlopen.side_effect = Exception("HTTP Error 403: Forbidden")
+        downloader = MagicMock()
+        downloader.__enter__.return_value.download.side_effect = lambda _urls: None
+        with (
+            patch.object(info, "_subtitle_throttler", info.Throttler(delay_ms=0)),
+            patch.object(info, "_subtitle_ydl_local", threading.local()),
+            patch("ytrix.info.YoutubeDL", side_effect=[pooled, downloader]),
+        ):
+            sub = info.SubtitleInfo(lang="en", source="manual", ext="vtt", url="https://s/en")
+            assert info.download_subtitle(sub, video_id="test123") is None
+
+        pooled.urlopen.assert_called_once()
+        downloader.__enter__.return_value.download.assert_called_once()
+
 
 class TestExtractAndSavePlaylistInfo:
     """Tests for extract_and_save_playlist_info function."""
@@ -588,6 +660,121 @@ class TestExtractAndSavePlaylistInfo:
         assert "id: v1" in md_content
         assert "Hello world." in md_content
 
+    @patch("ytrix.info.download_subtitle")
+    @patch("ytrix.info.extract_video_info")
+    @patch("ytrix.info.extract_playlist_info")
+    def test_skips_subtitles_already_saved(
+        self,
+        mock_extract_playlist: MagicMock,
+        mock_extract_video: MagicMock,
+        mock_download_sub: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Only languages missing either output file are downloaded again."""
+        video = info.VideoInfo(id="v1", title="Video 1", description="", channel="C", duration=60)
+        mock_extract_playlist.return_value = info.PlaylistInfo(
+            id="PLxxx", title="Test Playlist", description="", channel="C", videos=[video]
+        )
+        mock_extract_video.return_value = info.VideoInfo(
+            id="v1",
+            title="Video 1",
+            description="",
+            channel="C",
+            duration=60,
+            subtitles=[
+                info.SubtitleInfo(lang="de", source="manual", ext="srt"),
+                info.SubtitleInfo(lang="en", source="manual", ext="srt"),
+            ],
+        )
+        mock_download_sub.return_value = "1\n00:00:00,000 --> 00:00:02,000\nHallo"
+        folder = tmp_path / "Test Playlist"
+        folder.mkdir()
+        (folder / "001_Video 1.en.srt").write_text("old")
+        (folder / "001_Video 1.en.md").write_text("old")
+        (folder / "001_Video 1.de.srt").write_text("old")
+
+        info.extract_and_save_playlist_info("PLxxx", tmp_path)
+
+        assert [c.args[0].lang for c in mock_download_sub.call_args_list] == ["de"]
+        assert (folder / "001_Video 1.en.srt").read_text() == "old"
+
+    @patch("ytrix.info.extract_videos_parallel")
+    @patch("ytrix.info.extract_playlist_info")
+    def test_parallel_downloads_subtitles_concurrently(
+        self, mock_extract_playlist: MagicMock, mock_extract_parallel: MagicMock, tmp_path: Path
+    ) -> None:
+        """With parallel extraction, subtitle downloads overlap and all get saved."""
+        videos = [
+            info.VideoInfo(id=vid, title=vid, description="", channel="C", duration=1)
+            for vid in ("v1", "v2")
+        ]
+        mock_extract_playlist.return_value = info.PlaylistInfo(
+            id="PLxxx", title="P", description="", channel="C", videos=videos
+        )
+        sub = info.SubtitleInfo(lang="en", source="manual", ext="srt", url="")
+        full = {
+            v.id: info.VideoInfo(
+                id=v.id, title=v.id, description="", channel="C", duration=1, subtitles=[sub]
+            )
+            for v in videos
+        }
+        mock_extract_parallel.return_value = (full, [])
+        both_running = threading.Barrier(2, timeout=5)
+
+        def download(sub: info.SubtitleInfo, video_id: str) -> str:
+            both_running.wait()  # Fails with BrokenBarrierError if run one at a time
+            return f"1\n00:00:00,000 --> 00:00:01,000\n{video_id} text"
+
+        with (
+            patch("ytrix.info.download_subtitle", side_effect=download),
+            patch("ytrix.info.MAX_PARALLEL_WORKERS", 2),
+        ):
+            info.extract_and_save_playlist_info("PLxxx", tmp_path, parallel=True)
+
+        folder = tmp_path / "P"
+        assert "v1 text" in (folder / "001_v1.en.srt").read_text()
+        assert "v2 text" in (folder / "002_v2.en.md").read_text()
+
+
+class TestDownloadVideosBatch:
+    """Tests for download_videos_batch function."""
+
+    def _tasks(self, tmp_path: Path) -> list[info.VideoDownloadTask]:
+        (tmp_path / "v0.mp4").write_text("")  # Already downloaded
+        return [
+            info.VideoDownloadTask(video_id=f"v{i}", output_path=tmp_path / f"v{i}", title=f"T{i}")
+            for i in range(3)
+        ]
+
+    def test_proxy_downloads_in_parallel(self, tmp_path: Path) -> None:
+        """Through the proxy, pending downloads overlap; existing files count as done."""
+        both_running = threading.Barrier(2, timeout=5)
+
+        def download(video_id: str, output_path: Path, lang: str, use_proxy: bool) -> bool:
+            both_running.wait()  # Fails with BrokenBarrierError if run one at a time
+            return video_id == "v1"
+
+        with (
+            patch("ytrix.info._proxy_url", "http://proxy"),
+            patch("ytrix.info.MAX_PARALLEL_WORKERS", 2),
+            patch("ytrix.info.download_video", side_effect=download) as mock_download,
+        ):
+            result = info.download_videos_batch(self._tasks(tmp_path), use_proxy=True)
+
+        assert result == (2, 1)
+        assert sorted(c.args[0] for c in mock_download.call_args_list) == ["v1", "v2"]
+
+    def test_direct_downloads_are_sequential(self, tmp_path: Path) -> None:
+        """Without the proxy, videos download one at a time, in order."""
+        with (
+            patch("ytrix.info.MAX_PARALLEL_WORKERS", 4),
+            patch("ytrix.info.download_video", return_value=True) as mock_download,
+        ):
+            result = info.download_videos_batch(self._tasks(tmp_path), use_proxy=False)
+
+        assert result == (3, 0)
+        assert [c.args[0] for c in mock_download.call_args_list] == ["v1", "v2"]
+
 
 class TestThrottler:
     """Tests for Throttler class."""
@@ -633,6 +820,50 @@ class TestThrottler:
         throttler.on_error(is_rate_limit=True)
         assert throttler._delay_ms == 30000  # Capped
 
+    def test_wait_spaces_concurrent_callers(self) -> None:
+        """Threads sharing a throttler each get their own start slot."""
+        throttler = info.Throttler(delay_ms=50)
+        throttler.wait()  # Next slot is now 50ms away for everyone
+        starts: list[float] = []
+
+        def call() -> None:
+            throttler.wait()
+            starts.append(time.monotonic())
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        starts.sort()
+        assert all(b - a >= 0.045 for a, b in zip(starts, starts[1:], strict=False))
+
+    @patch("ytrix.info.random.uniform", return_value=0)
+    @patch("ytrix.info.time.sleep")
+    def test_burst_starts_back_to_back_then_paces(
+        self, mock_sleep: MagicMock, _mock_uniform: MagicMock
+    ) -> None:
+        """After idling, burst calls start without sleeping; the next one waits."""
+        throttler = info.Throttler(delay_ms=10_000, burst=3)
+        for _ in range(3):
+            throttler.wait()
+        mock_sleep.assert_not_called()
+
+        throttler.wait()
+        assert mock_sleep.call_args.args[0] == pytest.approx(10.0, abs=0.1)
+
+    @patch("ytrix.info.random.uniform", return_value=0)
+    @patch("ytrix.info.time.sleep")
+    def test_rate_limit_drops_saved_burst(
+        self, mock_sleep: MagicMock, _mock_uniform: MagicMock
+    ) -> None:
+        """A 429 makes the very next call wait a full (backed-off) delay."""
+        throttler = info.Throttler(delay_ms=100, burst=3)
+        throttler.on_error(is_rate_limit=True)
+        throttler.wait()
+        assert mock_sleep.call_args.args[0] == pytest.approx(1.2, abs=0.05)
+
     def test_get_retry_delay_exponential(self) -> None:
         throttler = info.Throttler(delay_ms=100)
         # Base delays: 2^0=1? No, 2^attempt, so 2, 4, 8, 16, 32, 60
@@ -1,5 +1,7 @@
 """Tests for ytrix.journal module."""
 
+import os
+import stat
 from pathlib import Path
 from unittest.mock import patch
 
@@ -157,6 +159,58 @@ class TestJournalPersistence:
         clear_journal()
         assert not (temp_journal_dir / "journal.json").exists()
 
+    def test_save_is_private_and_leaves_no_temp_file(self, temp_journal_dir: Path) -> None:
+        """The journal is written 0o600 with no temporary sibling left behind."""
+        save_journal(Journal(batch_id="test", created_at="2024", tasks=[]))
+
+        assert [p.name for p in temp_journal_dir.iterdir()] == ["journal.json"]
+        assert (temp_journal_dir / "journal.json").stat().st_mode & 0o777 == 0o600
+
+    def test_save_fsyncs_file_then_directory(self, temp_journal_dir: Path) -> None:
+        """Both the data and the rename are flushed to disk."""
+        synced: list[bool] = []
+        real_fsync = os.fsync
+
+        def fsync(fd: int) -> None:
+            synced.append(stat.S_ISDIR(os.fstat(fd).st_mode))
+            real_fsync(fd)
+
+        with patch("ytrix.journal.os.fsync", side_effect=fsync):
+            save_journal(Journal(batch_id="test", created_at="2024", tasks=[]))
+
+        assert synced == [False, True]
+
+    def test_save_without_directory_fds(self, temp_journal_dir: Path) -> None:
+        """Where directories can't be opened (Windows), the save still succeeds."""
+        real_open = os.open
+
+        def open_(path: str, flags: int, *args: int) -> int:
+            if Path(path).is_dir():
+                raise PermissionError("directory")
+            return real_open(path, flags, *args)
+
+        with patch("ytrix.journal.os.open", side_effect=open_):
+            save_journal(Journal(batch_id="test", created_at="2024", tasks=[]))
+
+        loaded = load_journal()
+        assert loaded is not None
+        assert loaded.batch_id == "test"
+
+    def test_failed_save_keeps_previous_journal(self, temp_journal_dir: Path) -> None:
+        """A write that fails midway leaves the old journal readable."""
+        save_journal(Journal(batch_id="old", created_at="2024", tasks=[]))
+
+        with (
+            patch("ytrix.journal.json.dump", side_effect=OSError("disk full")),
+            pytest.raises(OSError),
+        ):
+            save_journal(Journal(batch_id="new", created_at="2024", tasks=[]))
+
+        loaded = load_journal()
+        assert loaded is not None
+        assert loaded.batch_id == "old"
+        assert [p.name for p in temp_journal_dir.iterdir()] == ["journal.json"]
+
     def test_clear_journal_when_missing(self, temp_journal_dir: Path) -> None:
         """Clear doesn't fail when file missing."""
         clear_journal()  # Should not raise
@@ -212,6 +266,16 @@ class TestUpdateTask:
         assert loaded is not None
         assert loaded.tasks[0].videos_added == 5
 
+    def test_save_false_defers_write(self, temp_journal_dir: Path) -> None:
+        """save=False updates in memory only, leaving the write to the caller."""
+        journal = create_journal([("PL1", "Test")])
+        update_task(journal, "PL1", videos_added=5, save=False)
+
+        assert journal.tasks[0].videos_added == 5
+        loaded = load_journal()
+        assert loaded is not None
+        assert loaded.tasks[0].videos_added == 0
+
     def test_updates_error(self, temp_journal_dir: Path) -> None:
         """Updates error field."""
         journal = create_journal([("PL1", "Test")])
@@ -47,6 +47,18 @@ class TestVideo:
         assert video.title == ""
         assert video.channel == ""
 
+    def test_from_dict_interns_id_and_channel(self) -> None:
+        """Video.from_dict shares one string object per distinct ID/channel."""
+        a = Video.from_dict({"id": "".join(["ab", "c"]), "channel": "".join(["Ch", "1"])})
+        b = Video.from_dict({"id": "".join(["a", "bc"]), "channel": "".join(["C", "h1"])})
+        assert a.id is b.id
+        assert a.channel is b.channel
+
+    def test_from_dict_tolerates_null_channel(self) -> None:
+        """Non-string values (e.g. YAML null) are passed through unchanged."""
+        video = Video.from_dict({"id": "abc", "channel": None})
+        assert video.channel is None
+
 
 class TestPlaylist:
     """Tests for Playlist dataclass."""
@@ -100,6 +112,26 @@ class TestPlaylist:
         assert playlist.videos[0].id == "v1"
         assert playlist.videos[1].position == 1  # Auto-assigned
 
+    def test_from_dict_position_follows_list_order(self) -> None:
+        """Playlist.from_dict ignores stale stored positions in favor of list order."""
+        data = {
+            "id": "PL789",
+            "title": "Reordered",
+            "videos": [
+                {"id": "v2", "position": 1},
+                {"id": "v1", "position": 0},
+            ],
+        }
+        playlist = Playlist.from_dict(data)
+        assert [(v.id, v.position) for v in playlist.videos] == [("v2", 0), ("v1", 1)]
+
+    def test_models_use_slots(self) -> None:
+        """Playlist and Video are slotted (no per-instance __dict__)."""
+        video = Video(id="v1", title="V", channel="Ch", position=0)
+        playlist = Playlist(id="PL1", title="T", videos=[video])
+        assert not hasattr(video, "__dict__")
+        assert not hasattr(playlist, "__dict__")
+
 
 class TestExtractPlaylistId:
     """Tests for extract_playlist_id function."""
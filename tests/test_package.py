@@ -69,3 +69,12 @@ def test_format_duration_exported() -> None:
     assert format_duration(0) == "0:00"
     assert format_duration(65) == "1:05"
     assert format_duration(3661) == "1:01:01"
+
+
+def test_import_does_not_load_info() -> None:
+    """Importing ytrix defers loading ytrix.info until format_duration is used."""
+    import subprocess
+
+    code = "import sys, ytrix; print('ytrix.info' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.stdout.strip() == "False"
@@ -601,13 +601,41 @@ class TestGetClient:
             patch.object(ProjectManager, "get_credentials", return_value=mock_creds),
             patch("ytrix.projects._create_proxied_http", return_value=mock_http),
             patch("google_auth_httplib2.AuthorizedHttp", return_value=mock_authed_http),
-            patch("googleapiclient.discovery.build", return_value=mock_client) as mock_build,
+            patch("ytrix.api.build_youtube", return_value=mock_client) as mock_build,
         ):
             manager = ProjectManager(config)
             result = manager.get_client()
-            mock_build.assert_called_once_with("youtube", "v3", http=mock_authed_http)
+            mock_build.assert_called_once_with(http=mock_authed_http)
             assert result is mock_client
 
+    def test_transport_reused_across_project_switch(self, tmp_path: Path) -> None:
+        """A new project gets a new client but keeps the same HTTP connections."""
+        config = Config(
+            channel_id="UC123",
+            projects=[
+                ProjectConfig(name="p1", client_id="id1", client_secret="s1"),
+                ProjectConfig(name="p2", client_id="id2", client_secret="s2", priority=1),
+            ],
+        )
+        mock_http = MagicMock()
+
+        with (
+            patch("ytrix.projects.get_config_dir", return_value=tmp_path),
+            patch.object(ProjectManager, "get_credentials", side_effect=["creds1", "creds2"]),
+            patch("ytrix.projects._create_proxied_http", return_value=mock_http) as mock_create,
+            patch("google_auth_httplib2.AuthorizedHttp") as mock_authed,
+            patch("ytrix.api.build_youtube", side_effect=[MagicMock(), MagicMock()]),
+        ):
+            manager = ProjectManager(config)
+            first = manager.get_client()
+            assert manager.handle_quota_exhausted()
+            second = manager.get_client()
+
+        assert first is not second
+        mock_create.assert_called_once()
+        assert [c.kwargs["http"] for c in mock_authed.call_args_list] == [mock_http, mock_http]
+        assert [c.args[0] for c in mock_authed.call_args_list] == ["creds1", "creds2"]
+
 
 class TestQuotaGroupHandling:
     """Tests for quota_group-based context switching (ToS compliance)."""
@@ -1,19 +1,50 @@
 """Tests for ytrix.yaml_ops."""
 
+import json
+import time
+from collections.abc import Iterator
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from ytrix.models import Playlist, Video
 from ytrix.yaml_ops import (
+    EXPORT_INDEX_TTL,
+    _longest_common_subsequence,
+    calculate_diff,
     diff_playlists,
+    load_export_index,
     load_yaml,
+    playlist_fingerprint,
     playlists_to_yaml,
+    record_exports,
     save_yaml,
     yaml_to_playlists,
 )
 
 
+@pytest.fixture(scope="session")
+def sample_playlists() -> list[Playlist]:
+    """Canonical playlists shared across tests (treat as read-only)."""
+    return [
+        Playlist(
+            id="PL123",
+            title="Test",
+            description="Desc",
+            privacy="unlisted",
+            videos=[Video(id="v1", title="Video", channel="Ch", position=0)],
+        ),
+        Playlist(id="PL456", title="Second"),
+    ]
+
+
+@pytest.fixture(scope="session")
+def sample_yaml(sample_playlists: list[Playlist]) -> str:
+    """YAML rendering of sample_playlists, serialized once per session."""
+    return playlists_to_yaml(sample_playlists, include_videos=True)
+
+
 class TestPlaylistsToYaml:
     """Tests for YAML serialization."""
 
@@ -24,23 +55,15 @@ class TestPlaylistsToYaml:
         assert "PL123" in yaml_str
         assert "Test" in yaml_str
 
-    def test_serializes_multiple_playlists(self) -> None:
+    def test_serializes_multiple_playlists(self, sample_yaml: str) -> None:
         """Serializes multiple playlists."""
-        playlists = [
-            Playlist(id="PL1", title="First"),
-            Playlist(id="PL2", title="Second"),
-        ]
-        yaml_str = playlists_to_yaml(playlists)
-        assert "PL1" in yaml_str
-        assert "PL2" in yaml_str
+        assert "PL123" in sample_yaml
+        assert "PL456" in sample_yaml
 
-    def test_includes_videos_when_requested(self) -> None:
+    def test_includes_videos_when_requested(self, sample_yaml: str) -> None:
         """Includes video details when include_videos=True."""
-        video = Video(id="v1", title="Video", channel="Ch", position=0)
-        playlist = Playlist(id="PL1", title="Test", videos=[video])
-        yaml_str = playlists_to_yaml([playlist], include_videos=True)
-        assert "v1" in yaml_str
-        assert "Video" in yaml_str
+        assert "v1" in sample_yaml
+        assert "Video" in sample_yaml
 
 
 class TestYamlToPlaylists:
@@ -75,6 +98,13 @@ playlists:
         assert len(playlists[0].videos) == 1
         assert playlists[0].videos[0].id == "v1"
 
+    def test_deserializes_fixture_yaml(self, sample_yaml: str) -> None:
+        """Deserializes playlists rendered by playlists_to_yaml."""
+        playlists = yaml_to_playlists(sample_yaml)
+        assert [p.id for p in playlists] == ["PL123", "PL456"]
+        assert playlists[0].privacy == "unlisted"
+        assert playlists[0].videos[0].channel == "Ch"
+
     def test_raises_on_invalid_yaml(self) -> None:
         """Raises ValueError on missing playlists key."""
         with pytest.raises(ValueError, match="missing 'playlists' key"):
@@ -84,27 +114,114 @@ playlists:
 class TestSaveLoadYaml:
     """Tests for file I/O."""
 
-    def test_round_trip(self, tmp_path: Path) -> None:
+    def test_round_trip(self, tmp_path: Path, sample_playlists: list[Playlist]) -> None:
         """Saving and loading produces equivalent data."""
-        original = [
-            Playlist(
-                id="PL123",
-                title="Test",
-                description="Desc",
-                privacy="unlisted",
-                videos=[Video(id="v1", title="Video", channel="Ch", position=0)],
-            )
-        ]
+        original = sample_playlists
         path = tmp_path / "test.yaml"
         save_yaml(path, original)
         loaded = load_yaml(path)
 
-        assert len(loaded) == 1
+        assert len(loaded) == 2
         assert loaded[0].id == original[0].id
         assert loaded[0].title == original[0].title
         assert len(loaded[0].videos) == 1
         assert loaded[0].videos[0].id == "v1"
 
+    @pytest.mark.parametrize("count", [0, 1, 2])
+    def test_streamed_file_matches_playlists_to_yaml(
+        self, tmp_path: Path, sample_playlists: list[Playlist], count: int
+    ) -> None:
+        """Writing one playlist at a time gives the same text as the one-shot dump."""
+        playlists = sample_playlists[:count]
+        path = tmp_path / "test.yaml"
+        save_yaml(path, iter(playlists))
+        assert path.read_text(encoding="utf-8") == playlists_to_yaml(playlists)
+
+    def test_each_playlist_written_before_the_next_is_requested(self, tmp_path: Path) -> None:
+        """A generator can free a playlist's videos right after it is yielded."""
+        path = tmp_path / "test.yaml"
+        playlists = [
+            Playlist(
+                id=pid, title=pid, videos=[Video(id=f"v{pid}", title="V", channel="C", position=0)]
+            )
+            for pid in ("PL1", "PL2")
+        ]
+
+        def produce():
+            for playlist in playlists:
+                yield playlist
+                playlist.videos = []
+
+        save_yaml(path, produce())
+        loaded = load_yaml(path)
+        assert [[v.id for v in p.videos] for p in loaded] == [["vPL1"], ["vPL2"]]
+        assert all(not p.videos for p in playlists)
+
+
+class TestPlaylistFingerprint:
+    """Tests for playlist_fingerprint()."""
+
+    def test_survives_yaml_round_trip(
+        self, tmp_path: Path, sample_playlists: list[Playlist]
+    ) -> None:
+        """An exported playlist loads back with the same fingerprint."""
+        path = tmp_path / "test.yaml"
+        save_yaml(path, sample_playlists)
+        loaded = load_yaml(path)
+        assert [playlist_fingerprint(p) for p in loaded] == [
+            playlist_fingerprint(p) for p in sample_playlists
+        ]
+
+    def test_changes_with_anything_diff_compares(self) -> None:
+        """Metadata edits and video reordering give a new fingerprint."""
+        videos = [Video(id=vid, title="V", channel="C", position=0) for vid in ("v1", "v2")]
+        base = Playlist(id="PL1", title="T", videos=videos)
+        variants = [
+            Playlist(id="PL1", title="T2", videos=videos),
+            Playlist(id="PL1", title="T", description="D", videos=videos),
+            Playlist(id="PL1", title="T", privacy="private", videos=videos),
+            Playlist(id="PL1", title="T", videos=videos[::-1]),
+            Playlist(id="PL1", title="T", videos=videos[:1]),
+        ]
+        fingerprints = {playlist_fingerprint(p) for p in [base, *variants]}
+        assert len(fingerprints) == len(variants) + 1
+
+
+class TestExportIndex:
+    """Tests for the record of exported playlist fingerprints."""
+
+    @pytest.fixture(autouse=True)
+    def config_dir(self, tmp_path: Path) -> Iterator[Path]:
+        """Point the export index at a temp dir."""
+        with patch("ytrix.yaml_ops.get_config_dir", return_value=tmp_path):
+            yield tmp_path
+
+    def test_record_and_load(self) -> None:
+        """Recorded fingerprints are merged into the index."""
+        record_exports({"PL1": "a"})
+        record_exports({"PL2": "b"})
+        assert load_export_index() == {"PL1": "a", "PL2": "b"}
+
+    def test_forget_drops_entries(self) -> None:
+        """IDs passed as forget are removed in the same write."""
+        record_exports({"PL1": "a", "PL2": "b"})
+        record_exports({"PL3": "c"}, forget=["PL1", "PLmissing"])
+        assert load_export_index() == {"PL2": "b", "PL3": "c"}
+
+    def test_expired_entries_ignored(self, config_dir: Path) -> None:
+        """Entries older than EXPORT_INDEX_TTL no longer count."""
+        old = time.time() - EXPORT_INDEX_TTL - 1
+        (config_dir / "yaml_exports.json").write_text(
+            json.dumps({"PL1": {"fingerprint": "a", "ts": old}})
+        )
+        assert load_export_index() == {}
+
+    @pytest.mark.parametrize("content", ["not json", "[]", '{"PL1": "a"}', '{"PL1": {}}'])
+    def test_unreadable_index_is_empty(self, config_dir: Path, content: str) -> None:
+        """A corrupt index is treated as empty rather than failing."""
+        (config_dir / "yaml_exports.json").write_text(content)
+        assert load_export_index() == {}
+
 
 class TestDiffPlaylists:
     """Tests for playlist diff detection."""
@@ -204,8 +321,6 @@ class TestCalculateDiff:
 
     def test_no_changes_returns_empty_diff(self) -> None:
         """Returns diff with no operations when playlists are identical."""
-        from ytrix.yaml_ops import calculate_diff
-
         current = Playlist(id="PL1", title="Test", description="Desc")
         desired = Playlist(id="PL1", title="Test", description="Desc")
         diff = calculate_diff(current, desired)
@@ -214,8 +329,6 @@ class TestCalculateDiff:
 
     def test_metadata_change_detected(self) -> None:
         """Detects title/description/privacy changes."""
-        from ytrix.yaml_ops import calculate_diff
-
         current = Playlist(id="PL1", title="Old", description="Old Desc", privacy="public")
         desired = Playlist(id="PL1", title="New", description="New Desc", privacy="private")
         diff = calculate_diff(current, desired)
@@ -228,8 +341,6 @@ class TestCalculateDiff:
 
     def test_video_removal_detected(self) -> None:
         """Detects videos to remove."""
-        from ytrix.yaml_ops import calculate_diff
-
         current = Playlist(
             id="PL1",
             title="Test",
@@ -249,8 +360,6 @@ class TestCalculateDiff:
 
     def test_video_addition_detected(self) -> None:
         """Detects videos to add with positions."""
-        from ytrix.yaml_ops import calculate_diff
-
         current = Playlist(
             id="PL1",
             title="Test",
@@ -270,8 +379,6 @@ class TestCalculateDiff:
 
     def test_reorder_uses_lcs_for_minimal_moves(self) -> None:
         """Uses LCS to minimize move operations."""
-        from ytrix.yaml_ops import calculate_diff
-
         current = Playlist(
             id="PL1",
             title="Test",
@@ -299,8 +406,6 @@ class TestCalculateDiff:
 
     def test_operation_count_is_correct(self) -> None:
         """operation_count sums all operations."""
-        from ytrix.yaml_ops import calculate_diff
-
         current = Playlist(id="PL1", title="Old")
         desired = Playlist(
             id="PL1",
@@ -310,3 +415,36 @@ class TestCalculateDiff:
         diff = calculate_diff(current, desired)
         # 1 metadata update + 1 video add = 2 operations
         assert diff.operation_count == 2
+
+    def test_identical_videos_only_diff_metadata(self) -> None:
+        """Identical video order yields no video operations."""
+        videos = [Video(id=f"v{i}", title="V", channel="Ch", position=i) for i in range(3)]
+        current = Playlist(id="PL1", title="Old", videos=list(videos))
+        desired = Playlist(id="PL1", title="New", videos=list(videos))
+        diff = calculate_diff(current, desired)
+        assert diff.update_metadata == {"title": "New"}
+        assert diff.videos_to_add == []
+        assert diff.videos_to_remove == []
+        assert diff.videos_to_move == []
+
+
+class TestLongestCommonSubsequence:
+    """Tests for the LCS helper used by calculate_diff."""
+
+    def test_permutation_path(self) -> None:
+        """Unique IDs in both lists use the LIS-based path."""
+        seq1, seq2 = list("ABCDEF"), list("BADCFE")
+        lcs = _longest_common_subsequence(seq1, seq2)
+        assert len(lcs) == 3
+        for seq in (seq1, seq2):
+            it = iter(seq)
+            assert all(vid in it for vid in lcs)
+
+    def test_duplicates_fall_back_to_dp(self) -> None:
+        """Duplicate IDs still produce a correct LCS."""
+        assert _longest_common_subsequence(list("AABC"), list("ABAC")) == ["A", "B", "C"]
+
+    def test_reversed_playlist_keeps_one(self) -> None:
+        """Fully reversed order leaves a single video in place."""
+        ids = [f"v{i}" for i in range(500)]
+        assert len(_longest_common_subsequence(ids, ids[::-1])) == 1
@@ -1,11 +1,24 @@
 """ytrix - YouTube playlist management CLI."""
 
-from ytrix.info import format_duration
+from typing import TYPE_CHECKING, Any
+
 from ytrix.models import InvalidPlaylistError, Playlist, Video
 
+if TYPE_CHECKING:
+    from ytrix.info import format_duration
+
 try:
     from ytrix._version import __version__
 except ImportError:
     __version__ = "0.0.0.dev0"
 
 __all__ = ["InvalidPlaylistError", "Playlist", "Video", "format_duration", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import format_duration lazily so `import ytrix` doesn't load yt-dlp via ytrix.info."""
+    if name == "format_duration":
+        from ytrix.info import format_duration
+
+        return format_duration
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,21 +1,29 @@
 """ytrix CLI - YouTube playlist management."""
 
-import contextlib
+import dataclasses
+import hashlib
+import importlib.util
 import json
-from collections import defaultdict
+import shutil
+import sys
+import threading
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterator
 from importlib import resources
 from pathlib import Path
-from typing import Any
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
 
-import fire
 from rich.console import Console
-from rich.progress import Progress
-from rich.prompt import Prompt
+from rich.prompt import Confirm, IntPrompt, Prompt
 
-from ytrix import __version__, api, cache, dashboard, extractor, info, quota, yaml_ops
-from ytrix.api import BatchAction, BatchOperationHandler, classify_error, display_error
-from ytrix.config import Config, get_config_dir, load_config
-from ytrix.dedup import MatchType, analyze_batch_deduplication, load_target_playlists_with_videos
+try:
+    import orjson
+except ImportError:  # optional speedup, installed with the "fast" extra
+    orjson = None  # type: ignore[assignment]
+
+from ytrix import __version__, quota
+from ytrix.config import Config, append_project, get_config_dir, load_config, read_toml
 from ytrix.journal import (
     Journal,
     TaskStatus,
@@ -24,20 +32,279 @@ from ytrix.journal import (
     get_journal_summary,
     get_pending_tasks,
     load_journal,
+    save_journal,
     update_task,
 )
 from ytrix.logging import configure_logging, logger
-from ytrix.models import Playlist, extract_playlist_id
+from ytrix.models import Playlist, Video, extract_playlist_id
 from ytrix.projects import get_project_manager
 from ytrix.quota import (
-    QuotaEstimate,
     can_afford_operation,
+    estimate_batch_copy,
     estimate_copy_cost,
     format_quota_warning,
 )
 
 console = Console()
 
+# Max concurrent gcloud subprocesses for per-item clone steps (services, service accounts)
+_GCLOUD_WORKERS = 8
+
+# Shorter runs than this finish too quickly for a live progress bar to be worth drawing
+_PROGRESS_MIN_ITEMS = 20
+
+# Marker recording that the ToS reminder was shown for this version
+_TOS_MARKER = f".last_version_{hashlib.blake2b(__version__.encode(), digest_size=8).hexdigest()}"
+
+
+# Multi-project ToS reminder, rendered with a single console.print()
+_TOS_REMINDER_TEXT = """
+[bold yellow]📋 Multi-Project ToS Reminder[/bold yellow]
+
+If you use multiple GCP projects, please ensure compliance with
+Google's Terms of Service (Section III.D.1.c):
+
+  [dim]• Each project should serve a distinct purpose (e.g., personal vs client)[/dim]
+  [dim]• Do NOT use multiple projects to circumvent quota limits[/dim]
+  [dim]• Use --quota-group to group projects by purpose[/dim]
+
+[dim]Quota increase requests: https://support.google.com/youtube/contact/yt_api_form[/dim]
+"""
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize dataclass instances (e.g. journal Tasks) for the stdlib json fallback.
+
+    orjson handles dataclasses and enums natively; str enums such as TaskStatus
+    are already written as their value by json.
+    """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_json(data: dict[str, Any]) -> None:
+    """Write data as JSON to stdout, as UTF-8 bytes when possible.
+
+    Indented on a terminal; a single compact line when piped to a script.
+    Values may include dataclass instances; they are written field by field.
+    """
+    indent = sys.stdout.isatty()
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        payload = orjson.dumps(data, option=option)
+    else:
+        text = json.dumps(
+            data,
+            indent=2 if indent else None,
+            separators=None if indent else (",", ":"),
+            ensure_ascii=False,
+            default=_json_default,
+        )
+        payload = text.encode() + b"\n"
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:  # stdout replaced by a text-only stream
+        sys.stdout.write(payload.decode())
+        return
+    sys.stdout.flush()  # keep ordering with anything already written as text
+    buffer.write(payload)
+    buffer.flush()
+
+
+def _write_tos_marker(config_dir: Path) -> None:
+    """Replace any older version markers with the marker for this version."""
+    for stale in config_dir.glob(".last_version*"):
+        stale.unlink(missing_ok=True)
+    (config_dir / _TOS_MARKER).touch()
+
+
+def _lazy_import(name: str) -> ModuleType:
+    """Return a module whose body runs on first attribute access.
+
+    api (googleapiclient), extractor and info (yt-dlp) dominate import time;
+    yaml_ops (PyYAML), dashboard (rich tables) and cache (sqlite3) are only
+    needed by a few commands. Deferring them keeps `ytrix help`/`version`
+    fast. The returned object is the real module, so patching
+    `ytrix.__main__.api.<name>` still works.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    assert spec is not None and spec.loader is not None
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    parent, _, child = name.rpartition(".")
+    setattr(sys.modules[parent], child, module)
+    return module
+
+
+if TYPE_CHECKING:
+    from rich.progress import Progress
+
+    from ytrix import api, cache, dashboard, extractor, info, yaml_ops
+else:
+    api = _lazy_import("ytrix.api")
+    cache = _lazy_import("ytrix.cache")
+    dashboard = _lazy_import("ytrix.dashboard")
+    extractor = _lazy_import("ytrix.extractor")
+    info = _lazy_import("ytrix.info")
+    yaml_ops = _lazy_import("ytrix.yaml_ops")
+
+
+# Static command overview, rendered with a single console.print()
+_HELP_TEXT = """\
+[bold]ytrix[/bold] - YouTube playlist management
+
+[bold]Core Commands:[/bold]
+  plist2mlist    Copy external playlist to my channel
+  plists2mlist   Merge multiple playlists from file
+  plist2mlists   Split playlist by channel or year
+  plists2mlists  Batch copy playlists with journaling
+
+[bold]YAML Operations:[/bold]
+  mlists2yaml    Export all my playlists to YAML
+  yaml2mlists    Apply YAML edits to my playlists
+  mlist2yaml     Export single playlist to YAML
+  yaml2mlist     Apply YAML edits to single playlist
+
+[bold]Info & Listing:[/bold]
+  ls             List playlists on my channel
+  plist2info     Extract playlist info with transcripts
+  plists2info    Batch extract playlist info
+
+[bold]Project Management:[/bold]
+  projects       Show configured GCP projects
+  projects_add   Add new project interactively
+  projects_auth  Authenticate a project
+  projects_select Select active project
+  gcp_init       Create new GCP project from scratch
+  gcp_clone      Clone GCP project for quota expansion
+  gcp_inventory  Show GCP project resources
+  gcp_guide      Show OAuth setup guide for a project
+
+[bold]Utilities:[/bold]
+  config         Show/setup configuration
+  quota_status   Show API quota usage
+  cache_stats    Show cache statistics
+  cache_clear    Clear cached data
+  journal_status Show batch operation status
+  version        Show version
+
+[bold]Global Flags:[/bold]
+  --verbose      Enable debug logging
+  --json-output  Output as JSON
+  --throttle N   Milliseconds between API calls (default: 200)
+  --project NAME Use specific GCP project
+  --no-cache     Re-fetch playlists instead of using the local cache
+
+For detailed help: [cyan]ytrix <command> --help[/cyan]"""
+
+
+def _fetch_video_counts(playlist_ids: list[str], count: Callable[[str], Any]) -> dict[str, Any]:
+    """Run a per-playlist yt-dlp count over a thread pool, keeping input order.
+
+    Bounded by info.MAX_PARALLEL_WORKERS, which is only above 1 when a
+    rotating proxy is configured, so unproxied runs keep yt-dlp's pacing.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = max(1, min(info.MAX_PARALLEL_WORKERS, len(playlist_ids)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(playlist_ids, executor.map(count, playlist_ids), strict=True))
+
+
+def _extract_many(
+    sources: list[str], use_cache: bool = True
+) -> Iterator[tuple[str, Playlist | Exception]]:
+    """Extract playlists over a thread pool, yielding (source, playlist or error) in input order.
+
+    Uses the same info.MAX_PARALLEL_WORKERS bound as _fetch_video_counts. Results
+    are yielded as each one in sequence completes, so callers can print as they go.
+    At most one extraction beyond the worker count runs ahead of the consumer,
+    so callers that stream results don't end up holding every playlist.
+    """
+    from collections import deque
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+    def extract(source: str) -> Playlist | Exception:
+        try:
+            return extractor.extract_playlist(source, use_cache=use_cache)
+        except Exception as e:
+            return e
+
+    workers = max(1, min(info.MAX_PARALLEL_WORKERS, len(sources)))
+    in_flight: deque[tuple[str, Future[Playlist | Exception]]] = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for source in sources:
+            in_flight.append((source, executor.submit(extract, source)))
+            if len(in_flight) > workers:
+                done_source, future = in_flight.popleft()
+                yield done_source, future.result()
+        while in_flight:
+            done_source, future = in_flight.popleft()
+            yield done_source, future.result()
+
+
+def _channel_key(video: Video) -> str:
+    """Group key for plist2mlists --by=channel."""
+    return video.channel or "Unknown Channel"
+
+
+def _year_key(video: Video) -> str:
+    """Group key for plist2mlists --by=year."""
+    return video.upload_date[:4] if video.upload_date else "Unknown Year"
+
+
+# plist2mlists --by values and the group key each one uses, chosen once per run
+_SPLIT_KEYS: dict[str, Callable[[Video], str]] = {"channel": _channel_key, "year": _year_key}
+
+
+def _read_url_lines(file_path: str) -> list[str]:
+    """Read playlist URLs/IDs, one per line, skipping blank lines and # comments.
+
+    Raises:
+        ValueError: If the file has no URLs
+    """
+    with Path(file_path).open(encoding="utf-8") as f:
+        lines = [s for line in f if (s := line.strip()) and not s.startswith("#")]
+    if not lines:
+        raise ValueError("No playlist URLs found in file")
+    return lines
+
+
+def _unique_playlist_lines(lines: list[str]) -> list[str]:
+    """Drop lines naming a playlist already listed, keeping the first occurrence.
+
+    A bare ID and a URL for the same playlist count as duplicates. Lines that
+    do not parse are kept so the caller reports them as usual.
+    """
+    seen: set[str] = set()
+    unique = []
+    for line in lines:
+        try:
+            key = extract_playlist_id(line)
+        except ValueError:
+            key = line
+        if key not in seen:
+            seen.add(key)
+            unique.append(line)
+    return unique
+
+
+def _print_block(lines: list[str]) -> None:
+    """Print a screen of markup lines with one console.print() instead of one per line."""
+    console.print("\n".join(lines))
+
+
+def _print_help() -> None:
+    """Print the command overview shared by `ytrix help` and the fast path in main()."""
+    console.print(_HELP_TEXT)
+
 
 class YtrixCLI:
     """YouTube playlist management CLI.
@@ -59,6 +326,7 @@ class YtrixCLI:
         project: str | None = None,
         quota_group: str | None = None,
         quiet: bool = False,
+        no_cache: bool = False,
     ) -> None:
         """Initialize CLI with options.
 
@@ -69,6 +337,8 @@ class YtrixCLI:
             project: Force using a specific project for API calls (multi-project setup)
             quota_group: Restrict context switching to projects in this quota group
             quiet: Suppress non-essential output (progress bars still shown)
+            no_cache: Re-fetch playlists instead of using the local cache (yt-dlp
+                results, and yaml2mlists' record of unedited exports)
         """
         configure_logging(verbose)
         self._json = json_output
@@ -76,9 +346,13 @@ class YtrixCLI:
         self._project = project
         self._quota_group = quota_group
         self._quiet = quiet
+        self._use_cache = not no_cache
         self._manager: Any = None  # ProjectManager, set by _get_youtube_client
-        # Set API throttle delay
-        api.set_throttle_delay(throttle)
+        self._config: Config | None = None  # Loaded on first use by _load_config
+        self._legacy_client: Any = None  # Single-project client, built on first use
+        self._tos_writer: threading.Thread | None = None  # Background ToS marker write
+        # API throttle delay, applied when a client is first requested
+        self._throttle = throttle
         logger.debug(
             "ytrix: verbose={}, json={}, quiet={}, throttle={}ms, project={}, group={}",
             verbose,
@@ -99,47 +373,59 @@ class YtrixCLI:
     def _output(self, data: dict[str, Any]) -> dict[str, Any] | None:
         """Output result as JSON or print nothing (human output already printed)."""
         if self._json:
-            print(json.dumps(data, indent=2))
+            _write_json(data)
         return data if self._json else None
 
-    def _check_tos_reminder(self) -> None:
-        """Show ToS reminder on first run or after version update."""
-        if self._json:
-            return  # Skip for JSON output mode
+    def _progress(self, total: int | None = None) -> "Progress":
+        """Create a progress display, hidden for --json-output and --quiet.
 
-        config_dir = get_config_dir()
-        version_file = config_dir / ".last_version"
+        It is also hidden when the expected number of items (total) is below
+        _PROGRESS_MIN_ITEMS. A disabled Progress starts no refresh thread.
+        """
+        from rich.progress import Progress
+
+        small = total is not None and total < _PROGRESS_MIN_ITEMS
+        return Progress(
+            console=console,
+            disable=(self._json or self._quiet or small),
+            refresh_per_second=4,
+        )
+
+    def _check_tos_reminder(self) -> None:
+        """Show ToS reminder on first run or after version update.
 
-        # Check if this is a new version or first run
-        last_version = ""
-        if version_file.exists():
-            last_version = version_file.read_text().strip()
+        The marker file name encodes the version, so once the reminder was shown
+        the check is a single stat() with no file read.
+        """
+        if self._json or not sys.stdout.isatty():
+            return  # Skip for JSON output and piped/scripted usage
 
-        if last_version != __version__:
-            self._show_tos_reminder()
-            version_file.write_text(__version__)
+        config_dir = get_config_dir()
+        marker = config_dir / _TOS_MARKER
+        if marker.exists():
+            return
+
+        self._show_tos_reminder()
+        # Record the marker off the critical path; if the process exits first,
+        # the worst case is that the reminder is shown once more next run
+        self._tos_writer = threading.Thread(
+            target=_write_tos_marker, args=(config_dir,), name="ytrix-tos-marker", daemon=True
+        )
+        self._tos_writer.start()
 
     def _show_tos_reminder(self) -> None:
         """Display ToS compliance reminder for multi-project setups."""
-        console.print()
-        console.print("[bold yellow]📋 Multi-Project ToS Reminder[/bold yellow]")
-        console.print()
-        console.print(
-            "If you use multiple GCP projects, please ensure compliance with\n"
-            "Google's Terms of Service (Section III.D.1.c):"
-        )
-        console.print()
-        console.print(
-            "  [dim]• Each project should serve a distinct purpose (e.g., personal vs client)[/dim]"
-        )
-        console.print("  [dim]• Do NOT use multiple projects to circumvent quota limits[/dim]")
-        console.print("  [dim]• Use --quota-group to group projects by purpose[/dim]")
-        console.print()
-        console.print(
-            "[dim]Quota increase requests: "
-            "https://support.google.com/youtube/contact/yt_api_form[/dim]"
-        )
-        console.print()
+        console.print(_TOS_REMINDER_TEXT)
+
+    def _load_config(self) -> Config:
+        """Load config once per CLI invocation (fire builds one YtrixCLI per run)."""
+        if self._config is None:
+            self._config = load_config()
+        return self._config
+
+    def _apply_throttle(self) -> None:
+        """Apply --throttle to the API layer (imports ytrix.api on first use)."""
+        api.set_throttle_delay(self._throttle)
 
     def _get_youtube_client(self, config: Config) -> Any:
         """Get YouTube API client, using ProjectManager for multi-project configs.
@@ -149,6 +435,7 @@ class YtrixCLI:
         If multi-project config exists, uses ProjectManager for automatic rotation.
         Falls back to legacy single-project mode only if no multi-project config.
         """
+        self._apply_throttle()
         manager = get_project_manager(config)
         self._manager = manager  # Store for quota rotation in batch operations
 
@@ -168,8 +455,10 @@ class YtrixCLI:
             )
             return manager.get_client()
 
-        # Legacy single-project mode
-        return api.get_youtube_client(config)
+        # Legacy single-project mode; credentials and client are built once per run
+        if self._legacy_client is None:
+            self._legacy_client = api.get_youtube_client(config)
+        return self._legacy_client
 
     def version(self) -> None:
         """Show ytrix version."""
@@ -188,49 +477,7 @@ class YtrixCLI:
             ytrix help
             ytrix plist2mlist --help
         """
-        console.print("[bold]ytrix[/bold] - YouTube playlist management\n")
-        console.print("[bold]Core Commands:[/bold]")
-        console.print("  plist2mlist    Copy external playlist to my channel")
-        console.print("  plists2mlist   Merge multiple playlists from file")
-        console.print("  plist2mlists   Split playlist by channel or year")
-        console.print("  plists2mlists  Batch copy playlists with journaling")
-        console.print()
-        console.print("[bold]YAML Operations:[/bold]")
-        console.print("  mlists2yaml    Export all my playlists to YAML")
-        console.print("  yaml2mlists    Apply YAML edits to my playlists")
-        console.print("  mlist2yaml     Export single playlist to YAML")
-        console.print("  yaml2mlist     Apply YAML edits to single playlist")
-        console.print()
-        console.print("[bold]Info & Listing:[/bold]")
-        console.print("  ls             List playlists on my channel")
-        console.print("  plist2info     Extract playlist info with transcripts")
-        console.print("  plists2info    Batch extract playlist info")
-        console.print()
-        console.print("[bold]Project Management:[/bold]")
-        console.print("  projects       Show configured GCP projects")
-        console.print("  projects_add   Add new project interactively")
-        console.print("  projects_auth  Authenticate a project")
-        console.print("  projects_select Select active project")
-        console.print("  gcp_init       Create new GCP project from scratch")
-        console.print("  gcp_clone      Clone GCP project for quota expansion")
-        console.print("  gcp_inventory  Show GCP project resources")
-        console.print("  gcp_guide      Show OAuth setup guide for a project")
-        console.print()
-        console.print("[bold]Utilities:[/bold]")
-        console.print("  config         Show/setup configuration")
-        console.print("  quota_status   Show API quota usage")
-        console.print("  cache_stats    Show cache statistics")
-        console.print("  cache_clear    Clear cached data")
-        console.print("  journal_status Show batch operation status")
-        console.print("  version        Show version")
-        console.print()
-        console.print("[bold]Global Flags:[/bold]")
-        console.print("  --verbose      Enable debug logging")
-        console.print("  --json-output  Output as JSON")
-        console.print("  --throttle N   Milliseconds between API calls (default: 200)")
-        console.print("  --project NAME Use specific GCP project")
-        console.print()
-        console.print("For detailed help: [cyan]ytrix <command> --help[/cyan]")
+        _print_help()
 
     def config(self) -> dict[str, Any] | None:
         """Show configuration status and setup instructions.
@@ -267,9 +514,9 @@ class YtrixCLI:
             console.print()
             # Show content with secrets masked
             content = config_path.read_text()
-            for line in content.strip().split("\n"):
-                if "secret" in line.lower() and "=" in line:
-                    key = line.split("=")[0]
+            for line in content.strip().splitlines():
+                key, sep, _ = line.partition("=")
+                if sep and "secret" in line.lower():
                     console.print(f"  {key}= [dim]<hidden>[/dim]")
                 else:
                     console.print(f"  {line}")
@@ -283,10 +530,16 @@ class YtrixCLI:
             console.print()
             console.print("[bold]Setup guide:[/bold]")
             console.print()
-            # Read bundled SETUP.txt
+            # Stream bundled SETUP.txt as raw bytes (no decode/re-encode, no Rich markup)
             try:
-                setup_text = resources.files("ytrix").joinpath("SETUP.txt").read_text()
-                print(setup_text)  # Use print() to avoid Rich markup interpretation
+                with resources.files("ytrix").joinpath("SETUP.txt").open("rb") as f:
+                    buffer = getattr(sys.stdout, "buffer", None)
+                    if buffer is None:  # stdout replaced by a text-only stream
+                        sys.stdout.write(f.read().decode())
+                    else:
+                        sys.stdout.flush()
+                        shutil.copyfileobj(f, buffer)
+                        buffer.flush()
             except Exception:
                 console.print("  See: https://github.com/fontlabtv/ytrix for setup instructions")
         return None
@@ -369,7 +622,7 @@ class YtrixCLI:
         ops: dict[str, int] = summary.get("operations", {})  # type: ignore[assignment]
 
         # Get project context
-        config = load_config()
+        config = self._load_config()
         manager = get_project_manager(config)
         try:
             active = manager.current_project
@@ -379,11 +632,11 @@ class YtrixCLI:
             project_name = "default"
             quota_group = "default"
 
-        # Build operations dict for dashboard (name -> (count, units))
-        ops_with_units: dict[str, tuple[int, int]] = {}
-        for op, count in ops.items():
-            unit_cost = quota.QUOTA_COSTS.get(op, 50)
-            ops_with_units[op] = (count, count * unit_cost)
+        # Build operations dict for dashboard (name -> (count, units)), sorted by name
+        costs = quota.QUOTA_COSTS
+        ops_with_units = {
+            op: (count, count * costs.get(op, 50)) for op, count in sorted(ops.items())
+        }
 
         # Display rich dashboard
         panel = dashboard.create_quota_dashboard(
@@ -405,12 +658,7 @@ class YtrixCLI:
             console.print()
             proj_summary = manager.status_summary()
             console.print("[bold]All Projects:[/bold]")
-            for proj in proj_summary:
-                marker = "[green]ACTIVE[/green]" if proj.get("current") else ""
-                console.print(
-                    f"  {proj['name']} ({proj.get('quota_group', 'default')}): "
-                    f"{proj.get('quota_used', 0):,} / {proj.get('quota_limit', 10000):,} {marker}"
-                )
+            console.print(dashboard.create_projects_table(proj_summary))
 
         # Show warning if needed
         warning = quota.get_tracker().check_and_warn()
@@ -430,7 +678,7 @@ class YtrixCLI:
             ytrix projects
             ytrix --json-output projects
         """
-        config = load_config()
+        config = self._load_config()
         manager = get_project_manager(config)
 
         summary = manager.status_summary()
@@ -438,49 +686,11 @@ class YtrixCLI:
         if self._json:
             return self._output({"projects": summary})
 
+        # status_summary() is already sorted by quota_group, then priority
         console.print("[bold]Configured Projects[/bold]")
         console.print()
-
-        # Group projects by quota_group
-        groups: dict[str, list[dict[str, Any]]] = {}
-        for proj in summary:
-            group = str(proj.get("quota_group", "default"))
-            if group not in groups:
-                groups[group] = []
-            groups[group].append(proj)
-
-        for group_name, projects in sorted(groups.items()):
-            console.print(f"[dim]── {group_name} ──[/dim]")
-            for proj in projects:
-                name = proj["name"]
-                current = proj["current"]
-                used = proj["quota_used"]
-                remaining = proj["quota_remaining"]
-                limit = proj["quota_limit"]
-                exhausted = proj["is_exhausted"]
-                env = proj.get("environment", "prod")
-
-                # Active marker and status
-                marker = "[green]→[/green] " if current else "  "
-                active_tag = "[ACTIVE] " if current else ""
-                status = "[red](exhausted)[/red]" if exhausted else ""
-                env_tag = f"[dim][{env}][/dim] " if env != "prod" else ""
-
-                console.print(f"{marker}[bold]{name}[/bold] {active_tag}{env_tag}{status}")
-
-                # Quota bar visualization
-                pct = (used / limit * 100) if limit > 0 else 0
-                if pct >= 90:
-                    bar_color = "red"
-                elif pct >= 70:
-                    bar_color = "yellow"
-                else:
-                    bar_color = "green"
-                console.print(
-                    f"    Quota: [{bar_color}]{used:,}[/{bar_color}] / {limit:,} "
-                    f"({remaining:,} remaining)"
-                )
-            console.print()
+        console.print(dashboard.create_projects_table(summary))
+        console.print()
 
         # Footer with time until reset
         reset_time = quota.get_time_until_reset()
@@ -501,7 +711,7 @@ class YtrixCLI:
             ytrix projects_auth           # Auth current project
             ytrix projects_auth backup    # Auth specific project
         """
-        config = load_config()
+        config = self._load_config()
         manager = get_project_manager(config)
 
         if name:
@@ -547,7 +757,7 @@ class YtrixCLI:
         Example:
             ytrix projects_select backup
         """
-        config = load_config()
+        config = self._load_config()
         manager = get_project_manager(config)
 
         try:
@@ -602,6 +812,8 @@ class YtrixCLI:
             ytrix gcp_clone my-youtube-project 2 --dry-run
             ytrix gcp_clone ytrix-main backup
         """
+        from concurrent.futures import ThreadPoolExecutor
+
         from ytrix import gcptrix
 
         # Set output modes
@@ -627,9 +839,20 @@ class YtrixCLI:
             console.print(f"[red]{msg}[/red]")
             return None
 
+        # The remaining preflight checks are independent gcloud calls: run them
+        # concurrently, then check results in order so the most fundamental
+        # failure (auth before access before existence) is the one reported
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            auth_future = executor.submit(gcptrix.check_authentication)
+            access_future = executor.submit(
+                gcptrix.check_project_permissions, source_project, dry_run
+            )
+            exists_future = executor.submit(gcptrix.project_exists, new_project_id, dry_run)
+            info_future = executor.submit(gcptrix.get_project_info, source_project, dry_run)
+
         # Check authentication
         try:
-            auth_info = gcptrix.check_authentication()
+            auth_info = auth_future.result()
             console.print(f"  Authenticated as: {auth_info['account']}")
         except gcptrix.AuthenticationError as e:
             if self._json:
@@ -639,7 +862,7 @@ class YtrixCLI:
             return None
 
         # Check source project access
-        if not gcptrix.check_project_permissions(source_project, dry_run):
+        if not access_future.result():
             msg = f"Cannot access project: {source_project}"
             if self._json:
                 return self._output({"success": False, "error": msg})
@@ -647,7 +870,7 @@ class YtrixCLI:
             return None
 
         # Check if target exists
-        if gcptrix.project_exists(new_project_id, dry_run):
+        if exists_future.result():
             msg = f"Project already exists: {new_project_id}"
             if self._json:
                 return self._output({"success": False, "error": msg})
@@ -656,7 +879,7 @@ class YtrixCLI:
 
         # Get source project info
         try:
-            project_info = gcptrix.get_project_info(source_project, dry_run)
+            project_info = info_future.result()
             parent = project_info.get("parent")
         except gcptrix.GcloudError as e:
             if self._json:
@@ -675,64 +898,18 @@ class YtrixCLI:
             console.print(f"[red]Failed to create project: {e}[/red]")
             return None
 
-        # Copy labels
-        if not skip_labels:
-            try:
-                labels = gcptrix.get_project_labels(source_project, dry_run)
-                if labels:
-                    gcptrix.set_project_labels(new_project_id, labels, dry_run)
-                    if not dry_run:
-                        console.print(f"  Copied {len(labels)} labels")
-            except gcptrix.GcloudError as e:
-                console.print(f"[yellow]Warning: Could not copy labels: {e}[/yellow]")
-
-        # Configure billing
-        try:
-            billing_info = gcptrix.get_billing_info(source_project, dry_run)
-            if billing_info.get("billingEnabled"):
-                billing_account = billing_info.get("billingAccountName", "").split("/")[-1]
-                if billing_account:
-                    gcptrix.link_billing(new_project_id, billing_account, dry_run)
-                    if not dry_run:
-                        console.print(f"  Linked billing account: {billing_account}")
-        except gcptrix.GcloudError as e:
-            console.print(f"[yellow]Warning: Could not configure billing: {e}[/yellow]")
-
-        # Enable services
-        try:
-            services = gcptrix.get_enabled_services(source_project, dry_run)
-            if services and not dry_run:
-                console.print(f"  Enabling {len(services)} services...")
-                for svc in services:
-                    with contextlib.suppress(gcptrix.GcloudError):
-                        gcptrix.enable_service(new_project_id, svc, dry_run)
-                console.print("  [green]Services enabled[/green]")
-        except gcptrix.GcloudError as e:
-            console.print(f"[yellow]Warning: Could not enable services: {e}[/yellow]")
-
-        # Clone service accounts
-        if not skip_service_accounts:
-            try:
-                sas = gcptrix.get_service_accounts(source_project, dry_run)
-                default_patterns = ["-compute@", "@cloudservices", "@cloudbuild", "@appspot"]
-                custom_sas = [
-                    sa
-                    for sa in sas
-                    if sa.get("email", "").endswith(".iam.gserviceaccount.com")
-                    and not any(p in sa.get("email", "") for p in default_patterns)
-                ]
-                if custom_sas and not dry_run:
-                    for sa in custom_sas:
-                        email = sa.get("email", "")
-                        account_id = email.split("@")[0]
-                        display_name = sa.get("displayName", account_id)
-                        with contextlib.suppress(gcptrix.GcloudError):
-                            gcptrix.create_service_account(
-                                new_project_id, account_id, display_name, dry_run
-                            )
-                    console.print(f"  Created {len(custom_sas)} service accounts")
-            except gcptrix.GcloudError as e:
-                console.print(f"[yellow]Warning: Could not clone SAs: {e}[/yellow]")
+        # Copy resources; the skip flags are resolved once into the stage list
+        stages = [
+            (name, stage)
+            for name, stage, skipped in (
+                ("labels", self._clone_labels, skip_labels),
+                ("billing", self._clone_billing, False),
+                ("services", self._clone_services, False),
+                ("service_accounts", self._clone_service_accounts, skip_service_accounts),
+            )
+            if not skipped
+        ]
+        failed = {name: stage(source_project, new_project_id, dry_run) for name, stage in stages}
 
         if self._json:
             return self._output(
@@ -741,6 +918,7 @@ class YtrixCLI:
                     "source_project": source_project,
                     "new_project": new_project_id,
                     "dry_run": dry_run,
+                    "failed": {name: items for name, items in failed.items() if items},
                 }
             )
 
@@ -755,6 +933,138 @@ class YtrixCLI:
 
         return None
 
+    def _clone_labels(self, source_project: str, new_project_id: str, dry_run: bool) -> list[str]:
+        """gcp_clone stage: copy project labels. Returns errors, if any."""
+        from ytrix import gcptrix
+
+        try:
+            labels = gcptrix.get_project_labels(source_project, dry_run)
+            if labels:
+                gcptrix.set_project_labels(new_project_id, labels, dry_run)
+                if not dry_run:
+                    console.print(f"  Copied {len(labels)} labels")
+        except gcptrix.GcloudError as e:
+            console.print(f"[yellow]Warning: Could not copy labels: {e}[/yellow]")
+            return [str(e)]
+        return []
+
+    def _clone_billing(self, source_project: str, new_project_id: str, dry_run: bool) -> list[str]:
+        """gcp_clone stage: link the source project's billing account. Returns errors, if any."""
+        from ytrix import gcptrix
+
+        try:
+            billing_info = gcptrix.get_billing_info(source_project, dry_run)
+            if billing_info.get("billingEnabled"):
+                billing_account = billing_info.get("billingAccountName", "").split("/")[-1]
+                if billing_account:
+                    gcptrix.link_billing(new_project_id, billing_account, dry_run)
+                    if not dry_run:
+                        console.print(f"  Linked billing account: {billing_account}")
+        except gcptrix.GcloudError as e:
+            console.print(f"[yellow]Warning: Could not configure billing: {e}[/yellow]")
+            return [str(e)]
+        return []
+
+    def _clone_services(self, source_project: str, new_project_id: str, dry_run: bool) -> list[str]:
+        """gcp_clone stage: enable the source project's services. Returns those that failed.
+
+        Services are enabled SERVICES_PER_ENABLE at a time in one gcloud call;
+        a batch that fails is retried one service at a time to find the culprits.
+        """
+        from ytrix import gcptrix
+
+        try:
+            services = gcptrix.get_enabled_services(source_project, dry_run)
+        except gcptrix.GcloudError as e:
+            console.print(f"[yellow]Warning: Could not enable services: {e}[/yellow]")
+            return [str(e)]
+        if not services or dry_run:
+            return []
+
+        console.print(f"  Enabling {len(services)} services...")
+        failed: list[str] = []
+        with self._progress(len(services)) as progress:
+            prog_task = progress.add_task("Enabling services...", total=len(services))
+            for i in range(0, len(services), gcptrix.SERVICES_PER_ENABLE):
+                chunk = services[i : i + gcptrix.SERVICES_PER_ENABLE]
+                try:
+                    gcptrix.enable_services(new_project_id, chunk, dry_run)
+                except gcptrix.GcloudError:
+                    for svc in chunk:
+                        try:
+                            gcptrix.enable_services(new_project_id, [svc], dry_run)
+                        except gcptrix.GcloudError:
+                            failed.append(svc)
+                progress.advance(prog_task, len(chunk))
+
+        enabled = len(services) - len(failed)
+        if failed:
+            console.print(
+                f"  [yellow]Enabled {enabled}/{len(services)} services; "
+                f"failed: {', '.join(failed)}[/yellow]"
+            )
+        else:
+            console.print(f"  [green]Enabled {enabled}/{len(services)} services[/green]")
+        return failed
+
+    def _clone_service_accounts(
+        self, source_project: str, new_project_id: str, dry_run: bool
+    ) -> list[str]:
+        """gcp_clone stage: recreate custom (non-default) service accounts.
+
+        Returns the emails of source accounts that could not be recreated.
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        from ytrix import gcptrix
+
+        try:
+            sas = gcptrix.get_service_accounts(source_project, dry_run)
+        except gcptrix.GcloudError as e:
+            console.print(f"[yellow]Warning: Could not clone SAs: {e}[/yellow]")
+            return [str(e)]
+        default_patterns = ["-compute@", "@cloudservices", "@cloudbuild", "@appspot"]
+        custom_sas = [
+            sa
+            for sa in sas
+            if sa.get("email", "").endswith(".iam.gserviceaccount.com")
+            and not any(p in sa.get("email", "") for p in default_patterns)
+        ]
+        if not custom_sas or dry_run:
+            return []
+
+        failed: list[str] = []
+        with ThreadPoolExecutor(max_workers=_GCLOUD_WORKERS) as executor:
+            futures = {}
+            for sa in custom_sas:
+                email = sa.get("email", "")
+                account_id = email.split("@")[0]
+                display_name = sa.get("displayName", account_id)
+                future = executor.submit(
+                    gcptrix.create_service_account,
+                    new_project_id,
+                    account_id,
+                    display_name,
+                    dry_run,
+                )
+                futures[future] = email
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except gcptrix.GcloudError:
+                    failed.append(futures[future])
+
+        created = len(custom_sas) - len(failed)
+        if failed:
+            failed.sort()
+            console.print(
+                f"  [yellow]Created {created}/{len(custom_sas)} service accounts; "
+                f"failed: {', '.join(failed)}[/yellow]"
+            )
+        else:
+            console.print(f"  Created {created}/{len(custom_sas)} service accounts")
+        return failed
+
     def gcp_inventory(self, project_id: str) -> dict[str, Any] | None:
         """Show inventory of resources in a GCP project.
 
@@ -769,6 +1079,8 @@ class YtrixCLI:
         Example:
             ytrix gcp_inventory my-youtube-project
         """
+        from concurrent.futures import ThreadPoolExecutor
+
         from ytrix import gcptrix
 
         if self._verbose:
@@ -799,11 +1111,19 @@ class YtrixCLI:
             console.print(f"[red]{msg}[/red]")
             return None
 
-        # Gather inventory data
+        # Gather inventory data. Each lookup is an independent gcloud subprocess,
+        # so run them concurrently; errors surface from result() below.
         inventory: dict[str, Any] = {"project_id": project_id}
 
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            info_future = executor.submit(gcptrix.get_project_info, project_id)
+            labels_future = executor.submit(gcptrix.get_project_labels, project_id)
+            billing_future = executor.submit(gcptrix.get_billing_info, project_id)
+            sas_future = executor.submit(gcptrix.get_service_accounts, project_id)
+            services_future = executor.submit(gcptrix.get_enabled_services, project_id)
+
         try:
-            info = gcptrix.get_project_info(project_id)
+            info = info_future.result()
             inventory["project_number"] = info.get("projectNumber")
             inventory["name"] = info.get("name")
             inventory["parent"] = info.get("parent")
@@ -811,77 +1131,73 @@ class YtrixCLI:
             pass
 
         try:
-            inventory["labels"] = gcptrix.get_project_labels(project_id)
+            inventory["labels"] = labels_future.result()
         except gcptrix.GcloudError:
             inventory["labels"] = {}
 
         try:
-            billing = gcptrix.get_billing_info(project_id)
+            billing = billing_future.result()
             inventory["billing_enabled"] = billing.get("billingEnabled", False)
             inventory["billing_account"] = billing.get("billingAccountName", "").split("/")[-1]
         except gcptrix.GcloudError:
             inventory["billing_enabled"] = False
 
         try:
-            sas = gcptrix.get_service_accounts(project_id)
+            sas = sas_future.result()
             inventory["service_accounts"] = [sa.get("email") for sa in sas]
         except gcptrix.GcloudError:
             inventory["service_accounts"] = []
 
         try:
-            inventory["enabled_services"] = gcptrix.get_enabled_services(project_id)
+            inventory["enabled_services"] = services_future.result()
         except gcptrix.GcloudError:
             inventory["enabled_services"] = []
 
         if self._json:
             return self._output({"success": True, **inventory})
 
-        # Display inventory
-        console.print(f"\n[bold]Project Inventory: {project_id}[/bold]")
-        console.print(f"  Authenticated as: {auth_info['account']}")
-        console.print()
-        console.print("[bold]Project Info[/bold]")
-        console.print(f"  ID:     {project_id}")
-        console.print(f"  Number: {inventory.get('project_number', 'N/A')}")
-        console.print(f"  Name:   {inventory.get('name', 'N/A')}")
+        # Display inventory as one block; every key below is set by the lookups above
+        labels: dict[str, str] = inventory["labels"]
+        sa_emails: list[str] = inventory["service_accounts"]
+        services: list[str] = inventory["enabled_services"]  # sorted by gcptrix
         parent = inventory.get("parent")
+        lines = [
+            f"\n[bold]Project Inventory: {project_id}[/bold]",
+            f"  Authenticated as: {auth_info['account']}",
+            "",
+            "[bold]Project Info[/bold]",
+            f"  ID:     {project_id}",
+            f"  Number: {inventory.get('project_number', 'N/A')}",
+            f"  Name:   {inventory.get('name', 'N/A')}",
+        ]
         if parent:
-            console.print(f"  Parent: {parent.get('type')} ({parent.get('id')})")
+            lines.append(f"  Parent: {parent.get('type')} ({parent.get('id')})")
 
-        console.print()
-        console.print("[bold]Labels[/bold]")
-        labels = inventory.get("labels", {})
+        lines += ["", "[bold]Labels[/bold]"]
         if labels:
-            for k, v in labels.items():
-                console.print(f"  {k}: {v}")
+            lines.extend(f"  {k}: {v}" for k, v in labels.items())
         else:
-            console.print("  (none)")
+            lines.append("  (none)")
 
-        console.print()
-        console.print("[bold]Billing[/bold]")
-        if inventory.get("billing_enabled"):
-            console.print(f"  Account: {inventory.get('billing_account')}")
+        lines += ["", "[bold]Billing[/bold]"]
+        if inventory["billing_enabled"]:
+            lines.append(f"  Account: {inventory.get('billing_account')}")
         else:
-            console.print("  Not enabled")
+            lines.append("  Not enabled")
 
-        console.print()
-        console.print("[bold]Service Accounts[/bold]")
-        sas = inventory.get("service_accounts", [])
-        if sas:
-            for sa in sas:
-                console.print(f"  {sa}")
+        lines += ["", "[bold]Service Accounts[/bold]"]
+        if sa_emails:
+            lines.extend(f"  {email}" for email in sa_emails)
         else:
-            console.print("  (none)")
+            lines.append("  (none)")
 
-        console.print()
-        console.print("[bold]Enabled Services[/bold]")
-        services = inventory.get("enabled_services", [])
+        lines += ["", "[bold]Enabled Services[/bold]"]
         if services:
-            for svc in sorted(services):
-                console.print(f"  {svc}")
-            console.print(f"  Total: {len(services)}")
+            lines.extend(f"  {svc}" for svc in services)
+            lines.append(f"  Total: {len(services)}")
         else:
-            console.print("  (none)")
+            lines.append("  (none)")
+        _print_block(lines)
 
         return None
 
@@ -1044,8 +1360,6 @@ class YtrixCLI:
             ytrix projects_add backup
             ytrix projects_add secondary
         """
-        import tomllib
-
         config_dir = get_config_dir()
         config_file = config_dir / "config.toml"
 
@@ -1059,26 +1373,32 @@ class YtrixCLI:
             return None
 
         # Load existing config
-        with open(config_file, "rb") as f:
-            config_data = tomllib.load(f)
+        config_data = read_toml(config_file)
 
-        # Check if project name already exists
+        # Index existing projects once: names for the duplicate check, group sizes for the
+        # ToS warning below
         existing_projects = config_data.get("projects", [])
-        for proj in existing_projects:
-            if proj.get("name") == name:
-                msg = f"Project '{name}' already exists in config"
-                if self._json:
-                    return self._output({"success": False, "error": msg})
-                console.print(f"[red]{msg}[/red]")
-                return None
+        names = {p.get("name") for p in existing_projects}
+        group_counts = Counter(p.get("quota_group", "default") for p in existing_projects)
 
-        console.print(f"[bold]Adding new project: {name}[/bold]")
-        console.print()
-        console.print("You need OAuth credentials from Google Cloud Console:")
-        console.print("  1. Go to https://console.cloud.google.com/apis/credentials")
-        console.print("  2. Create or select an OAuth 2.0 Client ID (Desktop app)")
-        console.print("  3. Copy the Client ID and Client Secret")
-        console.print()
+        if name in names:
+            msg = f"Project '{name}' already exists in config"
+            if self._json:
+                return self._output({"success": False, "error": msg})
+            console.print(f"[red]{msg}[/red]")
+            return None
+
+        _print_block(
+            [
+                f"[bold]Adding new project: {name}[/bold]",
+                "",
+                "You need OAuth credentials from Google Cloud Console:",
+                "  1. Go to https://console.cloud.google.com/apis/credentials",
+                "  2. Create or select an OAuth 2.0 Client ID (Desktop app)",
+                "  3. Copy the Client ID and Client Secret",
+                "",
+            ]
+        )
 
         # Prompt for credentials
         try:
@@ -1102,79 +1422,64 @@ class YtrixCLI:
             return None
 
         # Prompt for quota_group (ToS compliance)
-        console.print()
-        console.print("[bold]Quota Group Configuration[/bold]")
-        console.print(
-            "[dim]Projects in the same quota_group can switch automatically "
-            "on quota exhaustion.[/dim]"
-        )
-        console.print(
-            "[dim]Use different groups for different purposes (e.g., personal, client-a).[/dim]"
+        _print_block(
+            [
+                "",
+                "[bold]Quota Group Configuration[/bold]",
+                "[dim]Projects in the same quota_group can switch automatically "
+                "on quota exhaustion.[/dim]",
+                "[dim]Use different groups for different purposes "
+                "(e.g., personal, client-a).[/dim]",
+                "",
+            ]
         )
-        console.print()
 
+        # Rich re-asks on an invalid environment or priority instead of us checking
         try:
-            quota_group = input("Quota group [default]: ").strip() or "default"
-            environment = input("Environment (dev/staging/prod) [prod]: ").strip() or "prod"
-            priority_str = input("Priority (lower = higher priority) [0]: ").strip() or "0"
-            try:
-                priority = int(priority_str)
-                if priority < 0:
-                    priority = 0
-            except ValueError:
-                priority = 0
+            quota_group = Prompt.ask("Quota group", default="default").strip() or "default"
+            environment = Prompt.ask(
+                "Environment", choices=["dev", "staging", "prod"], default="prod"
+            )
+            priority = max(0, IntPrompt.ask("Priority (lower = higher priority)", default=0))
         except (KeyboardInterrupt, EOFError):
             console.print("\n[yellow]Cancelled[/yellow]")
             return None
 
         # Validate: warn if too many projects in same quota_group
-        projects_in_group = [
-            p for p in existing_projects if p.get("quota_group", "default") == quota_group
-        ]
-        if len(projects_in_group) >= 5:
-            console.print()
-            console.print(
-                f"[yellow]Warning: You already have {len(projects_in_group)} projects "
-                f"in quota_group '{quota_group}'.[/yellow]"
-            )
-            console.print(
-                "[yellow]Having many projects in the same group may violate Google's ToS "
-                "if used to circumvent quota limits.[/yellow]"
-            )
-            console.print(
-                "[dim]Consider using different quota_groups for truly different purposes.[/dim]"
+        projects_in_group = group_counts[quota_group]
+        if projects_in_group >= 5:
+            _print_block(
+                [
+                    "",
+                    f"[yellow]Warning: You already have {projects_in_group} projects "
+                    f"in quota_group '{quota_group}'.[/yellow]",
+                    "[yellow]Having many projects in the same group may violate Google's ToS "
+                    "if used to circumvent quota limits.[/yellow]",
+                    "[dim]Consider using different quota_groups for truly different "
+                    "purposes.[/dim]",
+                    "",
+                ]
             )
-            console.print()
             try:
-                confirm = input("Continue anyway? [y/N]: ").strip().lower()
-                if confirm not in ("y", "yes"):
+                if not Confirm.ask("Continue anyway?", default=False):
                     console.print("[yellow]Cancelled[/yellow]")
                     return None
             except (KeyboardInterrupt, EOFError):
                 console.print("\n[yellow]Cancelled[/yellow]")
                 return None
 
-        # Validate environment
-        if environment not in ("dev", "staging", "prod"):
-            console.print(f"[yellow]Invalid environment '{environment}', using 'prod'[/yellow]")
-            environment = "prod"
-
-        # Read current config as text to preserve formatting
-        config_text = config_file.read_text()
-
-        # Build new project entry
-        new_project = f'''
-[[projects]]
-name = "{name}"
-client_id = "{client_id}"
-client_secret = "{client_secret}"
-quota_group = "{quota_group}"
-environment = "{environment}"
-priority = {priority}
-'''
-
-        # Append to config
-        config_file.write_text(config_text.rstrip() + "\n" + new_project)
+        # Append the new entry, keeping the existing file's formatting
+        append_project(
+            config_file,
+            {
+                "name": name,
+                "client_id": client_id,
+                "client_secret": client_secret,
+                "quota_group": quota_group,
+                "environment": environment,
+                "priority": priority,
+            },
+        )
 
         if self._json:
             return self._output(
@@ -1242,46 +1547,48 @@ priority = {priority}
             filtered_tasks = journal.tasks
 
         if self._json:
-            tasks_data = [t.to_dict() for t in filtered_tasks]
+            # Tasks are dataclasses: _write_json serializes them without to_dict()
             return self._output(
                 {
                     "batch_id": journal.batch_id,
                     "created_at": journal.created_at,
                     "summary": summary,
-                    "tasks": tasks_data,
+                    "tasks": filtered_tasks,
                     "pending_only": pending_only,
                 }
             )
 
-        console.print(f"[bold]Batch:[/bold] {journal.batch_id}")
-        console.print(f"[bold]Created:[/bold] {journal.created_at}")
-        console.print()
-        console.print("[bold]Summary:[/bold]")
-        console.print(f"  Total: {summary['total']}")
-        console.print(f"  [green]Completed: {summary['completed']}[/green]")
-        console.print(f"  [blue]Skipped: {summary['skipped']}[/blue]")
-        console.print(f"  [yellow]Pending: {summary['pending']}[/yellow]")
-        console.print(f"  [red]Failed: {summary['failed']}[/red]")
+        lines = [
+            f"[bold]Batch:[/bold] {journal.batch_id}",
+            f"[bold]Created:[/bold] {journal.created_at}",
+            "",
+            "[bold]Summary:[/bold]",
+            f"  Total: {summary['total']}",
+            f"  [green]Completed: {summary['completed']}[/green]",
+            f"  [blue]Skipped: {summary['skipped']}[/blue]",
+            f"  [yellow]Pending: {summary['pending']}[/yellow]",
+            f"  [red]Failed: {summary['failed']}[/red]",
+        ]
 
         # Show failed tasks with errors
         failed = [t for t in filtered_tasks if t.status == TaskStatus.FAILED]
         if failed:
-            console.print()
-            console.print("[bold red]Failed tasks:[/bold red]")
+            lines += ["", "[bold red]Failed tasks:[/bold red]"]
             for t in failed:
-                console.print(f"  {t.source_title}")
-                console.print(f"    [dim]Error: {t.error}[/dim]")
-                console.print(f"    [dim]Retries: {t.retry_count}[/dim]")
+                lines += [
+                    f"  {t.source_title}",
+                    f"    [dim]Error: {t.error}[/dim]",
+                    f"    [dim]Retries: {t.retry_count}[/dim]",
+                ]
 
         # Show pending tasks if pending_only
         if pending_only:
             pending = [t for t in filtered_tasks if t.status == TaskStatus.PENDING]
             if pending:
-                console.print()
-                console.print("[bold yellow]Pending tasks:[/bold yellow]")
-                for t in pending:
-                    console.print(f"  {t.source_title}")
+                lines += ["", "[bold yellow]Pending tasks:[/bold yellow]"]
+                lines.extend(f"  {t.source_title}" for t in pending)
 
+        _print_block(lines)
         return None
 
     def ls(
@@ -1319,8 +1626,9 @@ priority = {priority}
             if count and playlists:
                 if not self._json:
                     console.print("[blue]Fetching video counts...[/blue]")
-                for p in playlists:
-                    video_counts[p.id] = extractor.get_video_count(p.id)
+                video_counts = _fetch_video_counts(
+                    [p.id for p in playlists], extractor.get_video_count
+                )
 
             if self._json:
                 playlist_data = []
@@ -1335,15 +1643,16 @@ priority = {priority}
                 console.print("[yellow]No playlists found[/yellow]")
                 return None
 
-            console.print(f"Found {len(playlists)} playlists:\n")
+            lines = [f"Found {len(playlists)} playlists:\n"]
             for p in playlists:
                 count_tag = f" ({video_counts[p.id]} videos)" if count else ""
-                console.print(f"  {p.title}{count_tag}")
-                console.print(f"    [dim]https://youtube.com/playlist?list={p.id}[/dim]")
+                lines.append(f"  {p.title}{count_tag}")
+                lines.append(f"    [dim]https://youtube.com/playlist?list={p.id}[/dim]")
+            _print_block(lines)
             return None
 
         # List own playlists via YouTube API
-        config = load_config()
+        config = self._load_config()
         client = self._get_youtube_client(config)
 
         if not self._json and not urls:
@@ -1362,14 +1671,22 @@ priority = {priority}
         if count and playlists:
             if not self._json:
                 console.print("[blue]Fetching video counts...[/blue]")
-            for p in playlists:
+
+            def ytdlp_count(playlist_id: str) -> int | None:
                 try:
-                    # Try yt-dlp first (no API quota)
-                    my_video_counts[p.id] = extractor.get_video_count(p.id)
+                    return extractor.get_video_count(playlist_id)
                 except Exception:
-                    # Fall back to API for private playlists
-                    videos = api.get_playlist_videos(client, p.id)
-                    my_video_counts[p.id] = len(videos)
+                    return None
+
+            # Try yt-dlp first (no API quota), then fall back to the API for
+            # private playlists; the API client is not thread-safe, so the
+            # fallback stays on this thread
+            for playlist_id, n in _fetch_video_counts(
+                [p.id for p in playlists], ytdlp_count
+            ).items():
+                if n is None:
+                    n = len(api.get_playlist_videos(client, playlist_id))
+                my_video_counts[playlist_id] = n
 
         if self._json:
             playlist_data = []
@@ -1384,15 +1701,70 @@ priority = {priority}
             console.print("[yellow]No playlists found[/yellow]")
             return None
 
-        console.print(f"Found {len(playlists)} playlists:\n")
+        lines = [f"Found {len(playlists)} playlists:\n"]
         for p in playlists:
             privacy_tag = f" \\[{p.privacy}]" if p.privacy != "public" else ""
             count_tag = f" ({my_video_counts[p.id]} videos)" if count else ""
-            console.print(f"  {p.title}{privacy_tag}{count_tag}")
-            console.print(f"    [dim]https://youtube.com/playlist?list={p.id}[/dim]")
+            lines.append(f"  {p.title}{privacy_tag}{count_tag}")
+            lines.append(f"    [dim]https://youtube.com/playlist?list={p.id}[/dim]")
+        _print_block(lines)
 
         return None
 
+    def _add_videos(
+        self,
+        client: Any,
+        playlist_id: str,
+        videos: list[Video],
+        only_ids: set[str] | None = None,
+        progress: "Progress | None" = None,
+    ) -> tuple[int, list[dict[str, Any]]]:
+        """Append videos to a playlist in order, skipping ones the API rejects.
+
+        Inserts are issued one at a time on purpose: the API runs HTTP batch
+        requests in any order, which would scramble the copied playlist order.
+
+        Args:
+            client: YouTube API client
+            playlist_id: Playlist to append to
+            videos: Videos in playlist order
+            only_ids: If given, add only videos with these IDs (filtered in the
+                same pass, without building a second list)
+            progress: Running Progress to add this playlist's task to, so a
+                multi-playlist command starts one display instead of one each
+
+        Returns:
+            Number of videos added and a list of {"id", "error"} for skipped ones;
+            API rejections also carry the HTTP "status"
+        """
+        if progress is None:
+            total = len(videos) if only_ids is None else len(only_ids)
+            with self._progress(total) as own:
+                return self._add_videos(client, playlist_id, videos, only_ids, own)
+
+        from googleapiclient.errors import HttpError
+
+        added = 0
+        skipped: list[dict[str, Any]] = []
+        total = len(videos) if only_ids is None else len(only_ids)
+        task = progress.add_task("Adding videos...", total=total)
+        for video in videos:
+            if only_ids is not None and video.id not in only_ids:
+                continue
+            try:
+                api.add_video_to_playlist(client, playlist_id, video.id)
+                added += 1
+            except HttpError as e:
+                # Parsed when the error was raised; str(e) would format the whole request
+                skipped.append({"id": video.id, "status": e.resp.status, "error": e.reason})
+            except Exception as e:
+                skipped.append({"id": video.id, "error": str(e)})
+            progress.advance(task)
+        # Reported once after the loop so rendering never sits between inserts
+        if skipped and not self._json:
+            _print_block([f"[yellow]Skipped {s['id']}: {s['error']}[/yellow]" for s in skipped])
+        return added, skipped
+
     def plist2mlist(
         self,
         url_or_id: str,
@@ -1400,6 +1772,7 @@ priority = {priority}
         dedup: bool = True,
         title: str | None = None,
         privacy: str = "public",
+        refresh_target_cache: bool = False,
     ) -> str | dict[str, Any] | None:
         """Copy external playlist to your channel.
 
@@ -1409,6 +1782,8 @@ priority = {priority}
             dedup: Check for existing duplicates before creating (default: True)
             title: Custom title for the new playlist (default: use source title)
             privacy: Privacy setting: public, unlisted, or private (default: public)
+            refresh_target_cache: Rescan your channel for dedup instead of using
+                the cached playlist listing
 
         Example:
             ytrix plist2mlist "https://youtube.com/playlist?list=PLxxx"
@@ -1416,29 +1791,37 @@ priority = {priority}
             ytrix plist2mlist PLxxx --no-dedup
             ytrix plist2mlist PLxxx --title "My Copy"
             ytrix plist2mlist PLxxx --privacy unlisted
+            ytrix plist2mlist PLxxx --refresh-target-cache
         """
         if privacy not in ("public", "unlisted", "private"):
             raise ValueError("--privacy must be 'public', 'unlisted', or 'private'")
-        from ytrix.dedup import MatchType, find_matching_playlist
+        from ytrix.dedup import (
+            MatchType,
+            find_matching_playlist,
+            forget_target_playlists,
+            load_target_playlists_with_videos,
+        )
 
         logger.debug("plist2mlist called with url_or_id={}, dedup={}", url_or_id, dedup)
 
         if not self._json:
             console.print("[blue]Extracting playlist...[/blue]")
-        source = extractor.extract_playlist(url_or_id)
+        source = extractor.extract_playlist(url_or_id, use_cache=self._use_cache)
         logger.debug("Extracted playlist: {} with {} videos", source.title, len(source.videos))
 
         if not self._json:
             console.print(f"Found: {source.title} ({len(source.videos)} videos)")
 
-        config = load_config()
+        config = self._load_config()
 
         # Deduplication check
         match_result = None
         if dedup and not dry_run:
             if not self._json:
                 console.print("[blue]Checking for duplicates...[/blue]")
-            target_playlists = load_target_playlists_with_videos(config.channel_id)
+            target_playlists = load_target_playlists_with_videos(
+                config.channel_id, refresh=refresh_target_cache or not self._use_cache
+            )
             if target_playlists:
                 match_result = find_matching_playlist(source, target_playlists)
 
@@ -1516,34 +1899,15 @@ priority = {priority}
             return None
 
         client = self._get_youtube_client(config)
+        # The channel is about to change, so this process must not reuse its listing
+        forget_target_playlists(config.channel_id)
 
         # Handle partial match - add missing videos to existing playlist
         if match_result and match_result.match_type == MatchType.PARTIAL:
             target = match_result.target_playlist
             assert target is not None  # guaranteed by PARTIAL match
             missing_ids = set(match_result.missing_videos or [])
-            videos_to_add = [v for v in source.videos if v.id in missing_ids]
-
-            added = 0
-            skipped = []
-            if self._json:
-                for video in videos_to_add:
-                    try:
-                        api.add_video_to_playlist(client, target.id, video.id)
-                        added += 1
-                    except Exception as e:
-                        skipped.append({"id": video.id, "error": str(e)})
-            else:
-                with Progress(console=console, disable=(self._json or self._quiet)) as progress:
-                    task = progress.add_task("Adding videos...", total=len(videos_to_add))
-                    for video in videos_to_add:
-                        try:
-                            api.add_video_to_playlist(client, target.id, video.id)
-                            added += 1
-                        except Exception as e:
-                            skipped.append({"id": video.id, "error": str(e)})
-                            console.print(f"[yellow]Skipped {video.id}: {e}[/yellow]")
-                        progress.advance(task)
+            added, skipped = self._add_videos(client, target.id, source.videos, missing_ids)
 
             url = f"https://www.youtube.com/playlist?list={target.id}"
             if not self._json:
@@ -1569,26 +1933,7 @@ priority = {priority}
         new_id = api.create_playlist(client, playlist_title, source.description, privacy)
         logger.debug("Created playlist with id={}", new_id)
 
-        added = 0
-        skipped = []
-        if self._json:
-            for video in source.videos:
-                try:
-                    api.add_video_to_playlist(client, new_id, video.id)
-                    added += 1
-                except Exception as e:
-                    skipped.append({"id": video.id, "error": str(e)})
-        else:
-            with Progress(console=console, disable=(self._json or self._quiet)) as progress:
-                task = progress.add_task("Adding videos...", total=len(source.videos))
-                for video in source.videos:
-                    try:
-                        api.add_video_to_playlist(client, new_id, video.id)
-                        added += 1
-                    except Exception as e:
-                        skipped.append({"id": video.id, "error": str(e)})
-                        console.print(f"[yellow]Skipped {video.id}: {e}[/yellow]")
-                    progress.advance(task)
+        added, skipped = self._add_videos(client, new_id, source.videos)
 
         url = f"https://www.youtube.com/playlist?list={new_id}"
         if not self._json:
@@ -1629,45 +1974,36 @@ priority = {priority}
         if privacy not in ("public", "unlisted", "private"):
             raise ValueError("--privacy must be 'public', 'unlisted', or 'private'")
         # Read playlist URLs/IDs from file
-        lines = Path(file_path).read_text().strip().split("\n")
-        lines = [line.strip() for line in lines if line.strip() and not line.startswith("#")]
-        if not lines:
-            raise ValueError("No playlist URLs found in file")
+        lines = _read_url_lines(file_path)
 
         if not self._json:
             console.print(f"[blue]Processing {len(lines)} playlists...[/blue]")
 
-        all_videos = []
+        # Dedup while extracting: first occurrence wins, in source order, and
+        # only the unique videos are kept rather than every extracted copy
+        unique_by_id: dict[str, Video] = {}
+        total_videos = 0
         source_playlists = []
-        for line in lines:
-            try:
-                playlist = extractor.extract_playlist(line)
+        for line, playlist in _extract_many(lines, self._use_cache):
+            if isinstance(playlist, Exception):
                 if not self._json:
-                    console.print(f"  {playlist.title}: {len(playlist.videos)} videos")
-                source_playlists.append(
-                    {"title": playlist.title, "video_count": len(playlist.videos)}
-                )
-                all_videos.extend(playlist.videos)
-            except Exception as e:
-                if not self._json:
-                    console.print(f"[yellow]Skipped {line}: {e}[/yellow]")
+                    console.print(f"[yellow]Skipped {line}: {playlist}[/yellow]")
+                continue
+            if not self._json:
+                console.print(f"  {playlist.title}: {len(playlist.videos)} videos")
+            source_playlists.append({"title": playlist.title, "video_count": len(playlist.videos)})
+            total_videos += len(playlist.videos)
+            for video in playlist.videos:
+                unique_by_id.setdefault(video.id, video)
 
-        if not all_videos:
+        if not total_videos:
             raise ValueError("No videos found in any playlist")
 
-        # Detect duplicates
-        seen_ids: set[str] = set()
-        duplicates: list[str] = []
-        unique_videos = []
-        for video in all_videos:
-            if video.id in seen_ids:
-                duplicates.append(video.id)
-            else:
-                seen_ids.add(video.id)
-                unique_videos.append(video)
+        unique_videos = list(unique_by_id.values())
+        duplicates = total_videos - len(unique_videos)
 
         if duplicates and not self._json:
-            console.print(f"[yellow]Found {len(duplicates)} duplicate videos (skipped)[/yellow]")
+            console.print(f"[yellow]Found {duplicates} duplicate videos (skipped)[/yellow]")
 
         playlist_title = title or f"Merged Playlist ({len(unique_videos)} videos)"
 
@@ -1680,7 +2016,7 @@ priority = {priority}
                         "privacy": privacy,
                         "source_playlists": source_playlists,
                         "unique_videos": len(unique_videos),
-                        "duplicates_skipped": len(duplicates),
+                        "duplicates_skipped": duplicates,
                     }
                 )
             console.print("[yellow]Dry run - would create:[/yellow]")
@@ -1688,35 +2024,18 @@ priority = {priority}
             console.print(f"  Privacy: {privacy}")
             console.print(f"  Unique videos: {len(unique_videos)}")
             if duplicates:
-                console.print(f"  Duplicates skipped: {len(duplicates)}")
+                console.print(f"  Duplicates skipped: {duplicates}")
             console.print(f"  From {len(source_playlists)} playlists")
             return None
 
-        config = load_config()
+        config = self._load_config()
         client = self._get_youtube_client(config)
 
         if not self._json:
             console.print(f"[blue]Creating merged playlist: {playlist_title}[/blue]")
         new_id = api.create_playlist(client, playlist_title, privacy=privacy)
 
-        added = 0
-        if self._json:
-            for video in unique_videos:
-                try:
-                    api.add_video_to_playlist(client, new_id, video.id)
-                    added += 1
-                except Exception:
-                    pass
-        else:
-            with Progress(console=console, disable=(self._json or self._quiet)) as progress:
-                task = progress.add_task("Adding videos...", total=len(unique_videos))
-                for video in unique_videos:
-                    try:
-                        api.add_video_to_playlist(client, new_id, video.id)
-                        added += 1
-                    except Exception as e:
-                        console.print(f"[yellow]Skipped {video.id}: {e}[/yellow]")
-                    progress.advance(task)
+        added, _ = self._add_videos(client, new_id, unique_videos)
 
         url = f"https://www.youtube.com/playlist?list={new_id}"
         if not self._json:
@@ -1730,7 +2049,7 @@ priority = {priority}
                 "title": playlist_title,
                 "privacy": privacy,
                 "videos_added": added,
-                "duplicates_skipped": len(duplicates),
+                "duplicates_skipped": duplicates,
             }
         )
 
@@ -1748,23 +2067,20 @@ priority = {priority}
             ytrix plist2mlists PLxxx --by=channel
             ytrix plist2mlists PLxxx --by=year --dry-run
         """
-        if by not in ("channel", "year"):
+        key_fn = _SPLIT_KEYS.get(by)
+        if key_fn is None:
             raise ValueError("--by must be 'channel' or 'year'")
 
         if not self._json:
             console.print("[blue]Extracting playlist...[/blue]")
-        source = extractor.extract_playlist(url_or_id)
+        source = extractor.extract_playlist(url_or_id, use_cache=self._use_cache)
         if not self._json:
             console.print(f"Found: {source.title} ({len(source.videos)} videos)")
 
         # Group videos by criterion
-        groups: dict[str, list[Any]] = defaultdict(list)
+        groups: dict[str, list[Video]] = defaultdict(list)
         for video in source.videos:
-            if by == "channel":
-                key = video.channel or "Unknown Channel"
-            else:  # year
-                key = video.upload_date[:4] if video.upload_date else "Unknown Year"
-            groups[key].append(video)
+            groups[key_fn(video)].append(video)
 
         # Preview mode
         if dry_run:
@@ -1787,7 +2103,7 @@ priority = {priority}
                 console.print(f"  {p['title']}: {p['video_count']} videos")
             return None
 
-        config = load_config()
+        config = self._load_config()
         client = self._get_youtube_client(config)
 
         if not self._json:
@@ -1795,34 +2111,29 @@ priority = {priority}
 
         created_playlists: list[dict[str, Any]] = []
 
-        for group_name, videos in groups.items():
-            title = f"{source.title} - {group_name}"
-            if not self._json:
-                console.print(f"  {title}: {len(videos)} videos")
+        # One progress display for all groups; each playlist adds its own task
+        with self._progress(sum(map(len, groups.values()))) as progress:
+            for group_name, videos in groups.items():
+                title = f"{source.title} - {group_name}"
+                if not self._json:
+                    console.print(f"  {title}: {len(videos)} videos")
 
-            new_id = api.create_playlist(client, title, source.description)
+                new_id = api.create_playlist(client, title, source.description)
 
-            added = 0
-            for video in videos:
-                try:
-                    api.add_video_to_playlist(client, new_id, video.id)
-                    added += 1
-                except Exception as e:
-                    if not self._json:
-                        console.print(f"[yellow]Skipped {video.id}: {e}[/yellow]")
+                added, _ = self._add_videos(client, new_id, videos, progress=progress)
 
-            url = f"https://www.youtube.com/playlist?list={new_id}"
-            created_playlists.append(
-                {
-                    "playlist_id": new_id,
-                    "url": url,
-                    "title": title,
-                    "group": group_name,
-                    "videos_added": added,
-                }
-            )
-            if not self._json:
-                console.print(f"[green]Created: {url}[/green]")
+                url = f"https://www.youtube.com/playlist?list={new_id}"
+                created_playlists.append(
+                    {
+                        "playlist_id": new_id,
+                        "url": url,
+                        "title": title,
+                        "group": group_name,
+                        "videos_added": added,
+                    }
+                )
+                if not self._json:
+                    console.print(f"[green]Created: {url}[/green]")
 
         if self._json:
             return self._output(
@@ -1860,7 +2171,14 @@ priority = {priority}
             ytrix plists2mlists playlists.txt
             ytrix plists2mlists playlists.txt --resume  # After quota resets
         """
-        config = load_config()
+        from ytrix.api import BatchAction, BatchOperationHandler, classify_error, display_error
+        from ytrix.dedup import (
+            MatchType,
+            analyze_batch_deduplication,
+            load_target_playlists_with_videos,
+        )
+
+        config = self._load_config()
 
         # Check for existing journal if resuming
         journal: Journal | None = None
@@ -1879,26 +2197,26 @@ priority = {priority}
                 if self._should_print:
                     console.print("[yellow]No journal found, starting fresh[/yellow]")
 
+        # Video IDs of target playlists already scanned for dedup, kept current
+        # as videos are added, so partial updates don't re-extract their target
+        target_video_ids: dict[str, set[str]] = {}
+
         # Read source playlists from file if not resuming with existing journal
         if not journal:
-            lines = Path(file_path).read_text().strip().split("\n")
-            lines = [line.strip() for line in lines if line.strip() and not line.startswith("#")]
-            if not lines:
-                raise ValueError("No playlist URLs found in file")
+            lines = _read_url_lines(file_path)
 
             if self._should_print:
                 console.print(f"[blue]Extracting {len(lines)} source playlists...[/blue]")
 
             source_playlists = []
-            for line in lines:
-                try:
-                    playlist = extractor.extract_playlist(line)
-                    source_playlists.append(playlist)
+            for line, playlist in _extract_many(lines, self._use_cache):
+                if isinstance(playlist, Exception):
                     if self._should_print:
-                        console.print(f"  {playlist.title}: {len(playlist.videos)} videos")
-                except Exception as e:
-                    if self._should_print:
-                        console.print(f"[yellow]Skipped {line}: {e}[/yellow]")
+                        console.print(f"[yellow]Skipped {line}: {playlist}[/yellow]")
+                    continue
+                source_playlists.append(playlist)
+                if self._should_print:
+                    console.print(f"  {playlist.title}: {len(playlist.videos)} videos")
 
             if not source_playlists:
                 raise ValueError("No valid playlists found")
@@ -1909,7 +2227,11 @@ priority = {priority}
             # Load target channel playlists for deduplication (uses yt-dlp, no quota)
             if not self._json:
                 console.print("[blue]Loading target channel playlists for deduplication...[/blue]")
-            target_playlists = load_target_playlists_with_videos(config.channel_id)
+            target_playlists = load_target_playlists_with_videos(
+                config.channel_id, refresh=not self._use_cache
+            )
+
+            target_video_ids = {p.id: {v.id for v in p.videos} for p in target_playlists}
 
             # Analyze deduplication
             dedup_results = analyze_batch_deduplication(source_playlists, target_playlists)
@@ -1926,6 +2248,7 @@ priority = {priority}
                             status=TaskStatus.SKIPPED,
                             match_type="exact",
                             match_playlist_id=target_id,
+                            save=False,
                         )
                     elif result.match_type == MatchType.PARTIAL:
                         target_id = result.target_playlist.id if result.target_playlist else None
@@ -1934,37 +2257,39 @@ priority = {priority}
                             source.id,
                             match_type="partial",
                             match_playlist_id=target_id,
+                            save=False,
                         )
+            save_journal(journal)
         else:
             # Resuming - reload source playlists for pending tasks
             source_playlists = []
-            for task in get_pending_tasks(journal):
-                try:
-                    playlist = extractor.extract_playlist(task.source_playlist_id)
-                    source_playlists.append(playlist)
-                except Exception as e:
-                    logger.warning("Failed to reload {}: {}", task.source_playlist_id, e)
+            pending_ids = [t.source_playlist_id for t in get_pending_tasks(journal)]
+            for source_id, playlist in _extract_many(pending_ids, self._use_cache):
+                if isinstance(playlist, Exception):
+                    logger.warning("Failed to reload {}: {}", source_id, playlist)
+                    continue
+                source_playlists.append(playlist)
 
-        # Calculate quota estimate
+        # One aggregate quota estimate for the whole batch, built in a single pass
         pending_tasks = get_pending_tasks(journal)
-        pending_ids = {t.source_playlist_id for t in pending_tasks}
-        total_videos = sum(len(p.videos) for p in source_playlists if p.id in pending_ids)
-        estimate = QuotaEstimate(
-            playlist_creates=len([t for t in pending_tasks if t.match_type != "partial"]),
-            video_adds=total_videos,
-            playlist_updates=len([t for t in pending_tasks if t.match_type == "partial"]),
+        video_counts = {p.id: len(p.videos) for p in source_playlists}
+        total_videos = 0
+        num_partial = 0
+        for t in pending_tasks:
+            total_videos += video_counts.get(t.source_playlist_id, 0)
+            num_partial += t.match_type == "partial"
+        estimate = estimate_batch_copy(
+            len(pending_tasks), total_videos, update_existing=num_partial
         )
 
         # Pre-flight quota check - show quota across ALL projects
-        manager = get_project_manager(config)
-        quota_info = manager.total_available_quota()
-
         if not self._json:
             console.print()
             console.print(format_quota_warning(estimate))
 
             # Show multi-project quota summary
             if config.is_multi_project:
+                quota_info = get_project_manager(config).total_available_quota()
                 console.print(
                     f"\n[blue]Available quota across {quota_info['num_projects']} projects "
                     f"(group: {quota_info['quota_group']}):[/blue]"
@@ -2035,15 +2360,24 @@ priority = {priority}
                     if not self._json:
                         console.print(f"[blue]Updating: {source_playlist.title}[/blue]")
                     target_id = task.match_playlist_id
-                    existing_ids = extractor.get_playlist_video_ids(target_id)
+                    existing_ids = target_video_ids.get(target_id)
+                    if existing_ids is None:  # Resumed run: no dedup scan this time
+                        existing_ids = target_video_ids[target_id] = (
+                            extractor.get_playlist_video_ids(target_id)
+                        )
+                    missing_videos = [v for v in source_playlist.videos if v.id not in existing_ids]
                     num_projects = len(config.get_project_names()) if config.is_multi_project else 1
                     added = 0
-                    for video in source_playlist.videos:
-                        if video.id not in existing_ids:
+                    with self._progress(len(missing_videos)) as progress:
+                        prog_task = progress.add_task(
+                            "Adding missing videos...", total=len(missing_videos)
+                        )
+                        for video in missing_videos:
                             # Try adding with project rotation (no decorator retries)
                             for _ in range(num_projects):
                                 try:
                                     api.add_video_to_playlist_raw(client, target_id, video.id)
+                                    existing_ids.add(video.id)
                                     added += 1
                                     if self._manager:
                                         self._manager.on_success()
@@ -2070,6 +2404,7 @@ priority = {priority}
                                     # Non-retryable error
                                     logger.warning("Failed to add {}: {}", video.id, e)
                                     break
+                            progress.advance(prog_task)
                     update_task(
                         journal,
                         task.source_playlist_id,
@@ -2128,7 +2463,7 @@ priority = {priority}
                         raise RuntimeError("Failed to create playlist after project rotation")
 
                     added = 0
-                    with Progress(console=console, disable=(self._json or self._quiet)) as progress:
+                    with self._progress(len(source_playlist.videos)) as progress:
                         prog_task = progress.add_task(
                             "Adding videos...", total=len(source_playlist.videos)
                         )
@@ -2278,7 +2613,7 @@ priority = {priority}
             ytrix mlists2yaml
             ytrix mlists2yaml --output my_playlists.yaml --details
         """
-        config = load_config()
+        config = self._load_config()
         client = self._get_youtube_client(config)
 
         if not self._json:
@@ -2287,28 +2622,26 @@ priority = {priority}
         if not self._json:
             console.print(f"Found {len(playlists)} playlists")
 
-        if details:
-            # Use yt-dlp to avoid API quota, fall back to API for private playlists
-            if self._json:
-                for playlist in playlists:
-                    try:
-                        extracted = extractor.extract_playlist(playlist.id)
-                        playlist.videos = extracted.videos
-                    except Exception:
-                        playlist.videos = api.get_playlist_videos(client, playlist.id)
-            else:
-                with Progress(console=console, disable=(self._json or self._quiet)) as progress:
-                    task = progress.add_task("Fetching video details...", total=len(playlists))
-                    for playlist in playlists:
-                        try:
-                            extracted = extractor.extract_playlist(playlist.id)
-                            playlist.videos = extracted.videos
-                        except Exception:
-                            playlist.videos = api.get_playlist_videos(client, playlist.id)
-                        progress.advance(task)
+        def with_videos() -> Iterator[Playlist]:
+            # yt-dlp (no API quota) runs over a thread pool. It can't read private
+            # playlists, so those (known from the API listing) and any it fails on
+            # go to the API here, on this thread, as the client isn't thread-safe
+            extracted = _extract_many(
+                [p.id for p in playlists if p.privacy != "private"], self._use_cache
+            )
+            for playlist in playlists:
+                result = None if playlist.privacy == "private" else next(extracted)[1]
+                if result is None or isinstance(result, Exception):
+                    playlist.videos = api.get_playlist_videos(client, playlist.id)
+                else:
+                    playlist.videos = result.videos
+                yield playlist
 
         # With --json-output, print JSON and skip file
         if self._json:
+            if details:
+                for _ in with_videos():
+                    pass  # fills each playlist's videos in place
             return self._output(
                 {
                     "playlists": [p.to_dict(include_videos=details) for p in playlists],
@@ -2316,7 +2649,25 @@ priority = {priority}
                 }
             )
 
-        yaml_ops.save_yaml(output, playlists, include_videos=details)
+        if not details:
+            yaml_ops.save_yaml(output, playlists, include_videos=False)
+        else:
+            with self._progress(len(playlists)) as progress:
+                task = progress.add_task("Fetching video details...", total=len(playlists))
+
+                fingerprints: dict[str, str] = {}
+
+                def written_and_released() -> Iterator[Playlist]:
+                    # Stream to the file: only one playlist's videos are held at a time
+                    for playlist in with_videos():
+                        yield playlist
+                        fingerprints[playlist.id] = yaml_ops.playlist_fingerprint(playlist)
+                        playlist.videos = []
+                        progress.advance(task)
+
+                yaml_ops.save_yaml(output, written_and_released(), include_videos=True)
+            # Lets yaml2mlists skip these playlists while the file is unedited
+            yaml_ops.record_exports(fingerprints)
         console.print(f"[green]Saved to: {output}[/green]")
         return output
 
@@ -2327,11 +2678,16 @@ priority = {priority}
             file_path: YAML file with playlist data
             dry_run: Show changes without applying
 
+        Playlists whose YAML is unchanged since mlists2yaml --details or
+        mlist2yaml exported them, or since yaml2mlists confirmed or applied
+        that exact state (within a day), are skipped without an API call;
+        --no-cache checks them anyway.
+
         Example:
             ytrix yaml2mlists playlists.yaml --dry-run
             ytrix yaml2mlists playlists.yaml
         """
-        config = load_config()
+        config = self._load_config()
         client = self._get_youtube_client(config)
 
         new_playlists = yaml_ops.load_yaml(file_path)
@@ -2339,11 +2695,49 @@ priority = {priority}
             console.print(f"[blue]Processing {len(new_playlists)} playlists...[/blue]")
 
         results: list[dict[str, Any]] = []
+        # Playlists exported (or checked) recently whose YAML is untouched need no API call
+        known = yaml_ops.load_export_index() if self._use_cache else {}
+        # Index updates by playlist ID: a fingerprint confirmed to match YouTube,
+        # or None when the live state may no longer match a recorded one
+        index_updates: dict[str, str | None] = {}
+        fingerprints = [yaml_ops.playlist_fingerprint(p) for p in new_playlists]
+        # Metadata for every other playlist in one playlists.list call per 50 IDs.
+        # Videos are still read per playlist, in this thread (the client isn't
+        # thread-safe); anything missing here is looked up on its own below.
+        to_fetch = list(
+            dict.fromkeys(
+                p.id
+                for p, fingerprint in zip(new_playlists, fingerprints, strict=True)
+                if known.get(p.id) != fingerprint
+            )
+        )
+        metadata: dict[str, Playlist] = {}
+        if to_fetch:
+            try:
+                metadata = api.get_playlists_by_id(client, to_fetch)
+            except Exception as e:
+                # Each playlist then looks up its own metadata and reports its own error
+                logger.warning("Batched playlist metadata lookup failed: {}", e)
 
-        for new_pl in new_playlists:
+        for new_pl, fingerprint in zip(new_playlists, fingerprints, strict=True):
             try:
+                if known.get(new_pl.id) == fingerprint:
+                    if not self._json:
+                        console.print(f"  {new_pl.title}: no changes (matches last export)")
+                    results.append(
+                        {
+                            "playlist_id": new_pl.id,
+                            "title": new_pl.title,
+                            "changes": {},
+                            "applied": False,
+                        }
+                    )
+                    continue
+
                 # Get current state
-                current = api.get_playlist_with_videos(client, new_pl.id)
+                current = api.get_playlist_with_videos(
+                    client, new_pl.id, metadata=metadata.get(new_pl.id)
+                )
                 changes = yaml_ops.diff_playlists(current, new_pl)
 
                 result: dict[str, Any] = {
@@ -2356,6 +2750,7 @@ priority = {priority}
                 if not changes:
                     if not self._json:
                         console.print(f"  {new_pl.title}: no changes")
+                    index_updates[new_pl.id] = fingerprint
                     results.append(result)
                     continue
 
@@ -2365,9 +2760,13 @@ priority = {priority}
                         console.print(f"    {key}: {val}")
 
                 if dry_run:
+                    index_updates[new_pl.id] = None
                     results.append(result)
                     continue
 
+                # Until the edits have gone through, YouTube is in neither state
+                index_updates[new_pl.id] = None
+
                 # Apply metadata changes
                 if any(k in changes for k in ("title", "description", "privacy")):
                     api.update_playlist(
@@ -2378,16 +2777,27 @@ priority = {priority}
                         privacy=new_pl.privacy if "privacy" in changes else None,
                     )
 
-                # Handle video removals
+                errors: dict[str, str] = {}
+
+                # Handle video removals (deletes don't depend on order, so batch them)
                 if "videos_removed" in changes:
                     items = api.get_playlist_items(client, new_pl.id)
                     item_by_video = {item.video_id: item for item in items}
-                    for vid_id in changes["videos_removed"]:
-                        if vid_id in item_by_video:
-                            api.remove_video_from_playlist(client, item_by_video[vid_id].item_id)
-                            logger.debug("Removed video {}", vid_id)
+                    video_by_item = {
+                        item_by_video[vid_id].item_id: vid_id
+                        for vid_id in changes["videos_removed"]
+                        if vid_id in item_by_video
+                    }
+                    removed_items, failed = api.batch_remove_playlist_items(
+                        client, list(video_by_item)
+                    )
+                    logger.debug("Removed {} videos", len(removed_items))
+                    for item_id, err in failed.items():
+                        logger.warning("Failed to remove video {}: {}", video_by_item[item_id], err)
+                        errors[video_by_item[item_id]] = str(err)
 
-                # Handle video additions
+                # Handle video additions one at a time: no reorder follows adds, so
+                # they must land in YAML order, which a batch does not guarantee
                 if "videos_added" in changes:
                     for vid_id in changes["videos_added"]:
                         try:
@@ -2395,6 +2805,13 @@ priority = {priority}
                             logger.debug("Added video {}", vid_id)
                         except Exception as e:
                             logger.warning("Failed to add video {}: {}", vid_id, e)
+                            errors[vid_id] = str(e)
+                if errors:
+                    result["errors"] = errors
+                elif not ("videos_added" in changes or "videos_removed" in changes):
+                    # Metadata and order now match the YAML exactly; adds and
+                    # removes leave the remaining videos in YouTube's order
+                    index_updates[new_pl.id] = fingerprint
 
                 # Handle reordering (after adds/removes)
                 if "videos_reordered" in changes and new_pl.videos:
@@ -2406,6 +2823,7 @@ priority = {priority}
                 results.append(result)
 
             except Exception as e:
+                index_updates[new_pl.id] = None
                 if not self._json:
                     console.print(f"[red]Error processing {new_pl.id}: {e}[/red]")
                 results.append(
@@ -2415,6 +2833,10 @@ priority = {priority}
                         "error": str(e),
                     }
                 )
+        yaml_ops.record_exports(
+            {pid: fp for pid, fp in index_updates.items() if fp is not None},
+            forget=[pid for pid, fp in index_updates.items() if fp is None],
+        )
 
         if self._json:
             return self._output(
@@ -2442,7 +2864,7 @@ priority = {priority}
             ytrix mlist2yaml PLxxx
             ytrix mlist2yaml PLxxx --output mylist.yaml
         """
-        config = load_config()
+        config = self._load_config()
         client = self._get_youtube_client(config)
 
         playlist_id = extract_playlist_id(url_or_id)
@@ -2452,19 +2874,24 @@ priority = {priority}
         if not response["items"]:
             raise ValueError(f"Playlist not found: {playlist_id}")
         item = response["items"][0]
+        privacy = item["status"]["privacyStatus"]
 
-        # Try yt-dlp for videos (no API quota), fall back to API for private playlists
-        try:
-            extracted = extractor.extract_playlist(playlist_id)
-            videos = extracted.videos
-        except Exception:
+        # Try yt-dlp for videos (no API quota); it can't read private playlists,
+        # so those go straight to the API, as does anything else it fails on
+        if privacy == "private":
             videos = api.get_playlist_videos(client, playlist_id)
+        else:
+            try:
+                extracted = extractor.extract_playlist(playlist_id, use_cache=self._use_cache)
+                videos = extracted.videos
+            except Exception:
+                videos = api.get_playlist_videos(client, playlist_id)
 
         playlist = Playlist(
             id=playlist_id,
             title=item["snippet"]["title"],
             description=item["snippet"].get("description", ""),
-            privacy=item["status"]["privacyStatus"],
+            privacy=privacy,
             videos=videos,
         )
 
@@ -2473,6 +2900,7 @@ priority = {priority}
 
         out_path = output or f"playlist_{playlist_id}.yaml"
         yaml_ops.save_yaml(out_path, [playlist])
+        yaml_ops.record_exports({playlist_id: yaml_ops.playlist_fingerprint(playlist)})
 
         console.print(f"[green]Saved to: {out_path}[/green]")
         return out_path
@@ -2498,7 +2926,7 @@ priority = {priority}
         max_languages: int = 5,
         langs: str | tuple[str, ...] | list[str] | None = None,
         delay: float = 0.5,
-        subtitle_delay: int = 1000,
+        subtitle_delay: int | None = None,
         video: bool = False,
         video_lang: str = "en",
         video_proxy: bool = False,
@@ -2521,7 +2949,8 @@ priority = {priority}
                    Takes precedence over max_languages when provided.
             delay: Seconds between video processing (default: 0.5)
             subtitle_delay: Milliseconds between subtitle downloads (default: 1000,
-                           increase to 2000-3000 if hitting 429 rate limit errors)
+                           or 200 with a rotating proxy; increase to 2000-3000 if
+                           hitting 429 rate limit errors)
             video: Download videos (highest quality with preferred audio language)
             video_lang: Preferred audio language for video (default: "en").
                        Useful for YouTube auto-dubbed videos.
@@ -2538,8 +2967,9 @@ priority = {priority}
         """
         output_dir = Path(output) if output else Path.cwd()
 
-        # Configure subtitle throttle delay
-        info.set_subtitle_throttle_delay(subtitle_delay)
+        # Configure subtitle throttle delay (the default already suits the proxy setup)
+        if subtitle_delay is not None:
+            info.set_subtitle_throttle_delay(subtitle_delay)
 
         if not self._json:
             console.print("[blue]Extracting playlist info...[/blue]")
@@ -2612,7 +3042,7 @@ priority = {priority}
         max_languages: int = 5,
         langs: str | tuple[str, ...] | list[str] | None = None,
         delay: float = 0.5,
-        subtitle_delay: int = 1000,
+        subtitle_delay: int | None = None,
         parallel: bool | None = None,
         video: bool = False,
         video_lang: str = "en",
@@ -2637,7 +3067,8 @@ priority = {priority}
                    Takes precedence over max_languages when provided.
             delay: Seconds between video processing (default: 0.5, ignored with proxy)
             subtitle_delay: Milliseconds between subtitle downloads (default: 1000,
-                           increase to 2000-3000 if hitting 429 rate limit errors)
+                           or 200 with a rotating proxy; increase to 2000-3000 if
+                           hitting 429 rate limit errors)
             parallel: Use parallel processing (default: auto based on proxy status)
             video: Download videos (highest quality with preferred audio language)
             video_lang: Preferred audio language for video (default: "en").
@@ -2657,17 +3088,21 @@ priority = {priority}
 
         output_dir = Path(output) if output else Path.cwd()
 
-        # Configure subtitle throttle delay
-        info.set_subtitle_throttle_delay(subtitle_delay)
+        # Configure subtitle throttle delay (the default already suits the proxy setup)
+        if subtitle_delay is not None:
+            info.set_subtitle_throttle_delay(subtitle_delay)
 
         # Read playlist URLs/IDs from file
-        lines = Path(file_path).read_text().strip().split("\n")
-        lines = [line.strip() for line in lines if line.strip() and not line.startswith("#")]
-        if not lines:
-            raise ValueError("No playlist URLs found in file")
+        lines = _read_url_lines(file_path)
+        unique_lines = _unique_playlist_lines(lines)
+        if len(unique_lines) < len(lines) and not self._json:
+            console.print(
+                f"[dim]Skipped {len(lines) - len(unique_lines)} duplicate playlists[/dim]"
+            )
+        lines = unique_lines
 
         use_parallel = parallel if parallel is not None else info.is_proxy_enabled()
-        workers = info.MAX_PARALLEL_WORKERS if use_parallel else 1
+        workers = min(info.MAX_PARALLEL_WORKERS, len(lines)) if use_parallel else 1
 
         if not self._json:
             mode = f"parallel ({workers} workers)" if workers > 1 else "sequential"
@@ -2719,7 +3154,13 @@ priority = {priority}
         if workers > 1 and len(lines) > 1:
             # Parallel playlist processing
             completed = 0
-            with ThreadPoolExecutor(max_workers=workers) as executor:
+            with (
+                ThreadPoolExecutor(max_workers=workers) as executor,
+                self._progress(len(lines)) as progress,
+            ):
+                # With a progress bar only failures get their own line
+                print_each = progress.disable and not self._json
+                prog_task = progress.add_task("Processing playlists...", total=len(lines))
                 futures = {executor.submit(process_playlist, url): url for url in lines}
                 for future in as_completed(futures):
                     url = futures[future]
@@ -2728,12 +3169,15 @@ priority = {priority}
                     results.append(result)
                     all_video_tasks.extend(video_tasks)
 
-                    if not self._json:
-                        if result.get("success"):
-                            title = result.get("title", url)[:50]
+                    if result.get("success"):
+                        title = result.get("title", url)[:50]
+                        output_folders.append(result["output_folder"])
+                        progress.update(prog_task, description=title, advance=1)
+                        if print_each:
                             console.print(f"[{completed}/{len(lines)}] [green]✓[/green] {title}")
-                            output_folders.append(result["output_folder"])
-                        else:
+                    else:
+                        progress.advance(prog_task)
+                        if not self._json:
                             err = result.get("error")
                             console.print(f"[{completed}/{len(lines)}] [red]✗[/red] {url}: {err}")
         else:
@@ -2764,16 +3208,21 @@ priority = {priority}
                     f"(deferred from {len(output_folders)} playlists)...[/blue]"
                 )
 
-            def video_progress_cb(idx: int, total: int, title: str) -> None:
-                if not self._json:
-                    console.print(f"  [{idx + 1}/{total}] {title[:50]}...")
+            with self._progress(len(all_video_tasks)) as progress:
+                print_each = progress.disable and not self._json
+                video_task = progress.add_task("Downloading videos...", total=len(all_video_tasks))
 
-            videos_downloaded, videos_failed = info.download_videos_batch(
-                all_video_tasks,
-                lang=video_lang,
-                use_proxy=video_proxy,
-                progress_callback=video_progress_cb,
-            )
+                def video_progress_cb(idx: int, total: int, title: str) -> None:
+                    progress.update(video_task, description=title[:50], completed=idx + 1)
+                    if print_each:
+                        console.print(f"  [{idx + 1}/{total}] {title[:50]}...")
+
+                videos_downloaded, videos_failed = info.download_videos_batch(
+                    all_video_tasks,
+                    lang=video_lang,
+                    use_proxy=video_proxy,
+                    progress_callback=video_progress_cb,
+                )
 
         if self._json:
             result_dict: dict[str, Any] = {
@@ -2794,8 +3243,22 @@ priority = {priority}
         return output_folders
 
 
+# Commands answered without importing fire or constructing YtrixCLI
+_FAST_COMMANDS = frozenset({"version", "help", "--help", "-h"})
+
+
 def main() -> None:
     """CLI entry point."""
+    argv = sys.argv[1:]
+    if len(argv) == 1 and argv[0] in _FAST_COMMANDS:
+        if argv[0] == "version":
+            console.print(f"ytrix {__version__}", highlight=False)
+        else:
+            _print_help()
+        return
+
+    import fire
+
     fire.Fire(YtrixCLI)
 
 
@@ -1,14 +1,16 @@
 """YouTube API client with OAuth2 authentication."""
 
+import functools
 import json
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Any
 
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import Resource, build
+from googleapiclient.discovery import Resource, build_from_document
 from googleapiclient.errors import HttpError
 from rich.console import Console
 from rich.panel import Panel
@@ -539,10 +541,32 @@ def get_credentials(config: Config) -> Credentials:
     return creds
 
 
+@functools.lru_cache(maxsize=1)
+def _youtube_discovery() -> dict[str, Any]:
+    """YouTube v3 discovery document bundled with google-api-python-client, parsed once.
+
+    build() re-reads and re-parses the ~390 KB document for every client, and a
+    multi-project run builds one client per project. build_from_document() only
+    adds derived parameters to the shared dict, the same ones each time.
+    """
+    from googleapiclient.discovery_cache import get_static_doc
+
+    doc = get_static_doc("youtube", "v3")
+    if doc is None:
+        raise RuntimeError("YouTube v3 discovery document not bundled with googleapiclient")
+    result: dict[str, Any] = json.loads(doc)
+    return result
+
+
+def build_youtube(**kwargs: Any) -> Resource:
+    """Build a YouTube v3 client (credentials= or http=) from the cached discovery doc."""
+    return build_from_document(_youtube_discovery(), **kwargs)
+
+
 def get_youtube_client(config: Config) -> Resource:
     """Get authenticated YouTube API client."""
     creds = get_credentials(config)
-    return build("youtube", "v3", credentials=creds)
+    return build_youtube(credentials=creds)
 
 
 def create_playlist_raw(
@@ -619,6 +643,116 @@ def add_video_to_playlist(client: Resource, playlist_id: str, video_id: str) ->
     return add_video_to_playlist_raw(client, playlist_id, video_id)
 
 
+def _batch_execute(
+    client: Resource,
+    keys: list[str],
+    make_request: Callable[[str], Any],
+    operation: str,
+    retry: Callable[[str], Any],
+) -> tuple[list[str], dict[str, HttpError]]:
+    """Run one request per key, 50 to an HTTP batch, as batch_add_videos describes.
+
+    Args:
+        client: YouTube API client
+        keys: One key (video or playlistItem ID) per request
+        make_request: Builds the unexecuted request for a key
+        operation: Quota operation recorded per successful request
+        retry: Retries one key on its own after a retryable failure
+
+    Returns:
+        (keys that succeeded in input order, errors keyed by key)
+    """
+    done: dict[int, str] = {}
+    failed: dict[int, HttpError] = {}
+
+    def on_response(request_id: str, response: Any, exception: HttpError | None) -> None:
+        index = int(request_id)
+        if exception is None:
+            record_quota(operation)
+            done[index] = keys[index]
+        else:
+            failed[index] = exception
+
+    for offset in range(0, len(keys), 50):
+        _throttler.wait()
+        batch = client.new_batch_http_request(callback=on_response)
+        for index, key in enumerate(keys[offset : offset + 50], start=offset):
+            batch.add(make_request(key), request_id=str(index))
+        batch.execute()
+
+        quota_errors = [e for e in failed.values() if _is_quota_exceeded(e)]
+        if quota_errors:
+            raise quota_errors[0]
+
+    for index in sorted(failed):
+        if not classify_error(failed[index]).retryable:
+            continue
+        try:
+            retry(keys[index])
+        except HttpError as e:
+            failed[index] = e
+        else:
+            done[index] = keys[index]
+            del failed[index]
+
+    return (
+        [done[i] for i in sorted(done)],
+        {keys[i]: failed[i] for i in sorted(failed)},
+    )
+
+
+def batch_add_videos(
+    client: Resource, playlist_id: str, video_ids: list[str]
+) -> tuple[list[str], dict[str, HttpError]]:
+    """Add videos to a playlist with one HTTP batch per 50 inserts. (50 quota units each)
+
+    The API runs batched calls in no guaranteed order, so use this only where
+    the position of the added videos doesn't matter. Sub-requests that fail
+    with a retryable error are retried one by one via add_video_to_playlist.
+    A quotaExceeded error is re-raised once its batch has finished.
+
+    Returns:
+        (IDs of the videos added in input order, errors keyed by video ID)
+    """
+
+    def insert(video_id: str) -> Any:
+        body = {
+            "snippet": {
+                "playlistId": playlist_id,
+                "resourceId": {"kind": "youtube#video", "videoId": video_id},
+            }
+        }
+        return client.playlistItems().insert(part="snippet", body=body)
+
+    return _batch_execute(
+        client,
+        video_ids,
+        insert,
+        "playlistItems.insert",
+        lambda video_id: add_video_to_playlist(client, playlist_id, video_id),
+    )
+
+
+def batch_remove_playlist_items(
+    client: Resource, playlist_item_ids: list[str]
+) -> tuple[list[str], dict[str, HttpError]]:
+    """Remove playlist items with one HTTP batch per 50 deletes. (50 quota units each)
+
+    Retries and quota errors are handled as in batch_add_videos, with
+    remove_video_from_playlist as the one-by-one fallback.
+
+    Returns:
+        (playlistItem IDs removed in input order, errors keyed by playlistItem ID)
+    """
+    return _batch_execute(
+        client,
+        playlist_item_ids,
+        lambda item_id: client.playlistItems().delete(id=item_id),
+        "playlistItems.delete",
+        lambda item_id: remove_video_from_playlist(client, item_id),
+    )
+
+
 @api_retry  # type: ignore[untyped-decorator]
 def remove_video_from_playlist(client: Resource, playlist_item_id: str) -> None:
     """Remove video from playlist by playlistItem ID. (50 quota units)"""
@@ -747,8 +881,42 @@ def get_playlist_videos(client: Resource, playlist_id: str) -> list[Video]:
     ]
 
 
-def get_playlist_with_videos(client: Resource, playlist_id: str) -> Playlist:
-    """Get playlist with all its videos."""
+@api_retry
+def get_playlists_by_id(client: Resource, playlist_ids: list[str]) -> dict[str, Playlist]:
+    """Fetch playlist metadata (no videos) in batches of 50 IDs.
+
+    Playlists that don't exist or aren't visible are missing from the result.
+    """
+    playlists: dict[str, Playlist] = {}
+    for chunk in _chunk_video_ids(playlist_ids):
+        response = (
+            client.playlists()
+            .list(part="snippet,status", id=",".join(chunk), maxResults=50)
+            .execute()
+        )
+        record_quota("playlists.list")
+        for item in response.get("items", []):
+            playlists[item["id"]] = Playlist(
+                id=item["id"],
+                title=item["snippet"]["title"],
+                description=item["snippet"].get("description", ""),
+                privacy=item["status"]["privacyStatus"],
+            )
+    return playlists
+
+
+def get_playlist_with_videos(
+    client: Resource, playlist_id: str, metadata: Playlist | None = None
+) -> Playlist:
+    """Get playlist with all its videos.
+
+    Pass metadata already fetched by get_playlists_by_id to skip the
+    playlists.list call; only the videos are then requested.
+    """
+    if metadata is not None:
+        metadata.videos = get_playlist_videos(client, playlist_id)
+        return metadata
+
     # Get playlist metadata
     response = client.playlists().list(part="snippet,status", id=playlist_id).execute()
     if not response["items"]:
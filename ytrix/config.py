@@ -22,8 +22,12 @@ Multi-project config.toml:
     client_secret = "..."
 """
 
+import contextlib
+import os
+import tempfile
 import tomllib
 from pathlib import Path
+from typing import Any
 
 from pydantic import BaseModel, field_validator
 
@@ -203,6 +207,26 @@ def get_token_path(project_name: str | None = None) -> Path:
     return get_tokens_dir() / f"{project_name}.json"
 
 
+# Parsed TOML files keyed by path; an entry is reused while (mtime_ns, size) match
+_TOML_CACHE: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+
+def read_toml(path: Path) -> dict[str, Any]:
+    """Parse a TOML file, reusing the previous parse while the file is unchanged.
+
+    The returned dict is shared with the cache and must not be mutated.
+    """
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _TOML_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    with open(path, "rb") as f:
+        data = tomllib.load(f)
+    _TOML_CACHE[path] = (key, data)
+    return data
+
+
 def load_config() -> Config:
     """Load configuration from ~/.ytrix/config.toml."""
     config_path = get_config_dir() / "config.toml"
@@ -221,7 +245,45 @@ def load_config() -> Config:
             "  client_id = 'your-client-id'\n"
             "  client_secret = 'your-client-secret'"
         )
-    with open(config_path, "rb") as f:
-        data = tomllib.load(f)
+    data = read_toml(config_path)
     config: Config = Config.model_validate(data)
     return config
+
+
+def _toml_value(value: str | int) -> str:
+    """Format a scalar as TOML, escaping strings as basic strings."""
+    if isinstance(value, int):
+        return str(value)
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return (
+        '"' + "".join(c if c >= " " and c != "\x7f" else f"\\u{ord(c):04x}" for c in escaped) + '"'
+    )
+
+
+def append_project(config_path: Path, project: dict[str, str | int]) -> None:
+    """Append a [[projects]] entry to config.toml, keeping existing formatting.
+
+    The new file is parsed before it replaces the old one, and is written to a
+    private temporary sibling then renamed, so a failure never leaves a broken
+    config. A symlinked config.toml is updated at its target.
+
+    Args:
+        config_path: Path to config.toml.
+        project: Project fields (name, client_id, client_secret, ...).
+    """
+    config_path = config_path.resolve()  # Replace the target, not the symlink
+    entry = "\n".join(f"{key} = {_toml_value(value)}" for key, value in project.items())
+    text = f"{config_path.read_text().rstrip()}\n\n[[projects]]\n{entry}\n"
+    tomllib.loads(text)  # Never write a config we can't read back
+
+    # mkstemp creates the file 0o600, so secrets are never briefly world-readable
+    fd, tmp_name = tempfile.mkstemp(dir=config_path.parent, prefix=f".{config_path.name}.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.chmod(tmp_name, config_path.stat().st_mode & 0o777)  # Keep the original mode
+        os.replace(tmp_name, config_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
@@ -3,7 +3,9 @@
 this_file: ytrix/dashboard.py
 """
 
+import bisect
 from datetime import datetime, timedelta
+from typing import Any
 from zoneinfo import ZoneInfo
 
 from rich.console import Console
@@ -11,6 +13,13 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
+# Dashboard status by usage percentage: below 80% / below 95% / 95% and above
+_DASHBOARD_THRESHOLDS = (80, 95)
+_DASHBOARD_LEVELS = (("green", "ACTIVE"), ("yellow", "WARNING"), ("red", "CRITICAL"))
+
+# Project quota color indexed by usage decile (0-9%, 10-19%, ..., 100%+)
+_QUOTA_BAR_COLORS = ("green",) * 7 + ("yellow",) * 2 + ("red",) * 2
+
 
 def get_time_until_reset() -> str:
     """Calculate time until midnight Pacific Time when quota resets.
@@ -51,18 +60,10 @@ def create_quota_dashboard(
 
     # Calculate percentage and color
     percentage = (used / limit) * 100 if limit > 0 else 0
-    if percentage < 80:
-        bar_color = "green"
-        status_color = "green"
-        status_text = "ACTIVE"
-    elif percentage < 95:
-        bar_color = "yellow"
-        status_color = "yellow"
-        status_text = "WARNING"
-    else:
-        bar_color = "red"
-        status_color = "red"
-        status_text = "CRITICAL"
+    bar_color, status_text = _DASHBOARD_LEVELS[
+        bisect.bisect_right(_DASHBOARD_THRESHOLDS, percentage)
+    ]
+    status_color = bar_color
 
     # Build the dashboard content
     content = Text()
@@ -125,6 +126,48 @@ def create_operations_table(operations: dict[str, tuple[int, int]]) -> Table:
     return table
 
 
+def create_projects_table(projects: list[dict[str, Any]]) -> Table:
+    """Create table of configured projects and their quota usage.
+
+    Args:
+        projects: Project status dicts as returned by ProjectManager.status_summary()
+
+    Returns:
+        Rich Table with one row per project
+    """
+    table = Table(box=None, show_header=True, header_style="bold")
+    table.add_column("Group", style="dim")
+    table.add_column("Name")
+    table.add_column("Quota", justify="right")
+    table.add_column("Status")
+
+    for proj in projects:
+        used = proj.get("quota_used", 0)
+        limit = proj.get("quota_limit", 10000)
+        remaining = proj.get("quota_remaining", max(0, limit - used))
+        env = proj.get("environment", "prod")
+
+        pct = (used / limit * 100) if limit > 0 else 0
+        bar_color = _QUOTA_BAR_COLORS[min(int(pct) // 10, 10)]
+
+        marker = "[green]→[/green] " if proj.get("current") else "  "
+        env_tag = f" [dim]\\[{env}][/dim]" if env != "prod" else ""
+        status = []
+        if proj.get("current"):
+            status.append("[green]ACTIVE[/green]")
+        if proj.get("is_exhausted"):
+            status.append("[red]exhausted[/red]")
+
+        table.add_row(
+            str(proj.get("quota_group", "default")),
+            f"{marker}[bold]{proj['name']}[/bold]{env_tag}",
+            f"[{bar_color}]{used:,}[/{bar_color}] / {limit:,} ({remaining:,} remaining)",
+            " ".join(status),
+        )
+
+    return table
+
+
 def show_quota_warning(percentage: float, remaining: int) -> None:
     """Show quota warning at thresholds.
 
@@ -107,25 +107,43 @@ def find_matching_playlist(
     return MatchResult(match_type=MatchType.NONE)
 
 
-def load_target_playlists_with_videos(channel_id: str) -> list[Playlist]:
+# Target channel playlists already loaded in this process, by channel ID
+_target_playlists: dict[str, list[Playlist]] = {}
+
+
+def load_target_playlists_with_videos(channel_id: str, refresh: bool = False) -> list[Playlist]:
     """Load all playlists from target channel with their videos.
 
-    Uses yt-dlp for zero API quota cost.
+    Uses yt-dlp for zero API quota cost. Results are kept for the rest of the
+    process, and the extractor's on-disk cache serves repeat runs within its
+    TTL, so batch workflows don't rescan the whole channel every time.
 
     Args:
         channel_id: YouTube channel ID (UCxxx format)
+        refresh: Ignore both caches and rescan the channel
 
     Returns:
         List of Playlist objects with videos populated
     """
+    if not refresh and channel_id in _target_playlists:
+        return _target_playlists[channel_id]
+
     logger.info("Loading target channel playlists via yt-dlp (no quota)...")
     try:
-        playlists = extractor.extract_channel_playlists_with_videos(channel_id)
+        playlists = extractor.extract_channel_playlists_with_videos(
+            channel_id, use_cache=not refresh
+        )
         logger.info("Loaded {} playlists from target channel", len(playlists))
-        return playlists
     except Exception as e:
         logger.warning("Failed to load target playlists: {}", e)
         return []
+    _target_playlists[channel_id] = playlists
+    return playlists
+
+
+def forget_target_playlists(channel_id: str) -> None:
+    """Drop the in-process copy of a channel's playlists after changing them."""
+    _target_playlists.pop(channel_id, None)
 
 
 def analyze_batch_deduplication(
@@ -201,21 +201,23 @@ def extract_channel_playlists(channel_url: str, use_cache: bool = True) -> list[
     return playlists
 
 
-def _extract_playlist_safe(playlist_id: str) -> tuple[str, Playlist | None, str | None]:
+def _extract_playlist_safe(
+    playlist_id: str, use_cache: bool = True
+) -> tuple[str, Playlist | None, str | None]:
     """Thread-safe wrapper for extract_playlist.
 
     Returns:
         Tuple of (playlist_id, Playlist or None, error message or None)
     """
     try:
-        playlist = extract_playlist(playlist_id)
+        playlist = extract_playlist(playlist_id, use_cache=use_cache)
         return (playlist_id, playlist, None)
     except Exception as e:
         return (playlist_id, None, str(e))
 
 
 def extract_channel_playlists_with_videos(
-    channel_url: str, parallel: bool | None = None
+    channel_url: str, parallel: bool | None = None, use_cache: bool = True
 ) -> list[Playlist]:
     """Extract all public playlists from a channel WITH their video lists.
 
@@ -225,12 +227,13 @@ def extract_channel_playlists_with_videos(
     Args:
         channel_url: Channel URL, handle (@username), or channel ID
         parallel: Use parallel extraction (default: auto based on proxy status)
+        use_cache: Whether to use cached data (default True)
 
     Returns:
         List of Playlist objects with videos populated
     """
     use_parallel = parallel if parallel is not None else is_proxy_enabled()
-    playlists = extract_channel_playlists(channel_url)
+    playlists = extract_channel_playlists(channel_url, use_cache=use_cache)
 
     if not playlists:
         return playlists
@@ -245,7 +248,9 @@ def extract_channel_playlists_with_videos(
         playlist_map: dict[str, Playlist] = {}
 
         with ThreadPoolExecutor(max_workers=MAX_PARALLEL_WORKERS) as executor:
-            futures = {executor.submit(_extract_playlist_safe, p.id): p for p in playlists}
+            futures = {
+                executor.submit(_extract_playlist_safe, p.id, use_cache): p for p in playlists
+            }
             for future in as_completed(futures):
                 playlist_id, full_playlist, error = future.result()
                 if full_playlist:
@@ -267,7 +272,7 @@ def extract_channel_playlists_with_videos(
         # Sequential extraction (original behavior)
         for playlist in playlists:
             try:
-                full = extract_playlist(playlist.id)
+                full = extract_playlist(playlist.id, use_cache=use_cache)
                 playlist.videos = full.videos
             except Exception:
                 pass  # Skip playlists we can't read
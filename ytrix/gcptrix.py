@@ -10,11 +10,14 @@ configuration from a source project to a new project with a suffix.
 
 import argparse
 import contextlib
+import functools
 import json
+import os
 import shutil
 import subprocess
 import sys
 import tempfile
+import time
 from pathlib import Path
 
 
@@ -71,8 +74,9 @@ def print_info(message: str) -> None:
     print(f"  → {message}")
 
 
+@functools.lru_cache(maxsize=1)
 def check_gcloud_installed() -> bool:
-    """Check if gcloud CLI is installed and accessible."""
+    """Check if gcloud CLI is installed and accessible (memoized per process)."""
     return shutil.which("gcloud") is not None
 
 
@@ -130,24 +134,119 @@ def run_gcloud_command(
                     print_info(f"  {line}")
         return result.stdout.strip()
     except subprocess.CalledProcessError as e:
+        error_msg = e.stderr.strip() if e.stderr else "Unknown error"
+        if any(marker in error_msg.lower() for marker in _AUTH_FAILURE_MARKERS):
+            _forget_auth()  # A cached successful check no longer holds
         if allow_failure:
             return ""
-        error_msg = e.stderr.strip() if e.stderr else "Unknown error"
         raise GcloudError(f"Command failed: {' '.join(command)}\n{error_msg}") from e
     except FileNotFoundError as e:
         raise GcloudError("gcloud CLI not found. Please install the Google Cloud SDK.") from e
 
 
-def check_authentication() -> dict:
+# Seconds a successful authentication check is reused across invocations
+AUTH_CACHE_TTL = 300
+
+# gcloud stderr fragments (lowercased) that mean the credentials stopped working
+_AUTH_FAILURE_MARKERS = (
+    "gcloud auth login",
+    "reauthentication",
+    "invalid_grant",
+    "refreshing your current auth tokens",
+    "do not currently have an active account",
+)
+
+# Successful check in this process: (monotonic expiry, account, gcloud state)
+_auth_memo: tuple[float, str, str] | None = None
+
+
+def _auth_cache_path() -> Path:
+    """Path of the on-disk authentication check cache."""
+    from ytrix.config import get_config_dir
+
+    return get_config_dir() / "gcloud_auth.json"
+
+
+def _gcloud_state() -> str:
+    """Identify the active gcloud configuration and its credentials.
+
+    Combines the gcloud config directory (CLOUDSDK_CONFIG), the active
+    configuration name, the CLOUDSDK_CORE_ACCOUNT override and the
+    modification times of the configuration file and credential store, so
+    `gcloud config set account`, `gcloud auth login/revoke` and switching
+    configurations all change it. Costs a few stat() calls, no subprocess.
+    """
+    default_dir = (
+        Path(os.environ.get("APPDATA", "~")) / "gcloud"
+        if sys.platform == "win32"
+        else Path("~/.config/gcloud")
+    )
+    config_dir = Path(os.environ.get("CLOUDSDK_CONFIG") or default_dir).expanduser()
+    name = os.environ.get("CLOUDSDK_ACTIVE_CONFIG_NAME", "")
+    if not name:
+        with contextlib.suppress(OSError):
+            name = (config_dir / "active_config").read_text().strip()
+    name = name or "default"
+    stamps = []
+    for path in (config_dir / "configurations" / f"config_{name}", config_dir / "credentials.db"):
+        try:
+            stamps.append(path.stat().st_mtime_ns)
+        except OSError:
+            stamps.append(0)
+    return json.dumps([str(config_dir), name, os.environ.get("CLOUDSDK_CORE_ACCOUNT", ""), stamps])
+
+
+def _read_auth_cache(state: str) -> tuple[float, str] | None:
+    """Return (seconds left, account) from the on-disk cache.
+
+    Only a check younger than AUTH_CACHE_TTL made under the same gcloud state counts.
+    """
+    try:
+        data = json.loads(_auth_cache_path().read_text())
+        age = time.time() - data["ts"]
+        if data["account"] and data["state"] == state and 0 <= age < AUTH_CACHE_TTL:
+            return AUTH_CACHE_TTL - age, str(data["account"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _forget_auth() -> None:
+    """Drop the cached authentication check, in memory and on disk."""
+    global _auth_memo
+    _auth_memo = None
+    with contextlib.suppress(OSError):
+        _auth_cache_path().unlink(missing_ok=True)
+
+
+def check_authentication(use_cache: bool = True) -> dict:
     """
     Check if the user is authenticated with gcloud.
 
+    A successful check is reused for AUTH_CACHE_TTL seconds, in memory for
+    this process and on disk for later invocations, so back-to-back gcp_*
+    commands skip the two gcloud subprocesses. It is only reused while the
+    active gcloud configuration and credentials are unchanged, and it is
+    dropped as soon as a check or any gcloud command reports an auth failure.
+
+    Args:
+        use_cache: Reuse a recent successful check instead of running gcloud.
+
     Returns:
         A dict with authentication status and account info.
 
     Raises:
         AuthenticationError: If not authenticated.
     """
+    global _auth_memo
+    state = _gcloud_state()
+    if use_cache:
+        if _auth_memo is None or time.monotonic() >= _auth_memo[0] or _auth_memo[2] != state:
+            cached = _read_auth_cache(state)
+            _auth_memo = (time.monotonic() + cached[0], cached[1], state) if cached else None
+        if _auth_memo is not None:
+            return {"account": _auth_memo[1], "authenticated": True}
+
     # Check active account
     try:
         account = run_gcloud_command(
@@ -157,6 +256,7 @@ def check_authentication() -> dict:
         account = ""
 
     if not account or account == "(unset)":
+        _forget_auth()
         raise AuthenticationError("No active gcloud account found.")
 
     # Check if credentials are valid by making a simple API call
@@ -166,10 +266,18 @@ def check_authentication() -> dict:
             allow_failure=False,
         )
     except GcloudError as e:
+        _forget_auth()
         raise AuthenticationError(
             f"Credentials are invalid or expired for account: {account}"
         ) from e
 
+    # Re-read: the checks above may have touched gcloud's own files
+    state = _gcloud_state()
+    _auth_memo = (time.monotonic() + AUTH_CACHE_TTL, account, state)
+    with contextlib.suppress(OSError):
+        _auth_cache_path().write_text(
+            json.dumps({"account": account, "state": state, "ts": time.time()})
+        )
     return {"account": account, "authenticated": True}
 
 
@@ -360,7 +468,7 @@ def set_iam_policy(project_id: str, policy_file: str, dry_run: bool = False) ->
 
 
 def get_enabled_services(project_id: str, dry_run: bool = False) -> list[str]:
-    """Get list of enabled services for a project."""
+    """Get enabled services for a project, sorted by name (ready for display)."""
     if dry_run:
         return []
 
@@ -368,7 +476,7 @@ def get_enabled_services(project_id: str, dry_run: bool = False) -> list[str]:
         ["gcloud", "services", "list", "--project", project_id, "--format=json"]
     )
     services = json.loads(output)
-    return [s["config"]["name"] for s in services if s["state"] == "ENABLED"]
+    return sorted(s["config"]["name"] for s in services if s["state"] == "ENABLED")
 
 
 def run_inventory(project_id: str) -> int:
@@ -479,7 +587,7 @@ def run_inventory(project_id: str) -> int:
         services = get_enabled_services(project_id)
         service_count = len(services)
         if services:
-            for svc in sorted(services):
+            for svc in services:
                 print(f"  {svc}")
             print(f"  Total: {service_count}")
         else:
@@ -521,6 +629,22 @@ def enable_service(project_id: str, service: str, dry_run: bool = False) -> None
     )
 
 
+# Services per `gcloud services enable` call; the Service Usage API caps a
+# batch enable at 20
+SERVICES_PER_ENABLE = 20
+
+
+def enable_services(project_id: str, services: list[str], dry_run: bool = False) -> None:
+    """Enable several services on a project with one gcloud call.
+
+    The call is all-or-nothing, so pass at most SERVICES_PER_ENABLE services.
+    """
+    run_gcloud_command(
+        ["gcloud", "services", "enable", *services, "--project", project_id],
+        dry_run=dry_run,
+    )
+
+
 def get_service_accounts(project_id: str, dry_run: bool = False) -> list[dict]:
     """Get list of service accounts in a project."""
     if dry_run:
@@ -8,10 +8,12 @@ This module extracts comprehensive info from YouTube playlists including:
 
 from __future__ import annotations
 
+import functools
 import os
 import random
 import re
 import tempfile
+import threading
 import time
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -124,19 +126,28 @@ class Throttler:
     """Enforces minimum delay between yt-dlp operations with adaptive backoff.
 
     Helps avoid 429 RATE_LIMIT_EXCEEDED errors by pacing requests.
-    Automatically increases delay when errors occur.
+    Automatically increases delay when errors occur. Safe to share between
+    threads: each caller reserves the next start slot, so concurrent calls
+    overlap their work while their start times stay delay_ms apart.
+
+    With burst > 1 it behaves as a token bucket: after an idle period up to
+    burst calls may start at once, while the long-run rate stays one call
+    per delay_ms. A rate-limit error drops any saved-up burst.
     """
 
-    def __init__(self, delay_ms: int = 500) -> None:
+    def __init__(self, delay_ms: int = 500, burst: int = 1) -> None:
         """Initialize throttler.
 
         Args:
             delay_ms: Minimum milliseconds between calls (default: 500ms)
+            burst: Calls allowed back to back after idling (default: 1)
         """
         self._delay_ms = delay_ms
         self._base_delay_ms = delay_ms
-        self._last_call: float = 0.0
+        self._burst = max(1, burst)
+        self._next_slot: float = 0.0  # Earliest start of the next call without burst
         self._consecutive_errors: int = 0
+        self._lock = threading.Lock()
 
     @property
     def delay_ms(self) -> int:
@@ -148,16 +159,22 @@ class Throttler:
         if self._delay_ms <= 0:
             return
 
-        now = time.monotonic()
-        elapsed_ms = (now - self._last_call) * 1000
-
-        if elapsed_ms < self._delay_ms:
-            sleep_ms = self._delay_ms - elapsed_ms
-            # Add small jitter to avoid thundering herd
-            jitter = random.uniform(0, sleep_ms * 0.1)
-            time.sleep((sleep_ms + jitter) / 1000)
-
-        self._last_call = time.monotonic()
+        with self._lock:
+            now = time.monotonic()
+            delay_s = self._delay_ms / 1000
+            # Slots not used while idle may be spent now, up to burst - 1 of them
+            earliest = self._next_slot - (self._burst - 1) * delay_s
+            sleep_s = 0.0
+            if now < earliest:
+                sleep_ms = (earliest - now) * 1000
+                # Add small jitter to avoid thundering herd
+                jitter = random.uniform(0, sleep_ms * 0.1)
+                sleep_s = (sleep_ms + jitter) / 1000
+            # Reserve this slot before sleeping
+            self._next_slot = max(self._next_slot, now + sleep_s) + delay_s
+
+        if sleep_s:
+            time.sleep(sleep_s)
 
     def on_success(self) -> None:
         """Called after successful request - gradually reduce delay."""
@@ -175,8 +192,11 @@ class Throttler:
         self._consecutive_errors += 1
         ctx = f" [{context}]" if context else ""
         if is_rate_limit:
-            # Rate limit: aggressive backoff
+            # Rate limit: aggressive backoff, and no more bursting until idle again
             self._delay_ms = min(30000, self._delay_ms * 2 + 1000)
+            with self._lock:
+                drained = time.monotonic() + self._burst * self._delay_ms / 1000
+                self._next_slot = max(self._next_slot, drained)
             logger.warning("Rate limit hit{}, throttle delay now {}ms", ctx, self._delay_ms)
         else:
             # Other error: modest increase
@@ -195,12 +215,14 @@ class Throttler:
 _YTDLP_DELAY_MS = 100 if _proxy_enabled else 500
 _SUBTITLE_DELAY_MS = 200 if _proxy_enabled else 1000
 
-_ytdlp_throttler = Throttler(delay_ms=_YTDLP_DELAY_MS)
-_subtitle_throttler = Throttler(delay_ms=_SUBTITLE_DELAY_MS)
-
 # Max parallel workers for video extraction (only effective with proxy)
 MAX_PARALLEL_WORKERS = 6 if _proxy_enabled else 1
 
+_ytdlp_throttler = Throttler(delay_ms=_YTDLP_DELAY_MS)
+# Through the proxy each worker may start a subtitle fetch at once; direct
+# connections stay strictly paced
+_subtitle_throttler = Throttler(delay_ms=_SUBTITLE_DELAY_MS, burst=MAX_PARALLEL_WORKERS)
+
 
 def set_ytdlp_throttle_delay(delay_ms: int) -> None:
     """Set the throttle delay for yt-dlp operations.
@@ -460,10 +482,25 @@ def format_duration(seconds: int) -> str:
     return f"{minutes}:{secs:02d}"
 
 
+# Characters not allowed in filenames on common filesystems, mapped to "_"
+_UNSAFE_FILENAME_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*', "_"))
+
+# HTML/VTT cue tags like <font color="#CCCCCC"> or <c.colorE5E5E5>
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# libyaml's C emitter when PyYAML was built with it; the output loads back identically
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+@functools.lru_cache(maxsize=4096)
 def _sanitize_filename(name: str) -> str:
-    """Sanitize string for use as filename."""
+    """Sanitize string for use as filename.
+
+    Memoized: each video title is sanitized for its subtitle, markdown and
+    video file names and again for playlist.yaml.
+    """
     # Replace problematic characters
-    name = re.sub(r'[<>:"/\\|?*]', "_", name)
+    name = name.translate(_UNSAFE_FILENAME_CHARS)
     # Remove leading/trailing dots and spaces
     name = name.strip(". ")
     # Limit length
@@ -712,13 +749,31 @@ def extract_playlist_info(url_or_id: str, max_retries: int = 5) -> PlaylistInfo:
     )
 
 
+# One long-lived YoutubeDL per worker thread for direct subtitle fetches, so the
+# connection pool (and TLS session) is reused instead of rebuilt per file
+_subtitle_ydl_local = threading.local()
+
+
+def _fetch_subtitle_url(url: str) -> str:
+    """Fetch a subtitle file by URL through this thread's reused YoutubeDL."""
+    ydl = getattr(_subtitle_ydl_local, "ydl", None)
+    if ydl is None:
+        ydl = YoutubeDL(get_ytdlp_base_opts())  # pyright: ignore[reportArgumentType]
+        _subtitle_ydl_local.ydl = ydl
+    with ydl.urlopen(url) as response:
+        data: bytes = response.read()
+    return data.decode("utf-8")
+
+
 def download_subtitle(
     sub: SubtitleInfo, video_id: str | None = None, max_retries: int = 5
 ) -> str | None:
     """Download subtitle content using yt-dlp.
 
     Uses yt-dlp for downloading to benefit from its rate limiting,
-    session management, and retry logic.
+    session management, and retry logic. An SRT/VTT track whose URL is
+    already known is fetched directly over a pooled connection; anything
+    else, or a failed direct fetch, goes through a full yt-dlp download.
 
     Args:
         sub: SubtitleInfo with language and source info
@@ -733,9 +788,24 @@ def download_subtitle(
         return None
 
     context = f"{video_id}/{sub.lang}"
+    direct_url = sub.url if sub.ext in ("srt", "vtt") else None
     for attempt in range(max_retries):
         _subtitle_throttler.wait()
         try:
+            if direct_url:
+                try:
+                    content = _fetch_subtitle_url(direct_url)
+                except Exception as e:
+                    if _is_rate_limit_error(e):
+                        raise
+                    # Expired or IP-bound URL: fall back to re-extracting
+                    logger.debug("[{}] Direct {} subtitle fetch failed: {}", video_id, sub.lang, e)
+                    direct_url = None
+                else:
+                    _subtitle_throttler.on_success()
+                    logger.debug("[{}] Downloaded {} subtitle", video_id, sub.lang)
+                    return content
+
             with tempfile.TemporaryDirectory() as tmpdir:
                 # Configure yt-dlp for subtitle-only download with custom logger
                 opts = get_ytdlp_base_opts()
@@ -824,7 +894,8 @@ def srt_to_transcript(srt_content: str) -> str:
             continue
 
         # Remove HTML tags like <font color="#CCCCCC">
-        line = re.sub(r"<[^>]+>", "", line)
+        if "<" in line:
+            line = _TAG_RE.sub("", line)
 
         # Add text
         if line:
@@ -877,7 +948,8 @@ def vtt_to_transcript(vtt_content: str) -> str:
             continue
 
         # Remove HTML tags and VTT cue tags like <c.colorE5E5E5>
-        line = re.sub(r"<[^>]+>", "", line)
+        if "<" in line:
+            line = _TAG_RE.sub("", line)
 
         # Add text
         if line:
@@ -950,7 +1022,9 @@ def create_video_markdown(video: VideoInfo, lang: str, transcript: str) -> str:
             desc = desc[:500] + "..."
         frontmatter["description"] = desc
 
-    yaml_str = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True)
+    yaml_str = yaml.dump(
+        frontmatter, Dumper=_YAML_DUMPER, default_flow_style=False, allow_unicode=True
+    )
 
     return f"---\n{yaml_str}---\n\n{transcript}\n"
 
@@ -996,6 +1070,8 @@ def extract_and_save_playlist_info(
     # Create playlist folder
     playlist_folder = output_dir / _sanitize_filename(playlist.title)
     playlist_folder.mkdir(parents=True, exist_ok=True)
+    # One directory listing instead of two stat() calls per subtitle when resuming
+    existing_files = {entry.name for entry in os.scandir(playlist_folder)}
 
     total_videos = len(playlist.videos)
     failed_videos: list[str] = []
@@ -1049,7 +1125,8 @@ def extract_and_save_playlist_info(
                     logger.warning("[{}] Failed to process video: {}", video.id, e)
                 continue
 
-    # Process subtitles for all successfully extracted videos
+    # Pick the subtitles to fetch for all successfully extracted videos
+    subtitle_jobs: list[tuple[VideoInfo, SubtitleInfo, Path, Path]] = []
     for video in playlist.videos:
         if video.id in failed_videos or not video.subtitles:
             continue
@@ -1086,18 +1163,27 @@ def extract_and_save_playlist_info(
                 if len(selected_subs) >= max_languages:
                     break
 
-        # Download and save subtitles
         for sub in selected_subs:
             sub_ext = sub.ext if sub.ext in ("srt", "vtt") else "srt"
             sub_path = playlist_folder / f"{file_prefix}.{sub.lang}.{sub_ext}"
             md_path = playlist_folder / f"{file_prefix}.{sub.lang}.md"
 
             # Skip if both files already exist
-            if sub_path.exists() and md_path.exists():
+            if sub_path.name in existing_files and md_path.name in existing_files:
                 logger.info("[{}] Skipped (exists): {}", video.id, sub_path.name)
                 continue
-
-            content = download_subtitle(sub, video_id=video.id)
+            subtitle_jobs.append((video, sub, sub_path, md_path))
+
+    # Download subtitles (concurrently when parallel, still paced by the subtitle
+    # throttler) and save them here, in playlist order
+    def fetch(job: tuple[VideoInfo, SubtitleInfo, Path, Path]) -> str | None:
+        return download_subtitle(job[1], video_id=job[0].id)
+
+    workers = MAX_PARALLEL_WORKERS if use_parallel else 1
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(subtitle_jobs)))) as executor:
+        for (video, sub, sub_path, md_path), content in zip(
+            subtitle_jobs, executor.map(fetch, subtitle_jobs), strict=True
+        ):
             if not content:
                 continue
 
@@ -1114,7 +1200,14 @@ def extract_and_save_playlist_info(
     # Save playlist.yaml
     playlist_yaml_path = playlist_folder / "playlist.yaml"
     with open(playlist_yaml_path, "w", encoding="utf-8") as f:
-        yaml.dump(playlist.to_dict(), f, default_flow_style=False, allow_unicode=True, width=120)
+        yaml.dump(
+            playlist.to_dict(),
+            f,
+            Dumper=_YAML_DUMPER,
+            default_flow_style=False,
+            allow_unicode=True,
+            width=120,
+        )
     logger.info("Saved: {}", playlist_yaml_path)
 
     # Report summary
@@ -1128,7 +1221,7 @@ def extract_and_save_playlist_info(
     return playlist
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoDownloadTask:
     """Pending video download task."""
 
@@ -1234,6 +1327,10 @@ def download_videos_batch(
 ) -> tuple[int, int]:
     """Download multiple videos from a task queue.
 
+    Downloads run in parallel (up to MAX_PARALLEL_WORKERS) only through the
+    rotating proxy, where each one leaves from a different IP; direct
+    downloads stay sequential so a single IP doesn't trigger 429s.
+
     Args:
         tasks: List of VideoDownloadTask to process
         lang: Preferred audio language code (default: "en")
@@ -1249,24 +1346,53 @@ def download_videos_batch(
     success = 0
     failed = 0
     total = len(tasks)
+    workers = MAX_PARALLEL_WORKERS if use_proxy and _proxy_url else 1
 
     logger.info("Starting batch video download: {} videos", total)
 
-    for i, task in enumerate(tasks):
-        if progress_callback:
-            progress_callback(i, total, task.title)
+    if workers <= 1:
+        for i, task in enumerate(tasks):
+            if progress_callback:
+                progress_callback(i, total, task.title)
 
-        # Check if video already exists
-        expected_path = task.output_path.with_suffix(".mp4")
-        if expected_path.exists():
-            logger.debug("Skipping {} (already exists)", task.video_id)
-            success += 1
-            continue
+            # Check if video already exists
+            expected_path = task.output_path.with_suffix(".mp4")
+            if expected_path.exists():
+                logger.debug("Skipping {} (already exists)", task.video_id)
+                success += 1
+                continue
 
-        if download_video(task.video_id, task.output_path, lang=lang, use_proxy=use_proxy):
+            if download_video(task.video_id, task.output_path, lang=lang, use_proxy=use_proxy):
+                success += 1
+            else:
+                failed += 1
+
+        logger.info("Video download complete: {}/{} succeeded", success, total)
+        return success, failed
+
+    pending = []
+    for task in tasks:
+        if task.output_path.with_suffix(".mp4").exists():
+            logger.debug("Skipping {} (already exists)", task.video_id)
             success += 1
         else:
-            failed += 1
+            pending.append(task)
+    completed = success
+
+    logger.info("Downloading {} videos in parallel (max {} workers)", len(pending), workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(download_video, t.video_id, t.output_path, lang, use_proxy): t
+            for t in pending
+        }
+        for future in as_completed(futures):
+            if progress_callback:
+                progress_callback(completed, total, futures[future].title)
+            completed += 1
+            if future.result():
+                success += 1
+            else:
+                failed += 1
 
     logger.info("Video download complete: {}/{} succeeded", success, total)
     return success, failed
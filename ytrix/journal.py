@@ -4,7 +4,10 @@ Keeps a record of what we're doing, so if a run fails or hits a quota limit,
 we can pick up exactly where we left off without redoing work.
 """
 
+import contextlib
 import json
+import os
+import tempfile
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -130,12 +133,33 @@ def load_journal() -> Journal | None:
 
 
 def save_journal(journal: Journal) -> None:
-    """Save journal to disk."""
+    """Save journal to disk.
+
+    Writes a private temporary sibling, fsyncs it and renames it over the old
+    file, so a crash mid-write leaves the previous journal intact. The
+    directory is fsynced too, so the rename itself survives a power loss.
+    """
     path = get_journal_path()
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(journal.to_dict(), f, indent=2)
-    path.chmod(0o600)  # Restrict permissions
+    # mkstemp creates the file 0o600, matching the journal's restricted permissions
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(journal.to_dict(), f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+    # Platforms without directory file descriptors (Windows) skip this step
+    with contextlib.suppress(OSError):
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
     logger.debug("Saved journal to {}", path)
 
 
@@ -179,8 +203,13 @@ def update_task(
     match_type: str | None = None,
     match_playlist_id: str | None = None,
     increment_retry: bool = False,
+    save: bool = True,
 ) -> None:
-    """Update a task in the journal and save."""
+    """Update a task in the journal and save.
+
+    Pass save=False when updating many tasks in a row, then call save_journal
+    once at the end.
+    """
     for task in journal.tasks:
         if task.source_playlist_id == source_playlist_id:
             if status is not None:
@@ -201,7 +230,8 @@ def update_task(
                 task.retry_count += 1
             task.last_updated = datetime.now().isoformat()
             break
-    save_journal(journal)
+    if save:
+        save_journal(journal)
 
 
 def get_pending_tasks(journal: Journal) -> list[Task]:
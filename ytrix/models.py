@@ -4,11 +4,17 @@ These models structure the metadata we pull from YouTube. They map directly
 to the YAML schema we use for configuration and caching.
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+def _intern(value: Any) -> Any:
+    """Intern strings so repeated IDs/channel names share one object; pass others through."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class Video:
     """A YouTube video and its metadata.
     
@@ -37,17 +43,19 @@ class Video:
         """Reconstruct a Video from a YAML dictionary.
         
         Fills missing fields with empty strings to prevent NoneType crashes later.
+        IDs and channel names are interned: large YAML files repeat the same
+        channels many times, and the diff code compares IDs heavily.
         """
         return cls(
-            id=data["id"],
+            id=_intern(data["id"]),
             title=data.get("title", ""),
-            channel=data.get("channel", ""),
+            channel=_intern(data.get("channel", "")),
             position=data.get("position", position),
             upload_date=data.get("upload_date"),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Playlist:
     """A YouTube playlist containing metadata and its associated videos.
     
@@ -79,13 +87,17 @@ class Playlist:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Playlist":
-        """Reconstruct a Video from a YAML dictionary.
+        """Reconstruct a Playlist from a YAML dictionary.
         
         Fills missing fields with empty strings to prevent NoneType crashes later.
+        Video order in the list is authoritative: each video's position is its
+        index, so stale `position` values left in hand-edited YAML are ignored.
         """
         videos = []
         if "videos" in data:
-            videos = [Video.from_dict(v, i) for i, v in enumerate(data["videos"])]
+            videos = [Video.from_dict(v) for v in data["videos"]]
+            for i, video in enumerate(videos):
+                video.position = i
         return cls(
             id=data["id"],
             title=data["title"],
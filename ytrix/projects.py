@@ -176,6 +176,7 @@ class ProjectManager:
     _states: dict[str, ProjectState] = field(default_factory=dict)
     _client: Any = field(default=None, repr=False)
     _credentials: Any = field(default=None, repr=False)
+    _http: Any = field(default=None, repr=False)  # Shared by every project's client
 
     def __post_init__(self) -> None:
         """Initialize state for all projects."""
@@ -624,21 +625,24 @@ class ProjectManager:
         """Get YouTube API client for current project.
 
         Uses rotating proxy if configured via WEBSHARE_* environment variables.
-        Caches client until project changes.
+        Caches client until project changes; the HTTP transport is reused.
         """
         if self._client is not None:
             return self._client
 
         import google_auth_httplib2
-        from googleapiclient.discovery import build
+
+        from ytrix.api import build_youtube
 
         creds = self.get_credentials()
 
-        # Create proxied HTTP transport
-        http = _create_proxied_http()
-        authed_http = google_auth_httplib2.AuthorizedHttp(creds, http=http)
+        # One proxied transport for the whole run: its open TLS connections are
+        # kept when quota rotation switches projects, only the credentials change
+        if self._http is None:
+            self._http = _create_proxied_http()
+        authed_http = google_auth_httplib2.AuthorizedHttp(creds, http=self._http)
 
-        self._client = build("youtube", "v3", http=authed_http)
+        self._client = build_youtube(http=authed_http)
         return self._client
 
     def status_summary(self) -> list[dict[str, str | int | bool]]:
@@ -1,5 +1,11 @@
 """YAML serialization and diff operations."""
 
+import bisect
+import hashlib
+import json
+import operator
+import time
+from collections.abc import Collection, Iterable
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
@@ -7,8 +13,16 @@ from typing import Any
 
 import yaml  # type: ignore[import-untyped]
 
+from ytrix.config import get_config_dir
 from ytrix.models import Playlist
 
+# Playlist metadata fields compared by the diff functions, fetched in one call
+_META_FIELDS = ("title", "description", "privacy")
+_META_GET = operator.attrgetter(*_META_FIELDS)
+
+# How long (seconds) an exported playlist is trusted to still match YouTube
+EXPORT_INDEX_TTL = 24 * 60 * 60
+
 
 def playlists_to_yaml(playlists: list[Playlist], include_videos: bool = True) -> str:
     """Serialize playlists to YAML string."""
@@ -25,10 +39,28 @@ def yaml_to_playlists(yaml_content: str) -> list[Playlist]:
     return [Playlist.from_dict(p) for p in data["playlists"]]
 
 
-def save_yaml(path: Path | str, playlists: list[Playlist], include_videos: bool = True) -> None:
-    """Save playlists to YAML file."""
-    content = playlists_to_yaml(playlists, include_videos)
-    Path(path).write_text(content, encoding="utf-8")
+def save_yaml(path: Path | str, playlists: Iterable[Playlist], include_videos: bool = True) -> None:
+    """Save playlists to YAML file, one playlist at a time.
+
+    Each playlist is dumped as a list item under the `playlists:` key as soon as
+    the iterable yields it, so a generator can drop its videos afterwards. The
+    file matches playlists_to_yaml() byte for byte.
+    """
+    with Path(path).open("w", encoding="utf-8") as f:
+        empty = True
+        for playlist in playlists:
+            if empty:
+                f.write("playlists:\n")
+                empty = False
+            yaml.dump(
+                [playlist.to_dict(include_videos=include_videos)],
+                f,
+                default_flow_style=False,
+                allow_unicode=True,
+                sort_keys=False,
+            )
+        if empty:
+            f.write("playlists: []\n")
 
 
 def load_yaml(path: Path | str) -> list[Playlist]:
@@ -37,23 +69,78 @@ def load_yaml(path: Path | str) -> list[Playlist]:
     return yaml_to_playlists(content)
 
 
+def playlist_fingerprint(playlist: Playlist) -> str:
+    """Hash of everything diff_playlists() compares: metadata and video order."""
+    data = [playlist.id, *_META_GET(playlist), [v.id for v in playlist.videos]]
+    encoded = json.dumps(data, ensure_ascii=False).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def _export_index_path() -> Path:
+    """Path to the fingerprints of recently exported playlists."""
+    return get_config_dir() / "yaml_exports.json"
+
+
+def _read_export_index() -> dict[str, dict[str, Any]]:
+    """Raw export index, or {} if it is missing or unreadable."""
+    try:
+        data = json.loads(_export_index_path().read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def load_export_index() -> dict[str, str]:
+    """Fingerprints of playlists known to match YouTube, by playlist ID.
+
+    Entries older than EXPORT_INDEX_TTL are ignored, since the playlist may
+    have been edited on YouTube since.
+    """
+    cutoff = time.time() - EXPORT_INDEX_TTL
+    return {
+        playlist_id: entry["fingerprint"]
+        for playlist_id, entry in _read_export_index().items()
+        if isinstance(entry, dict) and entry.get("ts", 0) >= cutoff and "fingerprint" in entry
+    }
+
+
+def record_exports(fingerprints: dict[str, str], forget: Collection[str] = ()) -> None:
+    """Add playlist fingerprints to the export index, stamped with the current time.
+
+    Entries for the IDs in forget are dropped, for playlists whose live state
+    is no longer known to match any fingerprint.
+    """
+    if not fingerprints and not forget:
+        return
+    now = time.time()
+    index = _read_export_index()
+    for playlist_id in forget:
+        index.pop(playlist_id, None)
+    index.update({pid: {"fingerprint": fp, "ts": now} for pid, fp in fingerprints.items()})
+    path = _export_index_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(index))
+
+
 def diff_playlists(old: Playlist, new: Playlist) -> dict[str, Any]:
     """Compare two playlist states and return changes."""
     changes: dict[str, Any] = {}
 
-    if old.title != new.title:
-        changes["title"] = {"old": old.title, "new": new.title}
-    if old.description != new.description:
-        changes["description"] = {"old": old.description, "new": new.description}
-    if old.privacy != new.privacy:
-        changes["privacy"] = {"old": old.privacy, "new": new.privacy}
+    for name, old_val, new_val in zip(_META_FIELDS, _META_GET(old), _META_GET(new), strict=True):
+        if old_val != new_val:
+            changes[name] = {"old": old_val, "new": new_val}
 
-    # Video changes
+    # Video changes: set membership keeps this O(n+m); lists preserve playlist order
     old_ids = [v.id for v in old.videos]
     new_ids = [v.id for v in new.videos]
+    if old_ids == new_ids:
+        return changes
+
+    old_set = frozenset(old_ids)
+    new_set = frozenset(new_ids)
 
-    removed = [vid for vid in old_ids if vid not in new_ids]
-    added = [vid for vid in new_ids if vid not in old_ids]
+    removed = [vid for vid in old_ids if vid not in new_set]
+    added = [vid for vid in new_ids if vid not in old_set]
     reordered = old_ids != new_ids and not (removed or added)
 
     if removed:
@@ -114,31 +201,30 @@ class PlaylistDiff:
         - playlistItems.delete: 50 units each
         - playlistItems.update (move): 50 units each
         """
-        quota = 0
-        if self.update_metadata:
-            quota += 51  # 1 list + 50 update
-        quota += len(self.videos_to_add) * 50
-        quota += len(self.videos_to_remove) * 50
-        quota += len(self.videos_to_move) * 50
-        return quota
+        # Every operation costs 50; a metadata update also needs 1 list call
+        return self.operation_count * 50 + (1 if self.update_metadata else 0)
 
     @property
     def operation_count(self) -> int:
         """Total number of API operations."""
-        count = 0
-        if self.update_metadata:
-            count += 1
-        count += len(self.videos_to_add)
-        count += len(self.videos_to_remove)
-        count += len(self.videos_to_move)
-        return count
+        return (
+            bool(self.update_metadata)
+            + len(self.videos_to_add)
+            + len(self.videos_to_remove)
+            + len(self.videos_to_move)
+        )
 
 
 def _longest_common_subsequence(seq1: list[str], seq2: list[str]) -> list[str]:
     """Find longest common subsequence of two lists.
 
     Used to determine which videos are already in correct relative order.
+    Uses the O(n log n) permutation path when both lists hold the same unique
+    IDs, and the O(m*n) dynamic program otherwise (e.g. duplicate videos).
     """
+    if len(seq1) == len(seq2) == len(set(seq1)) and set(seq1) == set(seq2):
+        return _lcs_of_permutations(seq1, seq2)
+
     m, n = len(seq1), len(seq2)
     dp = [[0] * (n + 1) for _ in range(m + 1)]
 
@@ -165,6 +251,36 @@ def _longest_common_subsequence(seq1: list[str], seq2: list[str]) -> list[str]:
     return lcs[::-1]
 
 
+def _lcs_of_permutations(seq1: list[str], seq2: list[str]) -> list[str]:
+    """LCS of two permutations of the same unique IDs.
+
+    Maps seq1 to target indices in seq2 and takes the longest increasing
+    subsequence of those indices (patience sorting with bisect).
+    """
+    target = {vid: i for i, vid in enumerate(seq2)}
+    ranks = [target[vid] for vid in seq1]
+
+    tails: list[int] = []  # tails[k]: smallest tail rank of an increasing run of length k+1
+    tail_idx: list[int] = []  # index in ranks of each tails entry
+    prev = [-1] * len(ranks)
+    for i, rank in enumerate(ranks):
+        k = bisect.bisect_left(tails, rank)
+        if k == len(tails):
+            tails.append(rank)
+            tail_idx.append(i)
+        else:
+            tails[k] = rank
+            tail_idx[k] = i
+        prev[i] = tail_idx[k - 1] if k else -1
+
+    lcs: list[str] = []
+    i = tail_idx[-1] if tail_idx else -1
+    while i >= 0:
+        lcs.append(seq1[i])
+        i = prev[i]
+    return lcs[::-1]
+
+
 def calculate_diff(current: Playlist, desired: Playlist) -> PlaylistDiff:
     """Calculate minimal operations to transform current playlist to desired state.
 
@@ -180,32 +296,38 @@ def calculate_diff(current: Playlist, desired: Playlist) -> PlaylistDiff:
     diff = PlaylistDiff(playlist_id=current.id)
 
     # 1. Metadata changes
-    if current.title != desired.title:
-        diff.update_metadata["title"] = desired.title
-    if current.description != desired.description:
-        diff.update_metadata["description"] = desired.description
-    if current.privacy != desired.privacy:
-        diff.update_metadata["privacy"] = desired.privacy
+    for name, cur_val, des_val in zip(
+        _META_FIELDS, _META_GET(current), _META_GET(desired), strict=True
+    ):
+        if cur_val != des_val:
+            diff.update_metadata[name] = des_val
 
     # 2. Video changes
     current_ids = [v.id for v in current.videos]
     desired_ids = [v.id for v in desired.videos]
+    if current_ids == desired_ids:
+        return diff
+
     current_set = set(current_ids)
     desired_set = set(desired_ids)
 
-    # Videos to remove (in current but not in desired)
-    diff.videos_to_remove = [vid for vid in current_ids if vid not in desired_set]
-
-    # Videos to add (in desired but not in current)
-    # Store with their target positions
+    # One pass per side: split each list into kept videos and removes/adds.
+    # remaining_* is the order after removes and before adds.
+    remaining_current: list[str] = []
+    remaining_desired: list[str] = []
+    for vid in current_ids:
+        if vid in desired_set:
+            remaining_current.append(vid)
+        else:
+            diff.videos_to_remove.append(vid)
+    # Adds are stored with their target positions
     for pos, vid in enumerate(desired_ids):
-        if vid not in current_set:
+        if vid in current_set:
+            remaining_desired.append(vid)
+        else:
             diff.videos_to_add.append((vid, pos))
 
     # 3. Calculate moves for remaining videos using LCS
-    # After removes and before adds, find optimal ordering
-    remaining_current = [vid for vid in current_ids if vid in desired_set]
-    remaining_desired = [vid for vid in desired_ids if vid in current_set]
 
     if remaining_current != remaining_desired:
         # Find LCS - videos in this subsequence don't need to move